@@ -3,14 +3,13 @@ Main application file for the Delivery Management App.
 Initializes the main window and handles navigation between views.
 """
 
+import importlib
 import customtkinter as ctk
 from tkinter import messagebox
 
 from controller import AppController
-from views.dashboard_frame import DashboardFrame
-from views.create_delivery_frame import CreateDeliveryFrame
-from views.view_deliveries_frame import ViewDeliveriesFrame
-from views.invoice_frame import InvoiceFrame
+from views.export_dialog import ExportDialog
+from views.debug_panel import DebugPanel
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("modern-theme.json")
@@ -22,6 +21,20 @@ class DeliveryApp(ctk.CTk):
     Handles navigation, view management, and reminders
     """
 
+    # How often due/overdue deliveries are re-checked while the app is open
+    REMINDER_POLL_MS = 60 * 1000
+
+    # Frame name -> module defining it. Modules are imported, and frames
+    # built, on first navigation, so matplotlib/numpy (dashboard) and
+    # tkcalendar (create delivery) are not loaded before the window shows.
+    VIEWS = {
+        "DashboardFrame": "views.dashboard_frame",
+        "CreateDeliveryFrame": "views.create_delivery_frame",
+        "ViewDeliveriesFrame": "views.view_deliveries_frame",
+        "InvoiceFrame": "views.invoice_frame",
+        "ActivityFrame": "views.activity_frame",
+    }
+
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
@@ -35,7 +48,7 @@ class DeliveryApp(ctk.CTk):
         # Sidebar setup
         self.sidebar = ctk.CTkFrame(self, width=200, corner_radius=0)
         self.sidebar.grid(row=0, column=0, sticky="ns")
-        self.sidebar.grid_rowconfigure(5, weight=1)
+        self.sidebar.grid_rowconfigure(8, weight=1)
 
         self.logo_label = ctk.CTkLabel(
             self.sidebar,
@@ -44,35 +57,49 @@ class DeliveryApp(ctk.CTk):
         )
         self.logo_label.grid(row=0, column=0, pady=(20, 10), padx=20)
 
+        # Commands look the handler up when clicked, so wrappers installed
+        # after the buttons are built (see profiling.py) are called
         self.btn_dashboard = ctk.CTkButton(
             self.sidebar, text="🏠 Dashboard",
-            command=self.show_dashboard_view
+            command=lambda: self.show_dashboard_view()
         )
         self.btn_dashboard.grid(row=1, column=0, sticky="ew", padx=20, pady=10)
 
         self.btn_create_delivery = ctk.CTkButton(
             self.sidebar, text="➕ Create Delivery",
-            command=self.show_create_delivery_view
+            command=lambda: self.show_create_delivery_view()
         )
         self.btn_create_delivery.grid(row=2, column=0, sticky="ew", padx=20, pady=10)
 
         self.btn_view_deliveries = ctk.CTkButton(
             self.sidebar, text="🚚 Deliveries",
-            command=self.show_view_deliveries_view
+            command=lambda: self.show_view_deliveries_view()
         )
         self.btn_view_deliveries.grid(row=3, column=0, sticky="ew", padx=20, pady=10)
 
         self.btn_view_invoices = ctk.CTkButton(
             self.sidebar, text="💸 Invoice",
-            command=self.show_invoices_view
+            command=lambda: self.show_invoices_view()
         )
         self.btn_view_invoices.grid(row=4, column=0, sticky="ew", padx=20, pady=10)
 
+        self.btn_activity = ctk.CTkButton(
+            self.sidebar, text="📜 Activity",
+            command=lambda: self.show_activity_view()
+        )
+        self.btn_activity.grid(row=5, column=0, sticky="ew", padx=20, pady=10)
+
         self.btn_reminders = ctk.CTkButton(
             self.sidebar, text="🔔 Reminders",
-            command=self.check_reminders
+            command=lambda: self.check_reminders()
         )
-        self.btn_reminders.grid(row=5, column=0, sticky="ew", padx=20, pady=10)
+        self.btn_reminders.grid(row=6, column=0, sticky="ew", padx=20, pady=10)
+
+        self.btn_export = ctk.CTkButton(
+            self.sidebar, text="📤 Export CSV",
+            command=lambda: self.show_export_dialog()
+        )
+        self.btn_export.grid(row=7, column=0, sticky="ew", padx=20, pady=10)
 
         # Main content area for views
         self.main_frame = ctk.CTkFrame(self)
@@ -80,32 +107,59 @@ class DeliveryApp(ctk.CTk):
         self.main_frame.grid_rowconfigure(0, weight=1)
         self.main_frame.grid_columnconfigure(0, weight=1)
 
-        # Dictionary to store view instances
+        # View instances, created on first use by get_frame()
         self.frames = {}
 
-        # Instantiate and store each view frame
-        for F in (
-            DashboardFrame,
-            CreateDeliveryFrame,
-            ViewDeliveriesFrame,
-            InvoiceFrame
-        ):
-            frame_name = F.__name__
-            frame = F(master=self.main_frame, controller=self.controller)
-            self.frames[frame_name] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
-
-        self.show_dashboard_view()
+        # Build the first view once the window has been painted
+        self.initial_view_pending = True
+        self.bind("<Map>", self.on_first_map, add="+")
         self.after(2000, self.check_reminders)
+        self.after(self.REMINDER_POLL_MS, self.poll_reminders)
+
+        # Hidden shortcut for the query tracing panel
+        self.bind_all("<Control-Shift-D>", lambda event: self.show_debug_panel())
 
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def on_first_map(self, event):
+        """
+        Schedule the initial view when the main window is first mapped.
+        Map events of child widgets and later ones (e.g. restoring the
+        window) are ignored.
+        """
+        if event.widget is not self or not self.initial_view_pending:
+            return
+        self.initial_view_pending = False
+        self.after_idle(self.show_initial_view)
+
+    def show_initial_view(self):
+        """
+        Show the dashboard once the mapped window has been painted, so the
+        heavy dashboard imports do not delay the first paint.
+        """
+        self.update_idletasks()
+        self.show_dashboard_view()
+
+    def get_frame(self, frame_name):
+        """
+        Return the named view frame, importing its module and building it
+        the first time it is needed.
+        """
+        frame = self.frames.get(frame_name)
+        if frame is None:
+            module = importlib.import_module(self.VIEWS[frame_name])
+            frame_class = getattr(module, frame_name)
+            frame = frame_class(master=self.main_frame, controller=self.controller)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[frame_name] = frame
+        return frame
+
     def show_frame(self, frame_name):
         """
-        Bring the specified frame to the front.
+        Bring the specified frame to the front, building it on first use.
         Refresh data if the frame supports it.
         """
-        frame = self.frames[frame_name]
+        frame = self.get_frame(frame_name)
         if hasattr(frame, "refresh_data"):
             frame.refresh_data()
         frame.tkraise()
@@ -126,12 +180,34 @@ class DeliveryApp(ctk.CTk):
         """Show the invoices view."""
         self.show_frame("InvoiceFrame")
 
+    def show_activity_view(self):
+        """Show the activity feed view."""
+        self.show_frame("ActivityFrame")
+
     def check_reminders(self):
         """Check for reminders and display them as a warning if any exist."""
         messages = self.controller.get_reminders()
         if messages:
             messagebox.showwarning("Reminders", messages)
 
+    def poll_reminders(self):
+        """
+        Periodically show reminders when deliveries become due soon or overdue.
+        """
+        messages = self.controller.poll_reminders()
+        if messages:
+            messagebox.showwarning("Reminders", messages)
+        self.after(self.REMINDER_POLL_MS, self.poll_reminders)
+
+    def show_export_dialog(self):
+        """Open the CSV export dialog."""
+        ExportDialog(self, self.controller)
+
+    def show_debug_panel(self):
+        """Open the query tracing panel, enabling instrumentation if needed."""
+        DebugPanel(self, self.controller)
+
     def on_closing(self):
         """Handle cleanup and close the application."""
+        self.controller.close()
         self.destroy()
@@ -0,0 +1,5 @@
+"""
+Headless performance benchmarks for the Delivery Management App.
+Builds synthetic databases and times the AppController entry points
+against them without starting the GUI.
+"""
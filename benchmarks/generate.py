@@ -0,0 +1,144 @@
+"""
+Synthetic data generator for the Delivery Management App benchmarks.
+Builds a SQLite database with N clients and M deliveries (one invoice per
+delivery), with realistic deadline, completion and payment distributions.
+Run as a script to build a single database:
+
+    python -m benchmarks.generate bench.db --deliveries 100000 [--seed 42]
+"""
+
+import argparse
+import datetime
+import itertools
+import os
+import random
+import time
+
+from db.database import Database
+
+VERBS = ["Deliver", "Design", "Translate", "Review", "Write", "Edit", "Print", "Ship"]
+ITEMS = [
+    "logo", "brochure", "website", "report", "catalog", "invoice template",
+    "newsletter", "poster", "manual", "presentation", "banner", "flyer",
+]
+
+# Deadlines range from a year ago to two months ahead
+PAST_DAYS = 365
+FUTURE_DAYS = 60
+# Share of deliveries completed, for past and upcoming deadlines
+COMPLETED_PAST = 0.85
+COMPLETED_UPCOMING = 0.10
+# Share of invoices paid, for completed and pending deliveries
+PAID_COMPLETED = 0.80
+PAID_PENDING = 0.05
+
+CHUNK_SIZE = 50000
+
+
+def iter_deliveries(count, clients, seed=42, today=None):
+    """
+    Generate synthetic delivery rows.
+    Fees are log-normal around $90, deadlines uniform over the last year and
+    the next two months, and most past deliveries are completed within a few
+    days of their deadline.
+    :param count: Number of deliveries.
+    :param clients: Number of clients; client ids are 1..clients.
+    :param seed: Random seed, so the same arguments give the same data.
+    :param today: Reference date (defaults to datetime.date.today()).
+    :return: Iterator of (client_id, description, fee, deadline, completed,
+             completed_date, invoice_date, paid) tuples.
+    """
+    rng = random.Random(seed)
+    today = today or datetime.date.today()
+    ordinal = today.toordinal()
+    for i in range(count):
+        deadline = ordinal + rng.randint(-PAST_DAYS, FUTURE_DAYS)
+        completed = rng.random() < (
+            COMPLETED_PAST if deadline < ordinal else COMPLETED_UPCOMING
+        )
+        completed_date = None
+        if completed:
+            completed_date = datetime.date.fromordinal(
+                min(deadline + rng.randint(-5, 3), ordinal)
+            ).isoformat()
+        paid = rng.random() < (PAID_COMPLETED if completed else PAID_PENDING)
+        yield (
+            rng.randint(1, clients),
+            f"{rng.choice(VERBS)} {rng.choice(ITEMS)} #{i + 1}",
+            round(rng.lognormvariate(4.5, 0.6), 2),
+            datetime.date.fromordinal(deadline).isoformat(),
+            int(completed),
+            completed_date,
+            datetime.date.fromordinal(deadline - rng.randint(7, 30)).isoformat(),
+            int(paid),
+        )
+
+
+def build_database(path, deliveries, clients=None, seed=42, today=None):
+    """
+    Create a fresh benchmark database at path.
+    Rows go through the normal schema, so indexes, full-text search and
+    rollups are maintained exactly as in the app.
+    :param path: Database file to create (replaced if it exists).
+    :param deliveries: Number of deliveries (and invoices).
+    :param clients: Number of clients (defaults to one per 20 deliveries).
+    :param seed: Random seed.
+    :param today: Reference date for the deadline distribution.
+    :return: Seconds spent building the database.
+    """
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    clients = clients or max(10, deliveries // 20)
+    start = time.perf_counter()
+
+    db = Database(path)
+    with db.transaction():
+        db.insert_clients(f"Client {i + 1}" for i in range(clients))
+        cursor = db.conn.cursor()
+        rows = iter_deliveries(deliveries, clients, seed, today)
+        # The table is empty, so delivery ids are assigned 1, 2, 3, ...
+        delivery_id = 0
+        while True:
+            chunk = list(itertools.islice(rows, CHUNK_SIZE))
+            if not chunk:
+                break
+            cursor.executemany("""
+                INSERT INTO deliveries
+                    (client_id, description, fee, deadline, completed, completed_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (row[:6] for row in chunk))
+            cursor.executemany("""
+                INSERT INTO invoices (delivery_id, amount, date, paid)
+                VALUES (?, ?, ?, ?)
+            """, (
+                (delivery_id + i + 1, row[2], row[6], row[7])
+                for i, row in enumerate(chunk)
+            ))
+            delivery_id += len(chunk)
+        cursor.execute("""
+            INSERT INTO delivery_history (delivery_id, action, timestamp)
+            SELECT id, 'Completed', completed_date || ' 12:00:00'
+            FROM deliveries WHERE completed = 1
+        """)
+    db.conn.execute("ANALYZE")
+    db.close()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Command-line entry point: build one benchmark database.
+    """
+    parser = argparse.ArgumentParser(description="Build a synthetic benchmark database.")
+    parser.add_argument("db_file", help="Path of the database file to create")
+    parser.add_argument("--deliveries", type=int, default=10000)
+    parser.add_argument("--clients", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    seconds = build_database(args.db_file, args.deliveries, args.clients, args.seed)
+    print(f"Built {args.db_file} with {args.deliveries} deliveries in {seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Benchmark runner for the Delivery Management App.
+Times every AppController read entry point against synthetic databases
+of increasing size and writes the results as JSON, so runs can be
+compared over time:
+
+    python -m benchmarks.run [--sizes 10000 100000 1000000] [--output results.json]
+    python -m benchmarks.run --compare baseline.json --output results.json
+
+Databases are built once in --data-dir and reused by later runs.
+Each entry point is timed cold (query cache cleared before every call)
+and warm (served from the cache), and its peak Python memory use is
+measured with tracemalloc on one more cold call. The model loading
+calls in memory_entry_points() are only measured for memory.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import time
+import tracemalloc
+
+from benchmarks.generate import build_database
+from controller import AppController
+
+DEFAULT_SIZES = [10000, 100000, 1000000]
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def entry_points():
+    """
+    The controller calls to time, by name.
+    :return: Dictionary {name: callable taking an AppController}.
+    """
+    today = datetime.date.today()
+    return {
+        "get_all_deliveries_for_view": lambda c: c.get_all_deliveries_for_view(),
+        "get_invoices_for_view": lambda c: c.get_invoices_for_view(),
+        "filter_deliveries": lambda c: c.filter_deliveries("logo"),
+        "filter_deliveries_prefix": lambda c: c.filter_deliveries("deliv pos"),
+        "get_dashboard_stats": lambda c: c.get_dashboard_stats(),
+        "get_earnings_over_time": lambda c: c.get_earnings_over_time(),
+        "get_daily_activity_for_current_month":
+            lambda c: c.get_daily_activity_for_current_month(),
+        "get_reminders": lambda c: c.get_reminders(),
+        "get_deliveries_page": lambda c: c.get_deliveries_page(None, 50),
+        "get_invoices_page": lambda c: c.get_invoices_page(None, 50),
+        "get_activity_page": lambda c: c.get_activity_page(None, 50),
+        "get_activity_page_completed":
+            lambda c: c.get_activity_page(None, 50, action="Completed"),
+        "count_deliveries": lambda c: c.count_deliveries(),
+        "get_analytics": lambda c: c.get_analytics(today.replace(day=1), today),
+    }
+
+
+def memory_entry_points():
+    """
+    Full-table model loads measured for memory only: every delivery as a
+    Delivery object against a two-column projection.
+    :return: Dictionary {name: callable taking an AppController}.
+    """
+    return {
+        "load_all_deliveries": lambda c: c.db.get_all_deliveries(),
+        "load_delivery_columns":
+            lambda c: c.db.get_delivery_columns(("completed_date", "fee")),
+    }
+
+
+def result_size(result):
+    """Number of rows in a result, or None for scalar results."""
+    if isinstance(result, tuple) and result and isinstance(result[0], (list, tuple)):
+        return len(result[0])
+    if isinstance(result, (list, tuple, dict)):
+        return len(result)
+    return None
+
+
+def summarize(samples):
+    """
+    Summarize timings in milliseconds.
+    :param samples: List of durations in seconds.
+    :return: Dictionary with min, median, mean and max in ms.
+    """
+    ms = [sample * 1000 for sample in samples]
+    return {
+        "min": round(min(ms), 3),
+        "median": round(statistics.median(ms), 3),
+        "mean": round(statistics.fmean(ms), 3),
+        "max": round(max(ms), 3),
+    }
+
+
+def time_call(fn, controller, repeat, cold):
+    """
+    Time repeated calls of fn(controller).
+    :param cold: Clear the query cache before every call.
+    :return: Tuple (list of durations in seconds, last result).
+    """
+    samples = []
+    result = None
+    for _ in range(repeat):
+        if cold:
+            controller.cache.clear()
+        start = time.perf_counter()
+        result = fn(controller)
+        samples.append(time.perf_counter() - start)
+    return samples, result
+
+
+def peak_memory(fn, controller):
+    """
+    Measure the peak Python memory allocated during one cold call of
+    fn(controller), result included.
+    :return: Tuple (peak in KiB, result).
+    """
+    controller.cache.clear()
+    tracemalloc.start()
+    try:
+        result = fn(controller)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1), result
+
+
+def database_path(data_dir, size):
+    """Path of the benchmark database with `size` deliveries."""
+    return os.path.join(data_dir, f"bench_{size}.db")
+
+
+def ensure_database(data_dir, size, rebuild=False):
+    """
+    Build the benchmark database for `size` deliveries unless a matching
+    one already exists.
+    :return: Seconds spent building, or None if an existing file was reused.
+    """
+    path = database_path(data_dir, size)
+    if not rebuild and os.path.exists(path):
+        conn = sqlite3.connect(path)
+        try:
+            count = conn.execute("SELECT COUNT(*) FROM deliveries").fetchone()[0]
+        finally:
+            conn.close()
+        if count == size:
+            return None
+    os.makedirs(data_dir, exist_ok=True)
+    return build_database(path, size)
+
+
+def run_size(data_dir, size, names, repeat, rebuild=False, memory_names=()):
+    """
+    Build (or reuse) the database for `size`, time every entry point and
+    measure its peak memory.
+    :param memory_names: Names from memory_entry_points() to measure as well.
+    :return: Dictionary of results for this size.
+    """
+    build_seconds = ensure_database(data_dir, size, rebuild)
+    path = database_path(data_dir, size)
+
+    start = time.perf_counter()
+    controller = AppController(path)
+    open_seconds = time.perf_counter() - start
+
+    calls = entry_points()
+    memory_calls = memory_entry_points()
+    results = {}
+    memory = {}
+    try:
+        for name in names:
+            fn = calls[name]
+            cold, result = time_call(fn, controller, repeat, cold=True)
+            warm, _ = time_call(fn, controller, repeat, cold=False)
+            peak_kib, _ = peak_memory(fn, controller)
+            results[name] = {
+                "rows": result_size(result),
+                "cold_ms": summarize(cold),
+                "warm_ms": summarize(warm),
+                "peak_kib": peak_kib,
+            }
+            print(
+                f"  {name:<40} cold {results[name]['cold_ms']['median']:>10.2f} ms"
+                f"   warm {results[name]['warm_ms']['median']:>8.3f} ms"
+                f"   peak {peak_kib / 1024:>8.2f} MiB"
+            )
+        for name in memory_names:
+            peak_kib, result = peak_memory(memory_calls[name], controller)
+            memory[name] = {"rows": result_size(result), "peak_kib": peak_kib}
+            del result
+            print(f"  {name:<40} peak {peak_kib / 1024:>8.2f} MiB")
+    finally:
+        controller.close()
+
+    return {
+        "deliveries": size,
+        "build_seconds": round(build_seconds, 3) if build_seconds is not None else None,
+        "file_bytes": os.path.getsize(path),
+        "open_ms": round(open_seconds * 1000, 3),
+        "entries": results,
+        "memory": memory,
+    }
+
+
+def compare(current, baseline):
+    """
+    Print the cold median ratio current/baseline for every shared entry,
+    and the peak memory where both runs measured it.
+    """
+    for size, run in current["runs"].items():
+        base_run = baseline.get("runs", {}).get(size)
+        if not base_run:
+            continue
+        print(f"{size} deliveries (current / baseline, cold median):")
+        for name, entry in run["entries"].items():
+            base_entry = base_run["entries"].get(name)
+            if not base_entry:
+                continue
+            now, before = entry["cold_ms"]["median"], base_entry["cold_ms"]["median"]
+            ratio = now / before if before else float("inf")
+            line = f"  {name:<40} {before:>10.2f} -> {now:>10.2f} ms  x{ratio:.2f}"
+            if "peak_kib" in entry and "peak_kib" in base_entry:
+                line += (
+                    f"   {base_entry['peak_kib'] / 1024:.2f} -> "
+                    f"{entry['peak_kib'] / 1024:.2f} MiB"
+                )
+            print(line)
+
+
+def main():
+    """
+    Command-line entry point: run the benchmarks and write JSON results.
+    """
+    calls = entry_points()
+    memory_calls = memory_entry_points()
+    parser = argparse.ArgumentParser(description="Benchmark the AppController entry points.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Numbers of deliveries to benchmark")
+    parser.add_argument("--only", nargs="+", choices=sorted(calls),
+                        help="Entry points to run (default: all)")
+    parser.add_argument("--memory", nargs="*", choices=sorted(memory_calls),
+                        help="Model loads to measure for memory "
+                             "(default: all; pass no names to skip)")
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per measurement")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR,
+                        help="Directory for the generated databases")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Regenerate the databases even if they exist")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="JSON file to write the results to")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    report = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "runs": {},
+    }
+    for size in args.sizes:
+        print(f"{size} deliveries")
+        report["runs"][str(size)] = run_size(
+            args.data_dir, size, args.only or list(calls), args.repeat, args.rebuild,
+            list(memory_calls) if args.memory is None else args.memory
+        )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Query result cache for the Delivery Management App.
+Caches controller results keyed by method and arguments, and drops
+everything whenever the data version changes.
+"""
+
+import functools
+import threading
+from collections import OrderedDict
+
+
+class QueryCache:
+    """
+    LRU cache of query results tagged with the data version they were computed at.
+    A lookup with a different version clears the whole cache first, since any
+    write can affect any result.
+    """
+
+    def __init__(self, max_entries=128):
+        """
+        Initialize an empty cache.
+        :param max_entries: Maximum number of cached results before LRU eviction.
+        """
+        self.max_entries = max_entries
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, version, compute):
+        """
+        Return the cached result for key, computing and storing it on a miss.
+        :param key: Hashable cache key.
+        :param version: Current data version; a change clears the cache.
+        :param compute: Zero-argument callable producing the result.
+        """
+        with self._lock:
+            if version != self.version:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.version = version
+            elif key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = compute()
+
+        with self._lock:
+            # Only store results that are still current
+            if version == self.version:
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return result
+
+    def clear(self):
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Return the cache counters.
+        :return: Dictionary with hits, misses, hit rate, evictions, invalidations and size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
+
+
+def cached(method):
+    """
+    Decorator for AppController read methods: serve results from self.cache,
+    keyed by method name and arguments, for the current data version.
+    Every hit returns the same object to every caller, so results must be
+    treated as read-only: cached methods return rows as tuples, and callers
+    that need to modify a result (or a row dictionary in it) must copy it.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return self.cache.get_or_compute(
+            key, self.get_data_version(), lambda: method(self, *args, **kwargs)
+        )
+    return wrapper
+
+
+def invalidates(method):
+    """
+    Decorator for AppController write methods: bump the data version after the
+    write, whether or not it succeeded, so no stale result is served.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.data_version += 1
+    return wrapper
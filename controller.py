@@ -3,11 +3,18 @@ Controller for the Delivery Management App.
 Handles business logic and communication between the database and the views.
 """
 
+import calendar
 import datetime
-from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from cache import QueryCache, cached, invalidates
+from db.activity import DEFAULT_RETENTION_DAYS, compact_history
+from db.archive import archive_deliveries
 from db.database import Database
+from db.exporter import ExportJob
+from db.importer import import_deliveries
 from models.delivery import Delivery
 from models.client import Client
+from reminders import ReminderEngine
 
 
 class AppController:
@@ -15,201 +22,499 @@ class AppController:
     Controller class for the Delivery Management App.
     """
 
-    def __init__(self, db_file):
+    def __init__(self, db_file, archive_file=None):
         """
         Initialize the controller with a database connection.
+        :param db_file: Path to the SQLite database file.
+        :param archive_file: Optional archive database to attach (see db.archive).
         """
-        self.db = Database(db_file)
+        self.db = Database(db_file, archive_file=archive_file)
+        # Bumped by every write path; see get_data_version()
+        self.data_version = 0
+        self.cache = QueryCache()
+        self.reminders = ReminderEngine()
+        self.reminders.load(self.db.get_pending_deadlines())
+        # Worker threads for view data loading; each uses a pooled reader connection
+        self.executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="data-loader"
+        )
+        # Set by enable_instrumentation()
+        self.instrumentation = None
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Run a read-only function on a worker thread and return its Future.
+        Database reads made by fn go through a pooled read-only connection.
+        In-memory databases cannot be shared across threads, so fn then runs
+        immediately on the calling thread.
+        """
+        if self.db.reader_pool is None:
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        def task():
+            with self.db.reader():
+                return fn(*args, **kwargs)
+        return self.executor.submit(task)
+
+    def enable_instrumentation(self):
+        """
+        Start recording query traces and per-method latencies.
+        Returns the Instrumentation collecting them; calling again returns
+        the same one.
+        """
+        if self.instrumentation is None:
+            from instrumentation import Instrumentation
+            self.instrumentation = Instrumentation().install(self)
+        return self.instrumentation
+
+    def close(self):
+        """
+        Stop the worker threads and close the database.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.db.close()
+
+    def get_data_version(self):
+        """
+        Return a token that changes whenever the data may have changed:
+        the controller's own write counter plus SQLite's data_version,
+        which detects commits made by other connections or processes.
+        """
+        return (self.data_version, self.db.get_data_version())
+
+    def get_cache_stats(self):
+        """
+        Get the query cache counters (hits, misses, hit rate, evictions, size).
+        """
+        return self.cache.stats()
 
+    @invalidates
     def create_delivery_with_invoice(self, client_name, description, fee, deadline):
         """
         Create a new delivery and its associated invoice.
         If the client does not exist, create a new client.
+        All inserts are committed together in one transaction.
         """
-        client = self.db.get_client_by_name(client_name)
-        if not client:
-            new_client = Client(id=None, name=client_name)
-            client_id = self.db.insert_client(new_client)
-        else:
-            client_id = client.id
-
-        new_delivery = Delivery(
-            id=None,
-            client_id=client_id,
-            description=description,
-            completed=0,
-            fee=float(fee),
-            deadline=deadline,
-            completed_date=None
-        )
-        delivery_id = self.db.add_delivery(new_delivery)
+        with self.db.transaction():
+            client = self.db.get_client_by_name(client_name)
+            if not client:
+                new_client = Client(id=None, name=client_name)
+                client_id = self.db.insert_client(new_client)
+            else:
+                client_id = client.id
 
-        # create an invoice for the new delivery
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-        self.db.add_invoice(delivery_id, float(fee), today)
+            new_delivery = Delivery(
+                id=None,
+                client_id=client_id,
+                description=description,
+                completed=0,
+                fee=float(fee),
+                deadline=deadline,
+                completed_date=None
+            )
+            delivery_id = self.db.add_delivery(new_delivery)
+
+            # create an invoice for the new delivery
+            today = datetime.datetime.now().strftime("%Y-%m-%d")
+            self.db.add_invoice(delivery_id, float(fee), today)
+            self.db.add_delivery_history(delivery_id, "Created")
+        self.reminders.add(delivery_id, deadline)
         return delivery_id
 
+    @invalidates
+    def create_deliveries_with_invoices(self, batch):
+        """
+        Create many deliveries and their invoices in a single transaction.
+        Missing clients are created once per distinct name.
+        :param batch: Iterable of (client_name, description, fee, deadline) tuples.
+        :return: List of the new delivery IDs, in input order.
+        """
+        batch = [
+            (client_name, description, float(fee), deadline)
+            for client_name, description, fee, deadline in batch
+        ]
+        if not batch:
+            return []
+        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        with self.db.transaction():
+            names = {row[0] for row in batch}
+            client_ids = self.db.get_client_ids_by_names(names)
+            missing = [name for name in names if name not in client_ids]
+            if missing:
+                self.db.insert_clients(missing)
+                client_ids.update(self.db.get_client_ids_by_names(missing))
+            delivery_ids = self.db.add_deliveries_with_invoices(
+                (
+                    (client_ids[client_name], description, fee, deadline)
+                    for client_name, description, fee, deadline in batch
+                ),
+                today
+            )
+        for delivery_id, row in zip(delivery_ids, batch):
+            self.reminders.add(delivery_id, row[3])
+        return delivery_ids
+
+    @invalidates
+    def import_deliveries_from_file(self, path, chunk_size=5000, progress=None):
+        """
+        Bulk import deliveries from a CSV or JSONL file.
+        Rows are streamed from disk and committed in chunks.
+        Returns an ImportResult with counts, throughput and per-row errors.
+        """
+        result = import_deliveries(
+            self.db, path, chunk_size=chunk_size, progress=progress
+        )
+        # A bulk import may add any number of deadlines; reload them in one query
+        self.reminders.load(self.db.get_pending_deadlines())
+        return result
+
+    @invalidates
+    def archive_old_deliveries(self, months=12, batch_size=500, progress=None):
+        """
+        Move completed, fully paid deliveries older than `months` months, with
+        their invoices and history, into the attached archive database.
+        Returns an ArchiveResult with the number of rows moved.
+        """
+        return archive_deliveries(
+            self.db, months=months, batch_size=batch_size, progress=progress
+        )
+
+    def start_export(self, kind, path, start_date=None, end_date=None, status=None,
+                     include_archive=False):
+        """
+        Start a background CSV export of deliveries or invoices.
+        With include_archive, archived rows are exported too.
+        Returns the running ExportJob; poll it from the UI thread for progress.
+        """
+        return ExportJob(
+            self.db, kind, path, start_date, end_date, status, include_archive
+        ).start()
+
+    @invalidates
     def mark_delivery_as_completed(self, delivery_id):
         """
         Mark a delivery as completed in the database.
         """
-        self.db.mark_delivery_completed(delivery_id)
-        self.db.add_delivery_history(delivery_id, "Completed")
+        with self.db.transaction():
+            self.db.mark_delivery_completed(delivery_id)
+            self.db.add_delivery_history(delivery_id, "Completed")
+        self.reminders.remove(delivery_id)
     
+    @invalidates
     def mark_invoice_as_paid(self, invoice_id):
         """
         Mark an invoice as paid in the database.
         """
-        self.db.mark_invoice_as_paid(invoice_id)
+        with self.db.transaction():
+            self.db.mark_invoice_as_paid(invoice_id)
+            delivery_id = self.db.get_invoice_delivery_id(invoice_id)
+            if delivery_id is not None:
+                self.db.add_delivery_history(delivery_id, "Paid")
 
-    def filter_deliveries(self, query):
+    @cached
+    def filter_deliveries(self, query, limit=50):
         """
         Filter deliveries by description or client name.
-        Returns a list of deliveries matching the query.
+        Every word of the query is matched as a prefix against the full-text index.
+        Returns at most `limit` deliveries, best matches first; an empty query
+        returns the first `limit` deliveries by deadline.
         """
-        query = query.lower().strip()
+        query = query.strip()
         if not query:
-            return self.get_all_deliveries_for_view()
-        all_deliveries = self.db.get_all_deliveries()
-        filtered = []
-        for d in all_deliveries:
-            client = self.db.get_client_by_id(d.client_id)
-            if (query in d.description.lower()) or (client and query in client.name.lower()):
-                client_name = client.name if client else "Unknown"
-                filtered.append({"delivery": d, "client_name": client_name})
-        return filtered
+            return self.get_deliveries_page(None, limit)[0]
+        return tuple(
+            {"delivery": d, "client_name": client_name}
+            for d, client_name in self.db.search_deliveries(query, limit)
+        )
 
+    @cached
     def get_dashboard_stats(self):
         """
-        Get statistics for the dashboard: total, completed, pending deliveries, and earnings.
+        Get statistics for the dashboard: total, completed, pending deliveries, earnings,
+        unpaid invoices and outstanding amount, read from one precomputed summary row.
         """
+        summary = self.db.get_dashboard_summary()
         stats = {
-            "total": self.db.count_all_deliveries(),
-            "completed": self.db.count_completed(),
-            "pending": self.db.count_pending(),
-            "earnings": self.db.total_earnings()
+            "total": summary["total_deliveries"],
+            "completed": summary["completed_deliveries"],
+            "pending": summary["pending_deliveries"],
+            "earnings": summary["earnings"],
+            "unpaid": summary["unpaid_invoices"],
+            "outstanding": summary["outstanding_amount"]
         }
         return stats
 
+    @invalidates
+    def verify_dashboard_stats(self, rebuild=False):
+        """
+        Check the dashboard summary against the base tables.
+        Returns the drifted columns; pass rebuild=True to repair them.
+        """
+        return self.db.verify_dashboard_summary(rebuild)
+
+    @cached
     def get_all_deliveries_for_view(self):
         """
         Get all deliveries with their associated client names for display in the view.
         """
-        deliveries = self.db.get_all_deliveries()
-        data_for_view = []
-        for d in deliveries:
-            client = self.db.get_client_by_id(d.client_id)
-            client_name = client.name if client else "Unknown Client"
-            data_for_view.append({
-                "delivery": d,
-                "client_name": client_name
-            })
-        return data_for_view
+        return tuple(
+            {"delivery": d, "client_name": client_name}
+            for d, client_name in self.db.get_deliveries_with_client_names()
+        )
 
+    @cached
     def get_invoices_for_view(self):
         """
         Get all invoices with their associated client names and delivery descriptions for display.
         """
-        invoices = self.db.get_all_invoices()
-        data_for_view = []
-        for invoice in invoices:
-            # get the delivery associated with the invoice
-            delivery = self.db.get_delivery_by_id(invoice.delivery_id)
-            if delivery:
-                client = self.db.get_client_by_id(delivery.client_id)
-                client_name = client.name if client else "Unknown Client"
-                delivery_desc = delivery.description
-            else:
-                client_name = "N/A"
-                delivery_desc = "Delivery not found"
+        return tuple(
+            {
+                "invoice": invoice,
+                "client_name": client_name,
+                "delivery_desc": delivery_desc
+            }
+            for invoice, delivery_desc, client_name in self.db.get_invoices_with_details()
+        )
+
+    @cached
+    def get_deliveries_page(self, after=None, page_size=50):
+        """
+        Get one page of deliveries with client names, ordered by deadline.
+        Returns (rows, next_cursor); pass next_cursor back to fetch the following
+        page. next_cursor is None on the last page.
+        """
+        rows = self.db.get_deliveries_page(after, page_size)
+        data_for_view = tuple(
+            {"delivery": d, "client_name": client_name} for d, client_name in rows
+        )
+        next_cursor = None
+        if len(rows) == page_size:
+            last = rows[-1][0]
+            next_cursor = (last.deadline, last.id)
+        return data_for_view, next_cursor
+
+    @cached
+    def get_deliveries_window(self, start, page_size=50):
+        """
+        Get page_size deliveries starting at row number `start` in deadline
+        order, for jumping straight to any position of the list.
+        Returns (rows, next_cursor) like get_deliveries_page().
+        """
+        after = self.db.get_delivery_key_at(start - 1) if start > 0 else None
+        if start > 0 and after is None:
+            return (), None
+        return self.get_deliveries_page(after, page_size)
 
-            data_for_view.append({
+    @cached
+    def get_invoices_page(self, before=None, page_size=50):
+        """
+        Get one page of invoices with client names and delivery descriptions,
+        newest first. Returns (rows, next_cursor) like get_deliveries_page.
+        """
+        rows = self.db.get_invoices_page(before, page_size)
+        data_for_view = tuple(
+            {
                 "invoice": invoice,
                 "client_name": client_name,
                 "delivery_desc": delivery_desc
-            })
-        return data_for_view
+            }
+            for invoice, delivery_desc, client_name in rows
+        )
+        next_cursor = None
+        if len(rows) == page_size:
+            last = rows[-1][0]
+            next_cursor = (last.date, last.id)
+        return data_for_view, next_cursor
+
+    @cached
+    def get_delivery_history_page(self, delivery_id, before=None, page_size=50):
+        """
+        Get one page of a delivery's change history, newest first.
+        Returns (entries, next_cursor) where entries are (action, timestamp) tuples.
+        """
+        rows = self.db.get_delivery_history_page(delivery_id, before, page_size)
+        next_cursor = None
+        if len(rows) == page_size:
+            last_id, _, last_timestamp = rows[-1]
+            next_cursor = (last_timestamp, last_id)
+        return tuple((action, timestamp) for _, action, timestamp in rows), next_cursor
+
+    @cached
+    def get_activity_page(self, cursor=None, page_size=50, action=None,
+                          start_date=None, end_date=None):
+        """
+        Get one page of the activity feed of all deliveries, newest first.
+        Individual events come first; once they run out the feed continues
+        with the daily summaries of compacted history.
+        Returns (entries, next_cursor). Event entries are dictionaries with
+        'kind' == "event", 'delivery_id', 'action', 'timestamp', 'description'
+        and 'client_name'; summary entries have 'kind' == "summary", 'day',
+        'action' and 'events'.
+        """
+        kind, key = cursor or ("event", None)
+        entries = []
+        if kind == "event":
+            rows = self.db.get_activity_page(key, page_size, action, start_date, end_date)
+            entries = [
+                {
+                    "kind": "event",
+                    "delivery_id": delivery_id,
+                    "action": row_action,
+                    "timestamp": timestamp,
+                    "description": description,
+                    "client_name": client_name,
+                }
+                for _, delivery_id, row_action, timestamp, description, client_name in rows
+            ]
+            if len(rows) == page_size:
+                return tuple(entries), ("event", (rows[-1][3], rows[-1][0]))
+            key = None
+
+        limit = page_size - len(entries)
+        rows = self.db.get_activity_summary_page(key, limit, action, start_date, end_date)
+        entries += [
+            {"kind": "summary", "day": day, "action": row_action, "events": events}
+            for day, row_action, events in rows
+        ]
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = ("summary", (rows[-1][0], rows[-1][1]))
+        return tuple(entries), next_cursor
+
+    @invalidates
+    def compact_history(self, days=DEFAULT_RETENTION_DAYS, progress=None):
+        """
+        Roll history events older than `days` days up into daily summaries.
+        Returns a CompactionResult.
+        """
+        return compact_history(self.db, days, progress=progress)
+
+    @cached
+    def count_deliveries(self):
+        """
+        Get the number of deliveries in the deliveries view, read from the
+        precomputed summary row. Archived deliveries are not listed there,
+        so they are not counted.
+        """
+        return self.db.get_dashboard_summary(include_archive=False)["total_deliveries"]
+
+    @cached
+    def count_invoices(self):
+        """
+        Get the total number of invoices.
+        """
+        return self.db.count_invoices()
 
     def get_reminders(self):
         """
-        Get reminders for overdue deliveries and unpaid invoices.
+        Get reminders for overdue and soon-due deliveries and unpaid invoices.
         Returns a string with the reminder messages.
         """
-        today = datetime.date.today().strftime("%Y-%m-%d")
-        overdue = [
-            d for d in self.db.get_all_deliveries()
-            if not d.completed and d.deadline <= today
-        ]
-        unpaid = [i for i in self.db.get_all_invoices() if not i.paid]
+        self.reminders.advance()
+        counts = self.reminders.summary()
+        due_or_overdue = counts["overdue"] + counts["due_today"]
+        unpaid = self.db.get_dashboard_summary()["unpaid_invoices"]
         messages = []
-        if overdue:
-            messages.append(f"You have {len(overdue)} delivery(ies) due or overdue.")
+        if due_or_overdue:
+            messages.append(f"You have {due_or_overdue} delivery(ies) due or overdue.")
+        if counts["due_soon"]:
+            messages.append(f"You have {counts['due_soon']} delivery(ies) due soon.")
         if unpaid:
-            messages.append(f"You have {len(unpaid)} unpaid invoice(s).")
+            messages.append(f"You have {unpaid} unpaid invoice(s).")
 
         return "\n".join(messages)
 
+    def poll_reminders(self):
+        """
+        Advance the reminder engine to the current date.
+        Returns the reminder messages if any delivery became due soon or overdue
+        since the last poll, otherwise an empty string.
+        """
+        self.reminders.advance()
+        if not self.reminders.pop_new_notices():
+            return ""
+        return self.get_reminders()
+
+    @cached
     def get_earnings_over_time(self):
         """
         Get earnings grouped by month for completed deliveries.
-        Returns two lists: labels (months) and values (earnings).
+        Returns two tuples: labels (months) and values (earnings).
         """
-        earnings_by_month = defaultdict(float)
-
-        # get all completed deliveries with a completion date
-        completed_deliveries = [
-            d for d in self.db.get_all_deliveries()
-            if d.completed and d.completed_date
-        ]
-
-        for delivery in completed_deliveries:
-            # convert the completion date string to a date object
-            completion_date = datetime.datetime.strptime(
-                delivery.completed_date, "%Y-%m-%d"
-            ).date()
-            # create a key in the format "YYYY-MM"
-            month_key = completion_date.strftime("%Y-%m")
-            earnings_by_month[month_key] += delivery.fee
-
-        sorted_months = sorted(earnings_by_month.keys())
-        labels = sorted_months
-        values = [earnings_by_month[key] for key in sorted_months]
-
+        earnings_by_month = self.db.get_total_earnings_by_month()
+        labels = tuple(earnings_by_month.keys())
+        values = tuple(earnings_by_month.values())
         return labels, values
 
+    @cached
+    def get_daily_activity(self, start_date, end_date):
+        """
+        Get the number of completed deliveries per day between two dates (inclusive).
+        Returns a dictionary with datetime.date as key and count as value.
+        """
+        counts = self.db.get_daily_completions(
+            start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+        )
+        return {
+            datetime.date.fromisoformat(day): count for day, count in counts.items()
+        }
+
     def get_daily_activity_for_current_month(self):
         """
         Get the number of completed deliveries per day for the current month.
         Returns a dictionary with day as key and count as value.
         """
-        activity = defaultdict(int)
         today = datetime.date.today()
-        # get all completed deliveries with a completion date
-        completed_deliveries = [
-            d for d in self.db.get_all_deliveries()
-            if d.completed and d.completed_date
-        ]
+        first_day = today.replace(day=1)
+        last_day = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+        activity = self.get_daily_activity(first_day, last_day)
+        return {day.day: count for day, count in activity.items()}
+    
+    @cached
+    def get_analytics(self, start_date, end_date):
+        """
+        Compute dashboard analytics from a columnar NumPy snapshot.
+        Returns a dictionary with 'stats' (as get_dashboard_stats), 'earnings'
+        ((labels, values) as get_earnings_over_time) and 'activity'
+        (as get_daily_activity for the given dates).
+        """
+        from db.snapshot import (
+            compute_daily_activity, compute_earnings_by_month, compute_kpis
+        )
 
-        for delivery in completed_deliveries:
-            completion_date = datetime.datetime.strptime(
-                delivery.completed_date, "%Y-%m-%d"
-            ).date()
-            # only count deliveries completed in the current month and year
-            if (completion_date.month == today.month and
-                    completion_date.year == today.year):
-                activity[completion_date.day] += 1
+        deliveries = self.db.load_columns(
+            "deliveries", ("completed", "completed_date", "fee")
+        )
+        invoices = self.db.load_columns("invoices", ("paid", "amount"))
+        return {
+            "stats": compute_kpis(deliveries, invoices),
+            "earnings": compute_earnings_by_month(deliveries),
+            "activity": compute_daily_activity(deliveries, start_date, end_date)
+        }
 
-        return dict(activity)
-    
+    @invalidates
     def delete_delivery(self, delivery_id):
         """
         Delete a delivery by its ID.
+        Its history is kept and a "Deleted" entry is added, so the activity
+        feed shows the whole life of the delivery.
         """
-        self.db.delete_delivery(delivery_id)
+        with self.db.transaction():
+            self.db.delete_delivery(delivery_id)
+            self.db.add_delivery_history(delivery_id, "Deleted")
+        self.reminders.remove(delivery_id)
 
+    @invalidates
     def update_delivery(self, delivery_id, description, fee, deadline):
         """
         Update a delivery's details.
         """
-        self.db.update_delivery(delivery_id, description, fee, deadline)
-        self.db.add_delivery_history(delivery_id, "Edited")
+        with self.db.transaction():
+            self.db.update_delivery(delivery_id, description, fee, deadline)
+            self.db.add_delivery_history(delivery_id, "Edited")
+        self.reminders.update(delivery_id, deadline)
@@ -0,0 +1,201 @@
+"""
+Activity feed and history retention for the Delivery Management App.
+Every create, edit, complete, paid and delete event is a row of
+delivery_history. The feed reads them newest first through covering
+indexes with keyset pagination, and a compaction job rolls events older
+than the retention period up into per-day, per-action counts in
+delivery_history_daily, so the history table stays bounded.
+Run as a script to compact from the command line:
+
+    python -m db.activity my_database.db [--days 365] [--vacuum]
+"""
+
+import argparse
+import datetime
+import time
+
+ACTIONS = ("Created", "Edited", "Completed", "Paid", "Deleted")
+
+DEFAULT_RETENTION_DAYS = 365
+
+
+def install_activity_feed(cursor):
+    """
+    Add the covering indexes used by the feed and create the daily summary
+    table. History rows of deleted deliveries are part of the feed and are
+    kept.
+    :param cursor: Cursor inside an open transaction.
+    """
+    install_feed_indexes(cursor)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS delivery_history_daily (
+            day TEXT NOT NULL,
+            action TEXT NOT NULL,
+            events INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, action)
+        ) WITHOUT ROWID
+    """)
+
+
+def install_feed_indexes(cursor):
+    """
+    Add covering indexes in feed order. id comes right after timestamp, so
+    pages come out of the index already ordered by (timestamp, id), with no
+    sort of the events sharing a timestamp (a bulk import gives thousands of
+    events the same one). Replaces the first version of these indexes,
+    which had the id after the other columns.
+    :param cursor: Cursor inside an open transaction.
+    """
+    cursor.execute("DROP INDEX IF EXISTS idx_delivery_history_timestamp")
+    cursor.execute("DROP INDEX IF EXISTS idx_delivery_history_action_timestamp")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_delivery_history_timestamp_id "
+        "ON delivery_history(timestamp, id, action, delivery_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_delivery_history_action_timestamp_id "
+        "ON delivery_history(action, timestamp, id, delivery_id)"
+    )
+
+
+def history_filters(column, action=None, start_date=None, end_date=None):
+    """
+    Build the WHERE conditions shared by the feed and summary queries.
+    :param column: Date or timestamp column to filter on.
+    :param action: Optional action name from ACTIONS.
+    :param start_date: Optional first day (YYYY-MM-DD, inclusive).
+    :param end_date: Optional last day (YYYY-MM-DD, inclusive).
+    :return: Tuple (list of SQL conditions, list of parameters).
+    """
+    clauses, params = [], []
+    if action:
+        clauses.append("action = ?")
+        params.append(action)
+    if start_date:
+        clauses.append(f"{column} >= ?")
+        params.append(start_date)
+    if end_date:
+        # Timestamps of the last day sort after the bare date
+        clauses.append(f"{column} < date(?, '+1 day')")
+        params.append(end_date)
+    return clauses, params
+
+
+class CompactionResult:
+    """
+    Summary of a history compaction run.
+    """
+
+    def __init__(self, cutoff):
+        """
+        Initialize an empty CompactionResult.
+        :param cutoff: Day (YYYY-MM-DD) before which events were compacted.
+        """
+        self.cutoff = cutoff
+        self.events = 0
+        self.days = 0
+        self.batches = 0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        """
+        String representation for debugging.
+        """
+        return (
+            f"CompactionResult(cutoff={self.cutoff}, events={self.events}, "
+            f"days={self.days}, batches={self.batches}, elapsed={self.elapsed:.2f}s)"
+        )
+
+
+def compact_history(db, days=DEFAULT_RETENTION_DAYS, batch_size=2000, today=None,
+                    progress=None):
+    """
+    Roll history events older than `days` days up into delivery_history_daily
+    and delete them, oldest first, one transaction per batch. Counting and
+    deleting happen in the same transaction, so an interrupted run never
+    counts an event twice.
+    :param db: Database instance.
+    :param days: Number of days of individual events to keep.
+    :param batch_size: Events compacted per transaction.
+    :param today: Reference date (defaults to datetime.date.today()).
+    :param progress: Optional callable receiving the running CompactionResult after each batch.
+    :return: CompactionResult.
+    """
+    today = today or datetime.date.today()
+    result = CompactionResult(
+        (today - datetime.timedelta(days=days)).strftime("%Y-%m-%d")
+    )
+    start = time.perf_counter()
+    touched_days = set()
+
+    while True:
+        with db.transaction():
+            cursor = db.conn.cursor()
+            cursor.execute("""
+                SELECT id, substr(timestamp, 1, 10) FROM delivery_history
+                WHERE timestamp < ?
+                ORDER BY timestamp, id
+                LIMIT ?
+            """, (result.cutoff, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            ids = [row[0] for row in rows]
+            marks = ", ".join("?" * len(ids))
+            cursor.execute(f"""
+                INSERT INTO delivery_history_daily (day, action, events)
+                SELECT substr(timestamp, 1, 10), action, COUNT(*)
+                FROM delivery_history WHERE id IN ({marks})
+                GROUP BY 1, 2
+                ON CONFLICT (day, action) DO UPDATE SET
+                    events = events + excluded.events
+            """, ids)
+            cursor.execute(f"DELETE FROM delivery_history WHERE id IN ({marks})", ids)
+            result.events += cursor.rowcount
+
+        touched_days.update(row[1] for row in rows)
+        result.days = len(touched_days)
+        result.batches += 1
+        result.elapsed = time.perf_counter() - start
+        if progress:
+            progress(result)
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def main():
+    """
+    Command-line entry point: compact old history events and report the result.
+    """
+    parser = argparse.ArgumentParser(
+        description="Roll old delivery history up into daily summaries."
+    )
+    parser.add_argument("db_file", help="Path to the SQLite database file")
+    parser.add_argument(
+        "--days", type=int, default=DEFAULT_RETENTION_DAYS,
+        help="Keep individual events for this many days"
+    )
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument(
+        "--vacuum", action="store_true", help="Compact the database file afterwards"
+    )
+    args = parser.parse_args()
+
+    # Imported here: db.database imports this module through db.migrations
+    from db.database import Database
+
+    db = Database(args.db_file)
+    result = compact_history(
+        db, args.days, args.batch_size,
+        progress=lambda r: print(f"  {r.events} events compacted", end="\r")
+    )
+    print(result)
+    if args.vacuum:
+        db.writer.execute("VACUUM")
+        print("Database compacted.")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Hot/cold archival for the Delivery Management App.
+Moves deliveries that are completed, fully paid and older than a cutoff,
+together with their invoices and history, out of the main (hot) tables
+into an attached archive database, in batched transactions. The normal
+views then only read the hot tables, which stay small however old the
+business is. The dashboard keeps lifetime totals through the
+archived_totals and archived_monthly_earnings tables, and reports can
+read hot and archived rows together with archive_union().
+Run as a script to archive from the command line:
+
+    python -m db.archive my_database.db [--archive FILE] [--months 12] [--vacuum]
+"""
+
+import argparse
+import datetime
+import os
+import time
+
+ARCHIVE_ALIAS = "archive"
+
+# Explicit column lists, so the hot and archive tables line up even if
+# a column was added to the hot table with ALTER TABLE
+COLUMNS = {
+    "deliveries": "id, client_id, description, completed, completed_date, fee, deadline",
+    "invoices": "id, delivery_id, amount, date, paid",
+    "delivery_history": "id, delivery_id, action, timestamp",
+}
+
+
+def default_archive_path(db_file):
+    """
+    Return the archive file used for db_file when none is given:
+    "shop.db" -> "shop.archive.db".
+    """
+    root, ext = os.path.splitext(db_file)
+    return f"{root}.archive{ext or '.db'}"
+
+
+def install_archived_totals(cursor):
+    """
+    Create the tables holding the dashboard contribution of archived
+    deliveries, so lifetime KPIs and monthly earnings survive archival.
+    Safe to run more than once.
+    :param cursor: Cursor inside an open transaction.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS archived_totals (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            deliveries INTEGER NOT NULL DEFAULT 0,
+            earnings REAL NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO archived_totals (id) VALUES (1)")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS archived_monthly_earnings (
+            month TEXT PRIMARY KEY,
+            earnings REAL NOT NULL DEFAULT 0,
+            deliveries INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+
+def create_archive_tables(cursor, alias=ARCHIVE_ALIAS):
+    """
+    Create the archive tables and their indexes in an attached database.
+    Ids are kept from the hot tables (AUTOINCREMENT never reuses them).
+    :param cursor: Cursor on a connection with the archive attached as alias.
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {alias}.deliveries (
+            id INTEGER PRIMARY KEY,
+            client_id INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            completed INTEGER DEFAULT 0,
+            completed_date TEXT,
+            fee REAL NOT NULL,
+            deadline TEXT NOT NULL
+        )
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {alias}.invoices (
+            id INTEGER PRIMARY KEY,
+            delivery_id INTEGER NOT NULL,
+            amount REAL NOT NULL,
+            date TEXT NOT NULL,
+            paid INTEGER DEFAULT 0
+        )
+    """)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {alias}.delivery_history (
+            id INTEGER PRIMARY KEY,
+            delivery_id INTEGER NOT NULL,
+            action TEXT NOT NULL,
+            timestamp TEXT NOT NULL
+        )
+    """)
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS {alias}.idx_archive_deliveries_completed_date "
+        "ON deliveries(completed_date)"
+    )
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS {alias}.idx_archive_invoices_delivery_id "
+        "ON invoices(delivery_id)"
+    )
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS {alias}.idx_archive_history_delivery_timestamp "
+        "ON delivery_history(delivery_id, timestamp)"
+    )
+
+
+def archive_union(table, alias=ARCHIVE_ALIAS):
+    """
+    SQL table expression with the hot and archived rows of a table.
+    Archived rows still present in the hot table (an interrupted archival
+    run) are only returned once.
+    :param table: 'deliveries', 'invoices' or 'delivery_history'.
+    :return: Parenthesised SELECT usable in a FROM clause.
+    """
+    columns = COLUMNS[table]
+    return f"""(
+        SELECT {columns} FROM main.{table}
+        UNION ALL
+        SELECT {columns} FROM {alias}.{table}
+        WHERE id NOT IN (SELECT id FROM main.{table})
+    )"""
+
+
+def months_before(day, months):
+    """
+    Return the date `months` calendar months before day, clamped to the
+    last day of the target month.
+    """
+    month_index = day.year * 12 + day.month - 1 - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    last_day = (next_month - datetime.timedelta(days=1)).day
+    return datetime.date(year, month, min(day.day, last_day))
+
+
+class ArchiveResult:
+    """
+    Summary of an archival run: rows moved, batches and timing.
+    """
+
+    def __init__(self, cutoff):
+        """
+        Initialize an empty ArchiveResult.
+        :param cutoff: Completion date (YYYY-MM-DD) before which deliveries were archived.
+        """
+        self.cutoff = cutoff
+        self.deliveries = 0
+        self.invoices = 0
+        self.history = 0
+        self.batches = 0
+        self.elapsed = 0.0
+
+    def __repr__(self):
+        """
+        String representation for debugging.
+        """
+        return (
+            f"ArchiveResult(cutoff={self.cutoff}, deliveries={self.deliveries}, "
+            f"invoices={self.invoices}, history={self.history}, "
+            f"batches={self.batches}, elapsed={self.elapsed:.2f}s)"
+        )
+
+
+def _select_batch(cursor, cutoff, batch_size):
+    """
+    Ids of up to batch_size hot deliveries that are completed before the
+    cutoff and have no unpaid invoice.
+    """
+    cursor.execute("""
+        SELECT d.id FROM deliveries d
+        WHERE d.completed_date < ? AND d.completed_date <> '' AND d.completed = 1
+          AND NOT EXISTS (
+              SELECT 1 FROM invoices i WHERE i.delivery_id = d.id AND i.paid = 0
+          )
+        LIMIT ?
+    """, (cutoff, batch_size))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def archive_deliveries(db, months=12, batch_size=500, today=None, progress=None):
+    """
+    Move completed, fully paid deliveries completed more than `months` ago,
+    with their invoices and history, into the attached archive database.
+    Each batch is copied in one transaction and removed from the hot tables
+    in a second one. Each transaction writes a single database file, so it
+    is atomic even in WAL mode, and an interrupted run only leaves rows that
+    are already archived, which the next run removes.
+    :param db: Database with an attached archive.
+    :param months: Minimum age of the completion date, in months.
+    :param batch_size: Deliveries moved per batch.
+    :param today: Reference date (defaults to datetime.date.today()).
+    :param progress: Optional callable receiving the running ArchiveResult after each batch.
+    :return: ArchiveResult.
+    """
+    if not db.has_archive:
+        raise ValueError("No archive database is attached")
+    today = today or datetime.date.today()
+    result = ArchiveResult(months_before(today, months).strftime("%Y-%m-%d"))
+    start = time.perf_counter()
+
+    while True:
+        # Copy the batch into the archive
+        with db.transaction():
+            cursor = db.conn.cursor()
+            ids = _select_batch(cursor, result.cutoff, batch_size)
+            if not ids:
+                break
+            marks = ", ".join("?" * len(ids))
+            for table, key in (
+                ("deliveries", "id"), ("invoices", "delivery_id"),
+                ("delivery_history", "delivery_id"),
+            ):
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO {ARCHIVE_ALIAS}.{table} ({COLUMNS[table]})
+                    SELECT {COLUMNS[table]} FROM main.{table} WHERE {key} IN ({marks})
+                """, ids)
+
+        # Fold the batch into the archived totals and remove it from the hot tables
+        with db.transaction():
+            cursor = db.conn.cursor()
+            cursor.execute(f"""
+                UPDATE archived_totals SET
+                    deliveries = deliveries + (SELECT COUNT(*) FROM main.deliveries WHERE id IN ({marks})),
+                    earnings = earnings + (SELECT COALESCE(SUM(fee), 0) FROM main.deliveries WHERE id IN ({marks}))
+                WHERE id = 1
+            """, ids + ids)
+            cursor.execute(f"""
+                INSERT INTO archived_monthly_earnings (month, earnings, deliveries)
+                SELECT substr(completed_date, 1, 7), SUM(fee), COUNT(*)
+                FROM main.deliveries WHERE id IN ({marks})
+                GROUP BY 1
+                ON CONFLICT (month) DO UPDATE SET
+                    earnings = earnings + excluded.earnings,
+                    deliveries = deliveries + excluded.deliveries
+            """, ids)
+            cursor.execute(f"DELETE FROM main.delivery_history WHERE delivery_id IN ({marks})", ids)
+            result.history += cursor.rowcount
+            cursor.execute(f"DELETE FROM main.invoices WHERE delivery_id IN ({marks})", ids)
+            result.invoices += cursor.rowcount
+            cursor.execute(f"DELETE FROM main.deliveries WHERE id IN ({marks})", ids)
+            result.deliveries += cursor.rowcount
+
+        result.batches += 1
+        result.elapsed = time.perf_counter() - start
+        if progress:
+            progress(result)
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def main():
+    """
+    Command-line entry point: archive old deliveries and report the result.
+    """
+    parser = argparse.ArgumentParser(description="Archive old, paid deliveries.")
+    parser.add_argument("db_file", help="Path to the SQLite database file")
+    parser.add_argument(
+        "--archive", help="Archive database file (default: <db>.archive.db)"
+    )
+    parser.add_argument(
+        "--months", type=int, default=12,
+        help="Archive deliveries completed more than this many months ago"
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument(
+        "--vacuum", action="store_true", help="Compact the hot database afterwards"
+    )
+    args = parser.parse_args()
+
+    # Imported here: db.database imports this module through db.migrations
+    from db.database import Database
+
+    db = Database(args.db_file, archive_file=args.archive or default_archive_path(args.db_file))
+    result = archive_deliveries(
+        db, args.months, args.batch_size,
+        progress=lambda r: print(f"  {r.deliveries} deliveries archived", end="\r")
+    )
+    print(result)
+    if args.vacuum:
+        db.writer.execute("VACUUM main")
+        print("Hot database compacted.")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,15 @@
 import sqlite3
+import threading
+from contextlib import contextmanager
+from db.activity import history_filters
+from db.archive import ARCHIVE_ALIAS, create_archive_tables
+from db.migrations import apply_migrations, refresh_statistics
+from db.pool import ReaderPool
+from db.rollups import (
+    SUMMARY_COLUMNS, SUMMARY_RECOMPUTE_SQL, rebuild_dashboard_summary,
+    rebuild_monthly_earnings, verify_dashboard_summary, verify_monthly_earnings
+)
+from db.tracing import TracingConnection
 from models.client import Client
 from models.delivery import Delivery
 from models.invoice import Invoice
@@ -11,13 +22,178 @@ class Database:
     Handles all database operations and table management.
     """
 
-    def __init__(self, db_file):
+    def __init__(
+        self, db_file, wal=True, mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024, readers=4, archive_file=None
+    ):
         """
         Initialize the database connection and create tables if needed.
+        :param db_file: Path to the SQLite database file.
+        :param wal: Use write-ahead logging so readers never block the writer.
+        :param mmap_size: Bytes of the file to memory-map (0 disables mmap I/O).
+        :param cache_size: Page cache size; negative values are KiB.
+        :param readers: Maximum number of pooled read-only connections.
+        :param archive_file: Archive database to attach (see db.archive), or None.
         """
-        self.conn = sqlite3.connect(db_file)
+        self.db_file = db_file
+        self.archive_file = None
+        self.writer = sqlite3.connect(db_file, factory=TracingConnection)
+        self._local = threading.local()
+        self._transaction_depth = 0
+        self._configure_connection(wal, mmap_size, cache_size)
         self._create_tables()
         self._add_completed_date_column()
+        apply_migrations(self.conn)
+        refresh_statistics(self.conn)
+        if db_file == ":memory:":
+            # A private in-memory database cannot be shared with other connections
+            self.reader_pool = None
+            self._version_conn = self.writer
+        else:
+            self.reader_pool = ReaderPool(
+                db_file, max_size=readers, mmap_size=mmap_size, cache_size=cache_size
+            )
+            # Idle connection whose data_version changes on every commit by the
+            # writer or any other process; safe to query from any thread
+            self._version_conn = self.reader_pool.connect()
+        self._version_lock = threading.Lock()
+        if archive_file:
+            self.attach_archive(archive_file)
+
+    @property
+    def conn(self):
+        """
+        The connection used by this thread: the reader checked out with
+        reader() if one is active, otherwise the writer connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        return conn if conn is not None else self.writer
+
+    def _configure_connection(self, wal, mmap_size, cache_size):
+        """
+        Apply journaling and I/O pragmas to the writer connection.
+        """
+        cursor = self.conn.cursor()
+        if wal:
+            cursor.execute("PRAGMA journal_mode = WAL")
+            # NORMAL is durable across application crashes in WAL mode
+            cursor.execute("PRAGMA synchronous = NORMAL")
+        cursor.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        cursor.execute(f"PRAGMA cache_size = {int(cache_size)}")
+
+    def attach_archive(self, archive_file):
+        """
+        Attach the archive database holding archived deliveries, invoices and
+        history, creating its tables if needed. The writer attaches it
+        read-write and every pooled reader read-only, as schema "archive".
+        :param archive_file: Path to the archive SQLite database file.
+        """
+        if self.archive_file:
+            raise RuntimeError(f"An archive is already attached: {self.archive_file}")
+        cursor = self.writer.cursor()
+        cursor.execute(f"ATTACH DATABASE ? AS {ARCHIVE_ALIAS}", (archive_file,))
+        cursor.execute(f"PRAGMA {ARCHIVE_ALIAS}.journal_mode = WAL")
+        create_archive_tables(cursor)
+        self.writer.commit()
+        if self.reader_pool:
+            self.reader_pool.attach(archive_file, ARCHIVE_ALIAS)
+        self.archive_file = archive_file
+
+    @property
+    def has_archive(self):
+        """True if an archive database is attached."""
+        return self.archive_file is not None
+
+    @contextmanager
+    def reader(self):
+        """
+        Check out a read-only connection that may be used from any thread.
+        While the block runs, every Database read method called from this
+        thread uses that connection. Falls back to the writer connection for
+        in-memory databases, which are then only usable from the thread that
+        created them.
+        """
+        if self.reader_pool is None:
+            yield self.writer
+            return
+        previous = getattr(self._local, "conn", None)
+        with self.reader_pool.connection() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = previous
+
+    def close(self):
+        """
+        Close the reader pool and the writer connection, letting SQLite
+        refresh the statistics of tables the writer has queried.
+        """
+        if self.reader_pool:
+            self.reader_pool.close()
+            self._version_conn.close()
+        self.writer.execute("PRAGMA optimize")
+        self.writer.close()
+
+    def set_trace_callback(self, callback):
+        """
+        Install a SQL trace callback on the writer and every pooled reader.
+        For file databases the data_version monitor connection is left out,
+        so only the application's own queries are reported.
+        :param callback: Callable receiving each SQL statement, or None to remove.
+        """
+        self.writer.set_trace_callback(callback)
+        if self.reader_pool:
+            self.reader_pool.set_trace_callback(callback)
+
+    def set_statement_callback(self, callback):
+        """
+        Install a callback on the writer and every pooled reader that
+        receives each statement the application executes, once per call
+        (see db.tracing), unlike the trace callback.
+        :param callback: Callable receiving each SQL statement, or None to remove.
+        """
+        self.writer.statement_callback = callback
+        if self.reader_pool:
+            self.reader_pool.set_statement_callback(callback)
+
+    def get_data_version(self):
+        """
+        Return SQLite's data_version as seen by an idle monitoring connection.
+        It changes whenever any connection, including the writer, commits.
+        Safe to call from any thread.
+        """
+        with self._version_lock:
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several database operations into a single atomic commit.
+        Methods called inside the block skip their own commit; the outermost
+        block commits on success and rolls everything back on error.
+        Blocks may be nested.
+        """
+        if self._transaction_depth == 0:
+            self.conn.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.conn.commit()
+
+    def _commit(self):
+        """
+        Commit the current statement unless an outer transaction() is open.
+        """
+        if self._transaction_depth == 0:
+            self.conn.commit()
 
     def _create_tables(self):
         """
@@ -76,7 +252,7 @@ class Database:
             FOREIGN KEY (delivery_id) REFERENCES deliveries(id)
         )
     """)
-        self.conn.commit()
+        self._commit()
 
     def _add_completed_date_column(self):
         """
@@ -90,7 +266,7 @@ class Database:
                 ALTER TABLE deliveries 
                 ADD COLUMN completed_date TEXT
             """)
-            self.conn.commit()
+            self._commit()
 
     def insert_client(self, client):
         """
@@ -100,7 +276,7 @@ class Database:
         """
         cursor = self.conn.cursor()
         cursor.execute("INSERT INTO clients (name) VALUES (?)", (client.name,))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def insert_freelancer(self, freelancer):
@@ -111,9 +287,73 @@ class Database:
         """
         cursor = self.conn.cursor()
         cursor.execute("INSERT INTO freelancers (name) VALUES (?)", (freelancer.name,))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
+    def get_client_ids_by_names(self, names):
+        """
+        Look up the IDs of several clients by name.
+        :param names: Iterable of client names.
+        :return: Dictionary mapping each existing name to its client ID.
+        """
+        names = list(names)
+        cursor = self.conn.cursor()
+        ids = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(
+                f"SELECT id, name FROM clients WHERE name IN ({placeholders})", chunk
+            )
+            for client_id, name in cursor.fetchall():
+                ids.setdefault(name, client_id)
+        return ids
+
+    def insert_clients(self, names):
+        """
+        Insert several clients at once.
+        :param names: Iterable of client names.
+        """
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "INSERT INTO clients (name) VALUES (?)", ((name,) for name in names)
+        )
+        self._commit()
+
+    def add_deliveries_with_invoices(self, rows, invoice_date):
+        """
+        Insert many deliveries, one unpaid invoice per delivery and a
+        "Created" history entry for each. Must be called inside transaction()
+        so the new delivery IDs can be identified safely.
+        :param rows: Iterable of (client_id, description, fee, deadline) tuples.
+        :param invoice_date: Issue date for every new invoice.
+        :return: List of the new delivery IDs, in input order.
+        """
+        if self._transaction_depth == 0:
+            raise RuntimeError("add_deliveries_with_invoices requires an open transaction")
+        cursor = self.conn.cursor()
+        # AUTOINCREMENT ids always exceed the current maximum, and the write lock
+        # held by transaction() keeps other writers out until commit.
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM deliveries")
+        last_id = cursor.fetchone()[0]
+        cursor.executemany("""
+            INSERT INTO deliveries (client_id, description, completed, fee, deadline, completed_date)
+            VALUES (?, ?, 0, ?, ?, NULL)
+        """, rows)
+        cursor.execute("""
+            INSERT INTO invoices (delivery_id, amount, date, paid)
+            SELECT id, fee, ?, 0 FROM deliveries WHERE id > ? ORDER BY id
+        """, (invoice_date, last_id))
+        cursor.execute("""
+            INSERT INTO delivery_history (delivery_id, action, timestamp)
+            SELECT id, 'Created', ? FROM deliveries WHERE id > ? ORDER BY id
+        """, (datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), last_id))
+        cursor.execute(
+            "SELECT id FROM deliveries WHERE id > ? ORDER BY id", (last_id,)
+        )
+        return [row[0] for row in cursor.fetchall()]
+
     def count_deliveries(self, completed=None):
         """
         Count deliveries, optionally filtered by completion status.
@@ -158,7 +398,7 @@ class Database:
             delivery.deadline,
             delivery.completed_date
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_all_deliveries(self):
@@ -184,6 +424,188 @@ class Database:
             for row in rows
         ]
 
+    @staticmethod
+    def _delivery_from_row(row):
+        """
+        Build a Delivery from a row of
+        (id, client_id, description, completed, completed_date, fee, deadline).
+        """
+        return Delivery(
+            id=row[0],
+            client_id=row[1],
+            description=row[2],
+            completed=bool(row[3]),
+            completed_date=row[4],
+            fee=row[5],
+            deadline=row[6]
+        )
+
+    def get_deliveries_with_client_names(self):
+        """
+        Retrieve all deliveries together with their client names in one query.
+        :return: List of (Delivery, client_name) tuples, ordered by delivery ID.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT d.id, d.client_id, d.description, d.completed, d.completed_date,
+                   d.fee, d.deadline, COALESCE(c.name, 'Unknown Client')
+            FROM deliveries d
+            LEFT JOIN clients c ON c.id = d.client_id
+            ORDER BY d.id
+        """)
+        rows = cursor.fetchall()
+        return [(self._delivery_from_row(row), row[7]) for row in rows]
+
+    def search_deliveries(self, query, limit=50, candidates=2000):
+        """
+        Search deliveries by description or client name.
+        Uses the FTS5 index with prefix matching on every word of the query and
+        ranks the newest `candidates` matches by bm25, so very common words stay
+        fast; falls back to a LIKE scan if the index is unavailable.
+        :param query: Free-text search string.
+        :param limit: Maximum number of results to return.
+        :param candidates: Number of most recent matches considered for ranking.
+        :return: List of (Delivery, client_name) tuples, best matches first.
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        cursor = self.conn.cursor()
+        if self._has_table("deliveries_fts"):
+            # Quote each word so FTS5 operators in user input are taken literally
+            match = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+            cursor.execute("""
+                SELECT d.id, d.client_id, d.description, d.completed, d.completed_date,
+                       d.fee, d.deadline, COALESCE(c.name, 'Unknown')
+                FROM (
+                    SELECT rowid, rank FROM deliveries_fts
+                    WHERE deliveries_fts MATCH ?
+                    ORDER BY rowid DESC
+                    LIMIT ?
+                ) AS hits
+                JOIN deliveries d ON d.id = hits.rowid
+                LEFT JOIN clients c ON c.id = d.client_id
+                ORDER BY hits.rank
+                LIMIT ?
+            """, (match, candidates, limit))
+        else:
+            pattern = f"%{query.strip()}%"
+            cursor.execute("""
+                SELECT d.id, d.client_id, d.description, d.completed, d.completed_date,
+                       d.fee, d.deadline, COALESCE(c.name, 'Unknown')
+                FROM deliveries d
+                LEFT JOIN clients c ON c.id = d.client_id
+                WHERE d.description LIKE ? OR c.name LIKE ?
+                ORDER BY d.id
+                LIMIT ?
+            """, (pattern, pattern, limit))
+        return [(self._delivery_from_row(row), row[7]) for row in cursor.fetchall()]
+
+    def _has_table(self, name):
+        """
+        Return True if a table (or virtual table) with this name exists.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        )
+        return cursor.fetchone() is not None
+
+    def get_invoices_with_details(self):
+        """
+        Retrieve all invoices with their delivery description and client name in one query.
+        Invoices whose delivery no longer exists get "Delivery not found" / "N/A".
+        :return: List of (Invoice, delivery_desc, client_name) tuples, ordered by invoice ID.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT i.id, i.delivery_id, i.amount, i.date, i.paid,
+                   CASE WHEN d.id IS NULL THEN 'Delivery not found'
+                        ELSE d.description END,
+                   CASE WHEN d.id IS NULL THEN 'N/A'
+                        ELSE COALESCE(c.name, 'Unknown Client') END
+            FROM invoices i
+            LEFT JOIN deliveries d ON d.id = i.delivery_id
+            LEFT JOIN clients c ON c.id = d.client_id
+            ORDER BY i.id
+        """)
+        rows = cursor.fetchall()
+        return [(Invoice(*row[:5]), row[5], row[6]) for row in rows]
+
+    def get_deliveries_page(self, after=None, limit=50):
+        """
+        Retrieve one page of deliveries with client names, ordered by (deadline, id).
+        Uses keyset pagination, so every page costs the same regardless of its position.
+        :param after: (deadline, id) of the last delivery on the previous page, or None.
+        :param limit: Maximum number of deliveries to return.
+        :return: List of (Delivery, client_name) tuples.
+        """
+        where, params = "", []
+        if after is not None:
+            where = "WHERE (d.deadline, d.id) > (?, ?)"
+            params = list(after)
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT d.id, d.client_id, d.description, d.completed, d.completed_date,
+                   d.fee, d.deadline, COALESCE(c.name, 'Unknown Client')
+            FROM deliveries d
+            LEFT JOIN clients c ON c.id = d.client_id
+            {where}
+            ORDER BY d.deadline, d.id
+            LIMIT ?
+        """, params + [limit])
+        return [(self._delivery_from_row(row), row[7]) for row in cursor.fetchall()]
+
+    def get_delivery_key_at(self, position):
+        """
+        Return the (deadline, id) keyset position of the delivery at a given
+        row number in (deadline, id) order. Only walks the deadline index,
+        so a jump to any row costs one index scan instead of loading every
+        row before it.
+        :param position: Zero-based row number.
+        :return: (deadline, id) tuple, or None past the end.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT deadline, id FROM deliveries ORDER BY deadline, id LIMIT 1 OFFSET ?",
+            (position,)
+        )
+        return cursor.fetchone()
+
+    def get_invoices_page(self, before=None, limit=50):
+        """
+        Retrieve one page of invoices with delivery descriptions and client names,
+        newest first, ordered by (date, id) descending, using keyset pagination.
+        :param before: (date, id) of the last invoice on the previous page, or None.
+        :param limit: Maximum number of invoices to return.
+        :return: List of (Invoice, delivery_desc, client_name) tuples.
+        """
+        where, params = "", []
+        if before is not None:
+            where = "WHERE (i.date, i.id) < (?, ?)"
+            params = list(before)
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT i.id, i.delivery_id, i.amount, i.date, i.paid,
+                   CASE WHEN d.id IS NULL THEN 'Delivery not found'
+                        ELSE d.description END,
+                   CASE WHEN d.id IS NULL THEN 'N/A'
+                        ELSE COALESCE(c.name, 'Unknown Client') END
+            FROM invoices i
+            LEFT JOIN deliveries d ON d.id = i.delivery_id
+            LEFT JOIN clients c ON c.id = d.client_id
+            {where}
+            ORDER BY i.date DESC, i.id DESC
+            LIMIT ?
+        """, params + [limit])
+        return [(Invoice(*row[:5]), row[5], row[6]) for row in cursor.fetchall()]
+
+    def count_invoices(self):
+        """Return the total number of invoices directly from the DB."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM invoices")
+        return cursor.fetchone()[0]
+
     def get_client_by_id(self, client_id):
         """
         Retrieve a client by their ID.
@@ -222,7 +644,7 @@ class Database:
             "UPDATE deliveries SET completed=1, completed_date=? WHERE id=?",
             (completed_date, delivery_id)
         )
-        self.conn.commit()
+        self._commit()
 
     def add_invoice(self, delivery_id, amount, date):
         """
@@ -237,7 +659,7 @@ class Database:
             "INSERT INTO invoices (delivery_id, amount, date, paid) VALUES (?, ?, ?, 0)",
             (delivery_id, amount, date)
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_all_invoices(self):
@@ -250,29 +672,121 @@ class Database:
         rows = cursor.fetchall()
         return [Invoice(*row) for row in rows]
 
+    def get_invoice_delivery_id(self, invoice_id):
+        """
+        Return the ID of the delivery an invoice belongs to, or None.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT delivery_id FROM invoices WHERE id=?", (invoice_id,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
     def mark_invoice_as_paid(self, invoice_id):
         """
         Mark an invoice as paid.
         """
         cursor = self.conn.cursor()
         cursor.execute("UPDATE invoices SET paid=1 WHERE id=?", (invoice_id,))
-        self.conn.commit()
+        self._commit()
 
     def get_total_earnings_by_month(self):
         """
-        Get total earnings grouped by month.
-        :return: Dictionary with month as key and total earnings as value.
+        Get total earnings grouped by the month deliveries were completed.
+        Reads the trigger-maintained monthly_earnings rollup plus the
+        contribution of archived deliveries.
+        :return: Dictionary with month ("YYYY-MM") as key and total earnings as value.
         """
         cursor = self.conn.cursor()
         cursor.execute("""
-            SELECT strftime('%Y-%m', deadline) as month, SUM(fee)
-            FROM deliveries
+            SELECT month, SUM(earnings)
+            FROM (
+                SELECT month, earnings FROM monthly_earnings WHERE deliveries > 0
+                UNION ALL
+                SELECT month, earnings FROM archived_monthly_earnings WHERE deliveries > 0
+            )
             GROUP BY month
             ORDER BY month
         """)
         rows = cursor.fetchall()
         return {row[0]: row[1] for row in rows}
 
+    def verify_monthly_earnings(self, rebuild=False):
+        """
+        Recompute the monthly earnings rollup from scratch and report any drift.
+        :param rebuild: Overwrite the stored rollup with the recomputed values.
+        :return: Dictionary {month: (stored, actual)} for every drifted month.
+        """
+        cursor = self.conn.cursor()
+        drift = verify_monthly_earnings(cursor)
+        if rebuild:
+            rebuild_monthly_earnings(cursor)
+            self._commit()
+        return drift
+
+    DELIVERY_COLUMNS = (
+        "id", "client_id", "description", "completed", "completed_date", "fee", "deadline"
+    )
+
+    def get_delivery_columns(self, columns, completed=None):
+        """
+        Retrieve only the requested delivery columns, as plain tuples.
+        Much lighter than get_all_deliveries() when a caller needs a few fields
+        (e.g. dates and fees) and not the full Delivery objects.
+        :param columns: Sequence of names from DELIVERY_COLUMNS.
+        :param completed: None for all, True for completed, False for pending.
+        :return: List of tuples with the columns in the requested order.
+        """
+        unknown = set(columns) - set(self.DELIVERY_COLUMNS)
+        if not columns or unknown:
+            raise ValueError(f"Unknown delivery columns: {sorted(unknown)}")
+        sql = f"SELECT {', '.join(columns)} FROM deliveries"
+        params = ()
+        if completed is not None:
+            sql += " WHERE completed = ?"
+            params = (int(completed),)
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+    def load_columns(self, table, columns):
+        """
+        Load selected columns of deliveries or invoices into NumPy arrays.
+        See db.snapshot.load_columns for the supported columns and dtypes.
+        :param table: 'deliveries' or 'invoices'.
+        :param columns: Sequence of column names.
+        :return: Dictionary {column: numpy.ndarray}.
+        """
+        # NumPy is only imported when analytics are actually requested
+        from db.snapshot import load_columns
+        return load_columns(self.conn, table, columns)
+
+    def get_pending_deadlines(self):
+        """
+        Retrieve the deadline of every pending delivery.
+        Served entirely from the (completed, deadline) index.
+        :return: List of (delivery_id, deadline) tuples.
+        """
+        return self.get_delivery_columns(("id", "deadline"), completed=False)
+
+    def get_daily_completions(self, start_date, end_date):
+        """
+        Count completed deliveries per day within a date range.
+        Runs as an index range scan on completed_date.
+        :param start_date: First day of the range, "YYYY-MM-DD" (inclusive).
+        :param end_date: Last day of the range, "YYYY-MM-DD" (inclusive).
+        :return: Dictionary with date string as key and count as value; days
+                 without completions are omitted.
+        """
+        cursor = self.conn.cursor()
+        # The unary + keeps the planner off the (completed, deadline) index
+        cursor.execute("""
+            SELECT completed_date, COUNT(*)
+            FROM deliveries
+            WHERE completed_date BETWEEN ? AND ? AND +completed = 1
+            GROUP BY completed_date
+        """, (start_date, end_date))
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
     def count_all_deliveries(self):
         """Return the total number of deliveries directly from the DB."""
         cursor = self.conn.cursor()
@@ -297,6 +811,50 @@ class Database:
         cursor.execute("SELECT COALESCE(SUM(fee), 0) FROM deliveries WHERE completed = 1")
         return cursor.fetchone()[0]
 
+    def get_dashboard_summary(self, include_archive=True):
+        """
+        Read every dashboard KPI from the trigger-maintained summary row.
+        Lifetime totals include archived deliveries, which are all completed
+        and paid, so only the delivery counts and earnings need adjusting.
+        Read-only, so it is safe on pooled reader connections: the row is
+        created by the migration, and should it be missing the totals are
+        recomputed from the base tables instead.
+        :param include_archive: Add archived deliveries to the totals; without
+            it the totals describe the hot tables only.
+        :return: Dictionary keyed by the dashboard_summary column names.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM dashboard_summary WHERE id = 1"
+        )
+        row = cursor.fetchone()
+        if row is None:
+            cursor.execute(SUMMARY_RECOMPUTE_SQL)
+            row = cursor.fetchone()
+        summary = dict(zip(SUMMARY_COLUMNS, row))
+        if not include_archive:
+            return summary
+        cursor.execute("SELECT deliveries, earnings FROM archived_totals WHERE id = 1")
+        archived = cursor.fetchone()
+        if archived and archived[0]:
+            summary["total_deliveries"] += archived[0]
+            summary["completed_deliveries"] += archived[0]
+            summary["earnings"] += archived[1]
+        return summary
+
+    def verify_dashboard_summary(self, rebuild=False):
+        """
+        Recompute the dashboard summary from scratch and report any drift.
+        :param rebuild: Overwrite the stored summary with the recomputed values.
+        :return: Dictionary {column: (stored, actual)} for every drifted column.
+        """
+        cursor = self.conn.cursor()
+        drift = verify_dashboard_summary(cursor)
+        if rebuild:
+            rebuild_dashboard_summary(cursor)
+            self._commit()
+        return drift
+
     def get_delivery_by_id(self, delivery_id):
         """
         Retrieve a delivery by its ID.
@@ -319,12 +877,14 @@ class Database:
 
     def delete_delivery(self, delivery_id):
         """
-        Delete a delivery from the database by its ID.
+        Delete a delivery and its invoices from the database by its ID.
+        Its history is kept: the activity feed still shows the events of
+        deleted deliveries.
         """
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM invoices WHERE delivery_id=?", (delivery_id,))
         cursor.execute("DELETE FROM deliveries WHERE id=?", (delivery_id,))
-        self.conn.commit()
+        self._commit()
 
     def update_delivery(self, delivery_id, description, fee, deadline):
         """
@@ -335,7 +895,7 @@ class Database:
             "UPDATE deliveries SET description=?, fee=?, deadline=? WHERE id=?",
             (description, fee, deadline, delivery_id)
         )
-        self.conn.commit()
+        self._commit()
     def add_delivery_history(self, delivery_id, action):
         """
         Add a record to the delivery's change history.
@@ -347,15 +907,120 @@ class Database:
             "INSERT INTO delivery_history (delivery_id, action, timestamp) VALUES (?, ?, ?)",
             (delivery_id, action, timestamp)
         )
-        self.conn.commit()
+        self._commit()
 
-    def get_delivery_history(self, delivery_id):
+    def get_delivery_history_page(self, delivery_id, before=None, limit=50):
         """
-        Get the change history for a delivery.
+        Get one page of a delivery's change history, newest first,
+        ordered by (timestamp, id) descending, using keyset pagination.
+        :param delivery_id: ID of the delivery.
+        :param before: (timestamp, id) of the last entry on the previous page, or None.
+        :param limit: Maximum number of entries to return.
+        :return: List of (id, action, timestamp) tuples.
         """
+        where, params = "", [delivery_id]
+        if before is not None:
+            where = "AND (timestamp, id) < (?, ?)"
+            params += list(before)
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT id, action, timestamp FROM delivery_history
+            WHERE delivery_id = ? {where}
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ?
+        """, params + [limit])
+        return cursor.fetchall()
+
+    def count_delivery_history(self, delivery_id):
+        """Return the number of history entries for a delivery."""
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT action, timestamp FROM delivery_history WHERE delivery_id=? ORDER BY timestamp DESC",
-            (delivery_id,)
+            "SELECT COUNT(*) FROM delivery_history WHERE delivery_id = ?", (delivery_id,)
         )
+        return cursor.fetchone()[0]
+
+    def get_activity_page(self, before=None, limit=50, action=None,
+                          start_date=None, end_date=None):
+        """
+        Get one page of the history of all deliveries, newest first, ordered
+        by (timestamp, id) descending, using keyset pagination. The page is
+        read from a covering index before the deliveries are joined, so
+        every page costs the same however long the history is.
+        :param before: (timestamp, id) of the last entry on the previous page, or None.
+        :param limit: Maximum number of entries to return.
+        :param action: Optional action filter ('Created', 'Edited', ...).
+        :param start_date: Optional first day (YYYY-MM-DD, inclusive).
+        :param end_date: Optional last day (YYYY-MM-DD, inclusive).
+        :return: List of (id, delivery_id, action, timestamp, description, client_name)
+                 tuples; description and client_name are None for deleted deliveries.
+        """
+        clauses, params = history_filters("timestamp", action, start_date, end_date)
+        columns = "id, delivery_id, action, timestamp"
+        if before is None:
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            page = f"""
+                SELECT {columns} FROM delivery_history
+                {where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            """
+            page_params = params + [limit]
+        else:
+            # SQLite only seeks on the timestamp for (timestamp, id) < (?, ?),
+            # which scans every event sharing the cursor's timestamp (a bulk
+            # import creates thousands). Reading the rest of that timestamp
+            # and the older ones separately seeks on both columns.
+            timestamp, last_id = before
+            same = " AND ".join(clauses + ["timestamp = ?", "id < ?"])
+            older = " AND ".join(clauses + ["timestamp < ?"])
+            page = f"""
+                SELECT * FROM (
+                    SELECT {columns} FROM delivery_history WHERE {same}
+                    ORDER BY id DESC LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT {columns} FROM delivery_history WHERE {older}
+                    ORDER BY timestamp DESC, id DESC LIMIT ?
+                )
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            """
+            page_params = (
+                params + [timestamp, last_id, limit] + params + [timestamp, limit, limit]
+            )
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT h.id, h.delivery_id, h.action, h.timestamp, d.description, c.name
+            FROM ({page}) AS h
+            LEFT JOIN deliveries d ON d.id = h.delivery_id
+            LEFT JOIN clients c ON c.id = d.client_id
+            ORDER BY h.timestamp DESC, h.id DESC
+        """, page_params)
+        return cursor.fetchall()
+
+    def get_activity_summary_page(self, before=None, limit=50, action=None,
+                                  start_date=None, end_date=None):
+        """
+        Get one page of the daily event counts of compacted history, newest
+        day first, ordered by (day, action) descending, using keyset pagination.
+        :param before: (day, action) of the last row on the previous page, or None.
+        :param limit: Maximum number of rows to return.
+        :param action: Optional action filter.
+        :param start_date: Optional first day (YYYY-MM-DD, inclusive).
+        :param end_date: Optional last day (YYYY-MM-DD, inclusive).
+        :return: List of (day, action, events) tuples.
+        """
+        clauses, params = history_filters("day", action, start_date, end_date)
+        if before is not None:
+            clauses.append("(day, action) < (?, ?)")
+            params += list(before)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT day, action, events FROM delivery_history_daily
+            {where}
+            ORDER BY day DESC, action DESC
+            LIMIT ?
+        """, params + [limit])
         return cursor.fetchall()
@@ -0,0 +1,242 @@
+"""
+CSV export of deliveries and invoices for the Delivery Management App.
+Rows are streamed from the SQLite cursor in chunks and written straight
+to disk, so memory use stays flat regardless of table size. Exports can
+run on a background thread and report progress through a queue, and can
+include the rows of an attached archive database.
+"""
+
+import csv
+import queue
+import threading
+from db.archive import archive_union
+
+DELIVERY_COLUMNS = [
+    "delivery_id", "client", "description", "fee",
+    "deadline", "status", "completed_date"
+]
+INVOICE_COLUMNS = [
+    "invoice_id", "date", "amount", "status",
+    "delivery_id", "delivery_description", "client"
+]
+
+
+def _delivery_filters(start_date, end_date, status):
+    """
+    Build the WHERE clause for a deliveries export.
+    Dates filter on the deadline; status is 'completed', 'pending' or None.
+    """
+    clauses, params = [], []
+    if start_date:
+        clauses.append("d.deadline >= ?")
+        params.append(start_date)
+    if end_date:
+        clauses.append("d.deadline <= ?")
+        params.append(end_date)
+    if status == "completed":
+        clauses.append("d.completed = 1")
+    elif status == "pending":
+        clauses.append("d.completed = 0")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _invoice_filters(start_date, end_date, status):
+    """
+    Build the WHERE clause for an invoices export.
+    Dates filter on the issue date; status is 'paid', 'pending' or None.
+    """
+    clauses, params = [], []
+    if start_date:
+        clauses.append("i.date >= ?")
+        params.append(start_date)
+    if end_date:
+        clauses.append("i.date <= ?")
+        params.append(end_date)
+    if status == "paid":
+        clauses.append("i.paid = 1")
+    elif status == "pending":
+        clauses.append("i.paid = 0")
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _table(name, include_archive):
+    """
+    Return the table expression to read: the hot table, or the hot and
+    archived rows together when include_archive is set.
+    """
+    return archive_union(name) if include_archive else name
+
+
+def count_rows(conn, kind, start_date=None, end_date=None, status=None,
+               include_archive=False):
+    """
+    Count the rows an export will write.
+    :param conn: Database connection.
+    :param kind: 'deliveries' or 'invoices'.
+    :param include_archive: Also count rows of the attached archive database.
+    :return: Number of matching rows.
+    """
+    if kind == "deliveries":
+        where, params = _delivery_filters(start_date, end_date, status)
+        sql = f"SELECT COUNT(*) FROM {_table('deliveries', include_archive)} d {where}"
+    else:
+        where, params = _invoice_filters(start_date, end_date, status)
+        sql = f"SELECT COUNT(*) FROM {_table('invoices', include_archive)} i {where}"
+    return conn.execute(sql, params).fetchone()[0]
+
+
+def iter_rows(conn, kind, start_date=None, end_date=None, status=None, chunk_size=2000,
+              include_archive=False):
+    """
+    Yield lists of export rows, chunk_size rows at a time, using fetchmany.
+    :param conn: Database connection.
+    :param kind: 'deliveries' or 'invoices'.
+    :param start_date: Optional lower date bound (YYYY-MM-DD, inclusive).
+    :param end_date: Optional upper date bound (YYYY-MM-DD, inclusive).
+    :param status: Optional status filter.
+    :param chunk_size: Number of rows fetched per round trip.
+    :param include_archive: Also export rows of the attached archive database.
+    """
+    deliveries = _table("deliveries", include_archive)
+    if kind == "deliveries":
+        where, params = _delivery_filters(start_date, end_date, status)
+        sql = f"""
+            SELECT d.id, COALESCE(c.name, 'Unknown Client'), d.description, d.fee,
+                   d.deadline,
+                   CASE WHEN d.completed THEN 'Completed' ELSE 'Pending' END,
+                   COALESCE(d.completed_date, '')
+            FROM {deliveries} d
+            LEFT JOIN clients c ON c.id = d.client_id
+            {where}
+            ORDER BY d.id
+        """
+    else:
+        where, params = _invoice_filters(start_date, end_date, status)
+        sql = f"""
+            SELECT i.id, i.date, i.amount,
+                   CASE WHEN i.paid THEN 'Paid' ELSE 'Pending' END,
+                   i.delivery_id,
+                   COALESCE(d.description, 'Delivery not found'),
+                   CASE WHEN d.id IS NULL THEN 'N/A'
+                        ELSE COALESCE(c.name, 'Unknown Client') END
+            FROM {_table("invoices", include_archive)} i
+            LEFT JOIN {deliveries} d ON d.id = i.delivery_id
+            LEFT JOIN clients c ON c.id = d.client_id
+            {where}
+            ORDER BY i.id
+        """
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield rows
+
+
+def export_csv(conn, kind, path, start_date=None, end_date=None, status=None,
+               chunk_size=2000, progress=None, cancel_event=None, include_archive=False):
+    """
+    Write deliveries or invoices to a CSV file.
+    :param conn: Database connection.
+    :param kind: 'deliveries' or 'invoices'.
+    :param path: Destination file path.
+    :param progress: Optional callable receiving (rows_written, total_rows).
+    :param cancel_event: Optional threading.Event; the export stops when it is set.
+    :param include_archive: Also export rows of the attached archive database.
+    :return: Number of rows written.
+    """
+    if kind not in ("deliveries", "invoices"):
+        raise ValueError(f"Unknown export kind: {kind}")
+    total = count_rows(conn, kind, start_date, end_date, status, include_archive)
+    header = DELIVERY_COLUMNS if kind == "deliveries" else INVOICE_COLUMNS
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for rows in iter_rows(
+            conn, kind, start_date, end_date, status, chunk_size, include_archive
+        ):
+            if cancel_event and cancel_event.is_set():
+                break
+            writer.writerows(rows)
+            written += len(rows)
+            if progress:
+                progress(written, total)
+    return written
+
+
+class ExportJob:
+    """
+    Runs export_csv on a background thread using a pooled read-only connection.
+    The Tk thread polls progress with poll() from an after() loop, because Tk
+    widgets must not be touched from the worker thread.
+    """
+
+    def __init__(self, db, kind, path, start_date=None, end_date=None, status=None,
+                 include_archive=False):
+        """
+        Initialize an ExportJob. Call start() to begin the export.
+        :param db: Database instance whose reader pool the export uses.
+        :param include_archive: Also export archived rows (needs an attached archive).
+        """
+        self.db = db
+        self.kind = kind
+        self.path = path
+        self.start_date = start_date
+        self.end_date = end_date
+        self.status = status
+        self.include_archive = include_archive and db.has_archive
+        self.written = 0
+        self.total = 0
+        self.done = False
+        self.error = None
+        self._events = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start the export thread."""
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ask the export thread to stop after the current chunk."""
+        self._cancel.set()
+
+    def _run(self):
+        """Thread body: check out a reader connection and stream the export."""
+        try:
+            with self.db.reader() as conn:
+                written = export_csv(
+                    conn, self.kind, self.path, self.start_date, self.end_date,
+                    self.status,
+                    progress=lambda w, t: self._events.put(("progress", w, t)),
+                    cancel_event=self._cancel,
+                    include_archive=self.include_archive
+                )
+            self._events.put(("done", written, None))
+        except Exception as e:
+            self._events.put(("error", 0, e))
+
+    def poll(self):
+        """
+        Apply queued progress events. Call from the Tk thread.
+        :return: True while the export is still running.
+        """
+        while True:
+            try:
+                event, value, extra = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if event == "progress":
+                self.written, self.total = value, extra
+            elif event == "done":
+                self.written = value
+                self.done = True
+            else:
+                self.error = extra
+                self.done = True
+        return not self.done
@@ -0,0 +1,167 @@
+"""
+Bulk import of deliveries for the Delivery Management App.
+Streams CSV or JSONL files row by row and inserts deliveries, clients
+and invoices in chunked transactions, so memory use stays constant
+regardless of file size.
+"""
+
+import csv
+import datetime
+import json
+import math
+import os
+import time
+from models.client import Client
+
+
+class ImportResult:
+    """
+    Summary of a bulk import: counts, timing and per-row errors.
+    """
+
+    def __init__(self, max_errors):
+        """
+        Initialize an empty ImportResult.
+        :param max_errors: Maximum number of error messages to keep.
+        """
+        self.imported = 0
+        self.failed = 0
+        self.clients_created = 0
+        self.elapsed = 0.0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def add_error(self, line_no, message):
+        """
+        Record a rejected row. Only the first max_errors messages are kept.
+        :param line_no: Line number of the row in the source file.
+        :param message: Reason the row was rejected.
+        """
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((line_no, message))
+
+    @property
+    def rows_per_second(self):
+        """Return the import throughput in rows per second."""
+        return self.imported / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        """
+        String representation for debugging.
+        """
+        return (
+            f"ImportResult(imported={self.imported}, failed={self.failed}, "
+            f"clients_created={self.clients_created}, elapsed={self.elapsed:.2f}s, "
+            f"rows_per_second={self.rows_per_second:.0f})"
+        )
+
+
+def iter_rows(path):
+    """
+    Yield (line_no, row_dict) pairs from a CSV or JSONL file.
+    The format is chosen by file extension (.jsonl/.ndjson, otherwise CSV).
+    Malformed JSON lines are yielded as (line_no, None).
+    :param path: Path to the source file.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if extension in (".jsonl", ".ndjson"):
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    row = None
+                yield line_no, row if isinstance(row, dict) else None
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+
+def validate_row(row):
+    """
+    Validate one source row and normalise it for insertion.
+    Accepts 'client' or 'client_name', 'description', 'fee' and 'deadline' (YYYY-MM-DD).
+    :param row: Dictionary read from the source file.
+    :return: Tuple (client_name, description, fee, deadline).
+    :raises ValueError: If the row is missing fields or has invalid values.
+    """
+    if row is None:
+        raise ValueError("Malformed row")
+    client_name = str(row.get("client") or row.get("client_name") or "").strip()
+    description = str(row.get("description") or "").strip()
+    deadline = str(row.get("deadline") or "").strip()
+    fee_value = row.get("fee")
+    if not client_name:
+        raise ValueError("Missing client name")
+    if not description:
+        raise ValueError("Missing description")
+    if fee_value is None or str(fee_value).strip() == "":
+        raise ValueError("Missing fee")
+    try:
+        fee = float(fee_value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Fee must be a valid number: {fee_value!r}")
+    if not math.isfinite(fee) or fee < 0:
+        raise ValueError(f"Fee must be a non-negative number: {fee_value!r}")
+    try:
+        datetime.datetime.strptime(deadline, "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(f"Deadline must be YYYY-MM-DD: {deadline!r}")
+    return client_name, description, fee, deadline
+
+
+def import_deliveries(db, path, chunk_size=5000, max_errors=1000, progress=None):
+    """
+    Import deliveries from a CSV or JSONL file.
+    Each chunk of valid rows is written in one transaction; missing clients are
+    created through an in-memory name -> id map. Invalid rows are skipped and
+    reported in the result.
+    :param db: Database instance.
+    :param path: Path to the source file.
+    :param chunk_size: Number of rows per transaction.
+    :param max_errors: Maximum number of error messages to keep in the result.
+    :param progress: Optional callable receiving the ImportResult after each chunk.
+    :return: ImportResult.
+    """
+    result = ImportResult(max_errors)
+    client_ids = {client.name: client.id for client in db.get_all_clients()}
+    today = datetime.datetime.now().strftime("%Y-%m-%d")
+    start = time.perf_counter()
+
+    def flush(chunk):
+        with db.transaction():
+            for client_name, _, _, _ in chunk:
+                if client_name not in client_ids:
+                    client_ids[client_name] = db.insert_client(Client(name=client_name))
+                    result.clients_created += 1
+            db.add_deliveries_with_invoices(
+                (
+                    (client_ids[client_name], description, fee, deadline)
+                    for client_name, description, fee, deadline in chunk
+                ),
+                today
+            )
+        result.imported += len(chunk)
+        result.elapsed = time.perf_counter() - start
+        if progress:
+            progress(result)
+
+    chunk = []
+    for line_no, row in iter_rows(path):
+        try:
+            chunk.append(validate_row(row))
+        except ValueError as e:
+            result.add_error(line_no, str(e))
+            continue
+        if len(chunk) >= chunk_size:
+            flush(chunk)
+            chunk = []
+    if chunk:
+        flush(chunk)
+
+    result.elapsed = time.perf_counter() - start
+    return result
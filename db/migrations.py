@@ -0,0 +1,222 @@
+"""
+Schema migrations for the Delivery Management App.
+Tracks the schema version with PRAGMA user_version and applies
+ordered, idempotent migrations when the database is opened.
+"""
+
+import sqlite3
+from db.activity import install_activity_feed, install_feed_indexes
+from db.archive import install_archived_totals
+from db.rollups import install_dashboard_summary, install_monthly_earnings
+
+
+def _add_secondary_indexes(cursor):
+    """
+    Add indexes for the lookups the app runs on every view refresh.
+    """
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_clients_name ON clients(name)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_invoices_delivery_id ON invoices(delivery_id)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_invoices_paid ON invoices(paid)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deliveries_completed_deadline "
+        "ON deliveries(completed, deadline)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deliveries_completed_date "
+        "ON deliveries(completed_date)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_delivery_history_delivery_timestamp "
+        "ON delivery_history(delivery_id, timestamp)"
+    )
+
+
+# Rows sampled per index by ANALYZE, which keeps it to tens of
+# milliseconds on a million-row database
+ANALYSIS_LIMIT = 400
+
+# Tables whose statistics are refreshed once they grow this many times over
+STATISTICS_TABLES = ("clients", "deliveries", "invoices", "delivery_history")
+STATISTICS_GROWTH = 10
+
+
+def _analyze(cursor):
+    """
+    Gather table and index statistics for the query planner.
+    """
+    cursor.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+    cursor.execute("ANALYZE")
+
+
+def _add_delivery_search_index(cursor):
+    """
+    Add an FTS5 index over delivery descriptions and client names,
+    kept in sync with deliveries and clients by triggers.
+    Skipped when the SQLite build has no FTS5; searches then fall back to LIKE.
+    """
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS deliveries_fts USING fts5(
+                description,
+                client_name,
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+        """)
+    except sqlite3.OperationalError:
+        return
+    cursor.execute("DELETE FROM deliveries_fts")
+    cursor.execute("""
+        INSERT INTO deliveries_fts (rowid, description, client_name)
+        SELECT d.id, d.description, COALESCE(c.name, '')
+        FROM deliveries d
+        LEFT JOIN clients c ON c.id = d.client_id
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS deliveries_fts_insert
+        AFTER INSERT ON deliveries
+        BEGIN
+            INSERT INTO deliveries_fts (rowid, description, client_name)
+            VALUES (
+                new.id, new.description,
+                COALESCE((SELECT name FROM clients WHERE id = new.client_id), '')
+            );
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS deliveries_fts_update
+        AFTER UPDATE OF description, client_id ON deliveries
+        BEGIN
+            UPDATE deliveries_fts
+            SET description = new.description,
+                client_name = COALESCE(
+                    (SELECT name FROM clients WHERE id = new.client_id), ''
+                )
+            WHERE rowid = new.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS deliveries_fts_delete
+        AFTER DELETE ON deliveries
+        BEGIN
+            DELETE FROM deliveries_fts WHERE rowid = old.id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS clients_fts_rename
+        AFTER UPDATE OF name ON clients
+        BEGIN
+            UPDATE deliveries_fts SET client_name = new.name
+            WHERE rowid IN (SELECT id FROM deliveries WHERE client_id = new.id);
+        END
+    """)
+
+
+def _add_pagination_indexes(cursor):
+    """
+    Add indexes matching the keyset pagination orders (the rowid is implied).
+    """
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deliveries_deadline ON deliveries(deadline)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_invoices_date ON invoices(date)")
+
+
+def _add_completion_date_covering_index(cursor):
+    """
+    Replace the completed_date index with one that also covers the completed
+    flag, so date-range activity counts never touch the table rows.
+    """
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deliveries_completed_date_completed "
+        "ON deliveries(completed_date, completed)"
+    )
+    cursor.execute("DROP INDEX IF EXISTS idx_deliveries_completed_date")
+
+
+# Ordered list of (version, migration). Never reorder or renumber entries;
+# append new migrations with the next version number.
+MIGRATIONS = [
+    (1, _add_secondary_indexes),
+    (2, _analyze),
+    (3, _add_delivery_search_index),
+    (4, _add_pagination_indexes),
+    (5, install_dashboard_summary),
+    (6, install_monthly_earnings),
+    (7, _add_completion_date_covering_index),
+    (8, install_archived_totals),
+    (9, install_activity_feed),
+    (10, install_feed_indexes),
+]
+
+
+def get_schema_version(conn):
+    """
+    Return the schema version stored in the database.
+    :param conn: Database connection.
+    :return: Current schema version (0 for a fresh database).
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(conn):
+    """
+    Apply every migration newer than the stored schema version.
+    Each migration runs in its own transaction together with the version bump,
+    so a failure leaves the database at the last successful version.
+    Statistics are gathered again once any migration ran.
+    :param conn: Database connection.
+    :return: Schema version after migrating.
+    """
+    version = get_schema_version(conn)
+    applied = False
+    for target, migration in MIGRATIONS:
+        if target <= version:
+            continue
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            migration(cursor)
+            # PRAGMA does not accept bound parameters; target is an int from MIGRATIONS
+            cursor.execute(f"PRAGMA user_version = {int(target)}")
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        version = target
+        applied = True
+    if applied:
+        # New indexes have no statistics until the next ANALYZE
+        _analyze(conn.cursor())
+        conn.commit()
+    return version
+
+
+def refresh_statistics(conn):
+    """
+    Re-run ANALYZE when one of the main tables has grown STATISTICS_GROWTH
+    times over since it was last analyzed. Statistics gathered on a new,
+    empty database would otherwise stay in place however large it gets.
+    The row count comes from the largest rowid, which is one index lookup.
+    :param conn: Database connection.
+    :return: True if the statistics were refreshed.
+    """
+    cursor = conn.cursor()
+    analyzed = {}
+    if cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+    ).fetchone():
+        for table, stat in cursor.execute(
+            "SELECT tbl, stat FROM sqlite_stat1 WHERE idx IS NOT NULL"
+        ):
+            rows = int(stat.split()[0])
+            analyzed[table] = max(analyzed.get(table, 0), rows)
+    for table in STATISTICS_TABLES:
+        rows = cursor.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+        if rows > analyzed.get(table, 0) * STATISTICS_GROWTH:
+            _analyze(cursor)
+            conn.commit()
+            return True
+    return False
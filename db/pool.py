@@ -0,0 +1,141 @@
+"""
+Read-only connection pool for the Delivery Management App.
+Lets any thread run queries against the database file while writes stay
+on the Database's dedicated writer connection.
+"""
+
+import pathlib
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from db.tracing import TracingConnection
+
+
+class ReaderPool:
+    """
+    A bounded pool of read-only SQLite connections that any thread can check out.
+    Connections are opened lazily, up to max_size.
+    """
+
+    def __init__(self, db_file, max_size=4, mmap_size=0, cache_size=0):
+        """
+        Initialize the pool without opening any connection yet.
+        :param db_file: Path to the SQLite database file.
+        :param max_size: Maximum number of open reader connections.
+        :param mmap_size: PRAGMA mmap_size for each reader, in bytes.
+        :param cache_size: PRAGMA cache_size for each reader (negative = KiB).
+        """
+        self.uri = f"{pathlib.Path(db_file).resolve().as_uri()}?mode=ro"
+        self.max_size = max_size
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self._idle = queue.LifoQueue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.trace_callback = None
+        self.statement_callback = None
+        self.attachments = {}
+
+    def connect(self):
+        """
+        Open and configure a new read-only connection.
+        """
+        conn = sqlite3.connect(
+            self.uri, uri=True, check_same_thread=False, factory=TracingConnection
+        )
+        conn.execute("PRAGMA query_only = ON")
+        conn.set_trace_callback(self.trace_callback)
+        conn.statement_callback = self.statement_callback
+        for alias, uri in self.attachments.items():
+            conn.execute("ATTACH DATABASE ? AS " + alias, (uri,))
+        if self.mmap_size:
+            conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        if self.cache_size:
+            conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        return conn
+
+    def set_trace_callback(self, callback):
+        """
+        Install a SQL trace callback on every pooled connection, including
+        ones opened later.
+        :param callback: Callable receiving each SQL statement, or None to remove.
+        """
+        with self._lock:
+            self.trace_callback = callback
+            for conn in self._all:
+                conn.set_trace_callback(callback)
+
+    def set_statement_callback(self, callback):
+        """
+        Install a statement callback (see db.tracing) on every pooled
+        connection, including ones opened later.
+        :param callback: Callable receiving each SQL statement, or None to remove.
+        """
+        with self._lock:
+            self.statement_callback = callback
+            for conn in self._all:
+                conn.statement_callback = callback
+
+    def attach(self, db_file, alias):
+        """
+        Attach another database file, read-only, to every pooled connection,
+        including ones opened later.
+        :param db_file: Path to the SQLite database file to attach.
+        :param alias: Schema name to attach it under.
+        """
+        uri = f"{pathlib.Path(db_file).resolve().as_uri()}?mode=ro"
+        with self._lock:
+            self.attachments[alias] = uri
+            for conn in self._all:
+                conn.execute("ATTACH DATABASE ? AS " + alias, (uri,))
+
+    def acquire(self, timeout=None):
+        """
+        Check out a connection, opening a new one if the pool is not full.
+        :param timeout: Seconds to wait for a free connection (None waits forever).
+        :return: sqlite3.Connection.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Reader pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.max_size:
+                conn = self.connect()
+                self._all.append(conn)
+                return conn
+        return self._idle.get(timeout=timeout)
+
+    def release(self, conn):
+        """
+        Return a connection to the pool, ending any read transaction left open.
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Context manager that checks a connection out and returns it afterwards.
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """
+        Close every connection opened by the pool.
+        """
+        self._closed = True
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
@@ -0,0 +1,269 @@
+"""
+Trigger-maintained rollup tables for the Delivery Management App.
+The dashboard reads its KPIs from a single summary row, and the earnings
+chart from a per-month table, both kept exact by triggers on deliveries
+and invoices instead of scanning the base tables.
+Run as a script to verify (and optionally rebuild) the rollups:
+
+    python -m db.rollups my_database.db [--rebuild]
+"""
+
+import argparse
+
+SUMMARY_COLUMNS = [
+    "total_deliveries",
+    "completed_deliveries",
+    "pending_deliveries",
+    "earnings",
+    "unpaid_invoices",
+    "outstanding_amount",
+]
+
+# Recomputes every summary column from the base tables, in SUMMARY_COLUMNS order
+SUMMARY_RECOMPUTE_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM deliveries),
+        (SELECT COUNT(*) FROM deliveries WHERE completed = 1),
+        (SELECT COUNT(*) FROM deliveries WHERE completed = 0),
+        (SELECT COALESCE(SUM(fee), 0) FROM deliveries WHERE completed = 1),
+        (SELECT COUNT(*) FROM invoices WHERE paid = 0),
+        (SELECT COALESCE(SUM(amount), 0) FROM invoices WHERE paid = 0)
+"""
+
+# Expressions giving one row's contribution to each summary column
+_DELIVERY_DELTA = {
+    "total_deliveries": "1",
+    "completed_deliveries": "({r}.completed = 1)",
+    "pending_deliveries": "({r}.completed = 0)",
+    "earnings": "(CASE WHEN {r}.completed = 1 THEN {r}.fee ELSE 0 END)",
+}
+_INVOICE_DELTA = {
+    "unpaid_invoices": "({r}.paid = 0)",
+    "outstanding_amount": "(CASE WHEN {r}.paid = 0 THEN {r}.amount ELSE 0 END)",
+}
+
+
+def _summary_update(deltas, add=None, subtract=None):
+    """
+    Build an UPDATE of the summary row adding the contribution of the `add`
+    row alias and subtracting that of the `subtract` row alias.
+    """
+    assignments = []
+    for column, expr in deltas.items():
+        change = ""
+        if add:
+            change += f" + {expr.format(r=add)}"
+        if subtract:
+            change += f" - {expr.format(r=subtract)}"
+        assignments.append(f"{column} = {column}{change}")
+    return f"UPDATE dashboard_summary SET {', '.join(assignments)} WHERE id = 1;"
+
+
+def install_dashboard_summary(cursor):
+    """
+    Create the dashboard_summary table and its triggers, then fill it.
+    Safe to run more than once.
+    :param cursor: Cursor inside an open transaction.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dashboard_summary (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_deliveries INTEGER NOT NULL DEFAULT 0,
+            completed_deliveries INTEGER NOT NULL DEFAULT 0,
+            pending_deliveries INTEGER NOT NULL DEFAULT 0,
+            earnings REAL NOT NULL DEFAULT 0,
+            unpaid_invoices INTEGER NOT NULL DEFAULT 0,
+            outstanding_amount REAL NOT NULL DEFAULT 0
+        )
+    """)
+    triggers = {
+        "dashboard_summary_delivery_insert": (
+            "AFTER INSERT ON deliveries", _summary_update(_DELIVERY_DELTA, add="new")
+        ),
+        "dashboard_summary_delivery_delete": (
+            "AFTER DELETE ON deliveries", _summary_update(_DELIVERY_DELTA, subtract="old")
+        ),
+        "dashboard_summary_delivery_update": (
+            "AFTER UPDATE OF completed, fee ON deliveries",
+            _summary_update(_DELIVERY_DELTA, add="new", subtract="old")
+        ),
+        "dashboard_summary_invoice_insert": (
+            "AFTER INSERT ON invoices", _summary_update(_INVOICE_DELTA, add="new")
+        ),
+        "dashboard_summary_invoice_delete": (
+            "AFTER DELETE ON invoices", _summary_update(_INVOICE_DELTA, subtract="old")
+        ),
+        "dashboard_summary_invoice_update": (
+            "AFTER UPDATE OF paid, amount ON invoices",
+            _summary_update(_INVOICE_DELTA, add="new", subtract="old")
+        ),
+    }
+    for name, (event, statement) in triggers.items():
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name} {event}
+            BEGIN
+                {statement}
+            END
+        """)
+    rebuild_dashboard_summary(cursor)
+
+
+def rebuild_dashboard_summary(cursor):
+    """
+    Recompute the summary row from scratch.
+    :param cursor: Database cursor.
+    """
+    columns = ", ".join(SUMMARY_COLUMNS)
+    cursor.execute(f"""
+        INSERT OR REPLACE INTO dashboard_summary (id, {columns})
+        SELECT 1, * FROM ({SUMMARY_RECOMPUTE_SQL})
+    """)
+
+
+def verify_dashboard_summary(cursor):
+    """
+    Compare the stored summary row with a full recomputation.
+    Money columns are compared to the cent to ignore floating-point noise.
+    :param cursor: Database cursor.
+    :return: Dictionary {column: (stored, actual)} for every drifted column.
+    """
+    cursor.execute(f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM dashboard_summary WHERE id = 1")
+    stored = cursor.fetchone() or (None,) * len(SUMMARY_COLUMNS)
+    cursor.execute(SUMMARY_RECOMPUTE_SQL)
+    actual = cursor.fetchone()
+    drift = {}
+    for column, stored_value, actual_value in zip(SUMMARY_COLUMNS, stored, actual):
+        if stored_value is None or round(stored_value, 2) != round(actual_value, 2):
+            drift[column] = (stored_value, actual_value)
+    return drift
+
+
+# A delivery earns its fee in the month it was completed
+_EARNS = "{r}.completed = 1 AND {r}.completed_date IS NOT NULL AND {r}.completed_date <> ''"
+
+MONTHLY_EARNINGS_RECOMPUTE_SQL = f"""
+    SELECT substr(completed_date, 1, 7) AS month, SUM(fee), COUNT(*)
+    FROM deliveries
+    WHERE {_EARNS.format(r="deliveries")}
+    GROUP BY month
+    ORDER BY month
+"""
+
+
+def _monthly_add(r):
+    """Build the upsert adding row alias r to its completion month."""
+    return f"""
+        INSERT INTO monthly_earnings (month, earnings, deliveries)
+        SELECT substr({r}.completed_date, 1, 7), {r}.fee, 1 WHERE {_EARNS.format(r=r)}
+        ON CONFLICT (month) DO UPDATE SET
+            earnings = earnings + excluded.earnings,
+            deliveries = deliveries + 1;
+    """
+
+
+def _monthly_subtract(r):
+    """Build the update removing row alias r from its completion month."""
+    return f"""
+        UPDATE monthly_earnings
+        SET earnings = earnings - {r}.fee, deliveries = deliveries - 1
+        WHERE month = substr({r}.completed_date, 1, 7) AND {_EARNS.format(r=r)};
+        DELETE FROM monthly_earnings WHERE deliveries <= 0;
+    """
+
+
+def install_monthly_earnings(cursor):
+    """
+    Create the monthly_earnings table and its triggers, then fill it.
+    Safe to run more than once.
+    :param cursor: Cursor inside an open transaction.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS monthly_earnings (
+            month TEXT PRIMARY KEY,
+            earnings REAL NOT NULL DEFAULT 0,
+            deliveries INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    triggers = {
+        "monthly_earnings_delivery_insert": (
+            "AFTER INSERT ON deliveries", _monthly_add("new")
+        ),
+        "monthly_earnings_delivery_delete": (
+            "AFTER DELETE ON deliveries", _monthly_subtract("old")
+        ),
+        "monthly_earnings_delivery_update": (
+            "AFTER UPDATE OF completed, completed_date, fee ON deliveries",
+            _monthly_subtract("old") + _monthly_add("new")
+        ),
+    }
+    for name, (event, statements) in triggers.items():
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name} {event}
+            BEGIN
+                {statements}
+            END
+        """)
+    rebuild_monthly_earnings(cursor)
+
+
+def rebuild_monthly_earnings(cursor):
+    """
+    Recompute the monthly_earnings table from scratch with one GROUP BY.
+    :param cursor: Database cursor.
+    """
+    cursor.execute("DELETE FROM monthly_earnings")
+    cursor.execute(f"""
+        INSERT INTO monthly_earnings (month, earnings, deliveries)
+        {MONTHLY_EARNINGS_RECOMPUTE_SQL}
+    """)
+
+
+def verify_monthly_earnings(cursor):
+    """
+    Compare the stored monthly earnings with a full recomputation.
+    :param cursor: Database cursor.
+    :return: Dictionary {month: (stored, actual)} for every drifted month.
+    """
+    cursor.execute("SELECT month, earnings, deliveries FROM monthly_earnings")
+    stored = {row[0]: (round(row[1], 2), row[2]) for row in cursor.fetchall()}
+    cursor.execute(MONTHLY_EARNINGS_RECOMPUTE_SQL)
+    actual = {row[0]: (round(row[1], 2), row[2]) for row in cursor.fetchall()}
+    return {
+        month: (stored.get(month), actual.get(month))
+        for month in stored.keys() | actual.keys()
+        if stored.get(month) != actual.get(month)
+    }
+
+
+def main():
+    """
+    Command-line entry point: report rollup drift and optionally rebuild.
+    """
+    parser = argparse.ArgumentParser(description="Verify or rebuild dashboard rollups.")
+    parser.add_argument("db_file", help="Path to the SQLite database file")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Recompute the rollups from scratch"
+    )
+    args = parser.parse_args()
+
+    # Imported here: db.database imports this module through db.migrations
+    from db.database import Database
+
+    db = Database(args.db_file)
+    cursor = db.conn.cursor()
+    drift = verify_dashboard_summary(cursor)
+    drift.update(verify_monthly_earnings(cursor))
+    if not drift:
+        print("Rollups are consistent.")
+    for key, (stored, actual) in sorted(drift.items()):
+        print(f"{key}: stored={stored} actual={actual}")
+    if args.rebuild:
+        rebuild_dashboard_summary(cursor)
+        rebuild_monthly_earnings(cursor)
+        db.conn.commit()
+        print("Rollups rebuilt.")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
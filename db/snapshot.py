@@ -0,0 +1,114 @@
+"""
+Columnar NumPy snapshots for analytics in the Delivery Management App.
+Loads selected columns of deliveries and invoices straight into NumPy
+arrays and computes dashboard analytics with vectorized operations.
+"""
+
+import numpy as np
+
+# Days since 1970-01-01, or the int64 minimum (NaT) for NULL/invalid dates
+_DATE_SQL = "COALESCE(CAST(julianday({col}) - 2440587.5 AS INTEGER), -9223372036854775808)"
+
+# column name -> (SQL expression, NumPy storage dtype, final dtype)
+DELIVERY_COLUMNS = {
+    "id": ("id", "i8", "i8"),
+    "client_id": ("client_id", "i8", "i8"),
+    "fee": ("fee", "f8", "f8"),
+    "completed": ("COALESCE(completed = 1, 0)", "i1", "?"),
+    "deadline": (_DATE_SQL.format(col="deadline"), "i8", "datetime64[D]"),
+    "completed_date": (_DATE_SQL.format(col="completed_date"), "i8", "datetime64[D]"),
+}
+INVOICE_COLUMNS = {
+    "id": ("id", "i8", "i8"),
+    "delivery_id": ("delivery_id", "i8", "i8"),
+    "amount": ("amount", "f8", "f8"),
+    "paid": ("COALESCE(paid = 1, 0)", "i1", "?"),
+    "date": (_DATE_SQL.format(col="date"), "i8", "datetime64[D]"),
+}
+
+
+def load_columns(conn, table, columns, chunk_size=65536):
+    """
+    Load selected columns of deliveries or invoices into NumPy arrays.
+    Fees are float64, dates datetime64[D] (NaT when missing), completed/paid
+    bool and ids int64. Rows are fetched in chunks and ordered by id.
+    :param conn: Database connection.
+    :param table: 'deliveries' or 'invoices'.
+    :param columns: Sequence of column names to load.
+    :param chunk_size: Number of rows converted per fetchmany() call.
+    :return: Dictionary {column: numpy.ndarray}.
+    """
+    spec = {"deliveries": DELIVERY_COLUMNS, "invoices": INVOICE_COLUMNS}.get(table)
+    if spec is None:
+        raise ValueError(f"Unknown table: {table}")
+    unknown = set(columns) - set(spec)
+    if not columns or unknown:
+        raise ValueError(f"Unknown {table} columns: {sorted(unknown)}")
+
+    dtype = np.dtype([(name, spec[name][1]) for name in columns])
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT {', '.join(spec[name][0] for name in columns)} FROM {table} ORDER BY id"
+    )
+    chunks = []
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        chunks.append(np.array(rows, dtype=dtype))
+    data = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+    return {name: data[name].astype(spec[name][2]) for name in columns}
+
+
+def compute_kpis(deliveries, invoices):
+    """
+    Compute the dashboard KPIs with masked sums.
+    :param deliveries: Arrays with 'completed' and 'fee'.
+    :param invoices: Arrays with 'paid' and 'amount'.
+    :return: Dictionary with the same keys as AppController.get_dashboard_stats().
+    """
+    completed = deliveries["completed"]
+    unpaid = ~invoices["paid"]
+    return {
+        "total": int(completed.size),
+        "completed": int(np.count_nonzero(completed)),
+        "pending": int(completed.size - np.count_nonzero(completed)),
+        "earnings": float(deliveries["fee"][completed].sum()),
+        "unpaid": int(np.count_nonzero(unpaid)),
+        "outstanding": float(invoices["amount"][unpaid].sum()),
+    }
+
+
+def compute_earnings_by_month(deliveries):
+    """
+    Sum the fees of completed deliveries per completion month.
+    :param deliveries: Arrays with 'completed', 'completed_date' and 'fee'.
+    :return: Tuple (labels, values) with "YYYY-MM" labels in ascending order.
+    """
+    mask = deliveries["completed"] & ~np.isnat(deliveries["completed_date"])
+    months = deliveries["completed_date"][mask].astype("datetime64[M]")
+    unique_months, index = np.unique(months, return_inverse=True)
+    totals = np.bincount(
+        index, weights=deliveries["fee"][mask], minlength=unique_months.size
+    )
+    return [str(month) for month in unique_months], totals.tolist()
+
+
+def compute_daily_activity(deliveries, start_date, end_date):
+    """
+    Count completed deliveries per day between two dates (inclusive).
+    :param deliveries: Arrays with 'completed' and 'completed_date'.
+    :param start_date: First day (datetime.date).
+    :param end_date: Last day (datetime.date).
+    :return: Dictionary {datetime.date: count} for days with completions.
+    """
+    start = np.datetime64(start_date, "D")
+    end = np.datetime64(end_date, "D")
+    dates = deliveries["completed_date"]
+    mask = deliveries["completed"] & (dates >= start) & (dates <= end)
+    offsets = (dates[mask] - start).astype(np.int64)
+    counts = np.bincount(offsets, minlength=int((end - start).astype(np.int64)) + 1)
+    days = np.flatnonzero(counts)
+    return {
+        (start + int(day)).astype(object): int(counts[day]) for day in days
+    }
@@ -0,0 +1,74 @@
+"""
+Statement reporting for the Delivery Management App's connections.
+SQLite's trace callback fires again for every trigger step and once per
+executemany() row, so it cannot tell how many statements the application
+ran. TracingConnection reports each execute, executemany, executescript,
+commit and rollback call instead, to an optional statement_callback.
+"""
+
+import sqlite3
+
+
+class TracingCursor(sqlite3.Cursor):
+    """
+    Cursor that reports each statement it runs to its connection's
+    statement_callback.
+    """
+
+    def execute(self, sql, parameters=()):
+        """Report and run one statement."""
+        callback = self.connection.statement_callback
+        if callback is not None:
+            callback(sql)
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        """Report and run one statement for every parameter set, as one call."""
+        callback = self.connection.statement_callback
+        if callback is not None:
+            callback(sql)
+        return super().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        """Report and run a script, as one call."""
+        callback = self.connection.statement_callback
+        if callback is not None:
+            callback(sql_script)
+        return super().executescript(sql_script)
+
+
+class TracingConnection(sqlite3.Connection):
+    """
+    Connection (passed as sqlite3.connect's factory) whose statements,
+    commits and rollbacks are reported to statement_callback when it is set.
+    """
+
+    statement_callback = None
+
+    def cursor(self, factory=TracingCursor):
+        """Open a cursor, a TracingCursor by default."""
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        """Run one statement on a new cursor."""
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        """Run one statement for every parameter set on a new cursor."""
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        """Run a script on a new cursor."""
+        return self.cursor().executescript(sql_script)
+
+    def commit(self):
+        """Commit, reporting it if a transaction is open."""
+        if self.in_transaction and self.statement_callback is not None:
+            self.statement_callback("COMMIT")
+        super().commit()
+
+    def rollback(self):
+        """Roll back, reporting it if a transaction is open."""
+        if self.in_transaction and self.statement_callback is not None:
+            self.statement_callback("ROLLBACK")
+        super().rollback()
@@ -0,0 +1,293 @@
+"""
+Opt-in query tracing and latency instrumentation for the Delivery Management App.
+Records the SQL run by every Database method (through the connections'
+statement and trace callbacks, see db.tracing) and latency histograms
+and query counts for every AppController method, so slow calls and N+1
+query patterns stand out.
+"""
+
+import functools
+import json
+import re
+import threading
+import time
+from collections import deque
+
+# Methods that are not worth timing (context managers, lifecycle, plumbing)
+SKIP_METHODS = {
+    "close", "reader", "transaction", "set_trace_callback", "set_statement_callback",
+    "get_data_version", "submit", "get_cache_stats", "enable_instrumentation",
+}
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Collapse whitespace and replace literal values with '?', so the same
+    statement run with different values is counted as one.
+    """
+    return _SPACES.sub(" ", _LITERALS.sub("?", sql)).strip()
+
+
+def percentile(sorted_samples, fraction):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+class MethodStats:
+    """
+    Call count, recent latencies and query counts for one method.
+    Only the last max_samples latencies are kept for the percentiles.
+    """
+
+    def __init__(self, max_samples):
+        """
+        Initialize empty stats.
+        :param max_samples: Number of recent latencies kept.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.samples = deque(maxlen=max_samples)
+
+    def record(self, seconds, queries, failed):
+        """Add one call."""
+        self.calls += 1
+        self.errors += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.queries += queries
+        self.max_queries = max(self.max_queries, queries)
+        self.samples.append(seconds)
+
+    def to_dict(self):
+        """
+        Summarize as a JSON-friendly dictionary (times in ms).
+        """
+        samples = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "mean_ms": round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "queries_per_call": round(self.queries / self.calls, 2) if self.calls else 0.0,
+            "max_queries": self.max_queries,
+        }
+
+
+class Instrumentation:
+    """
+    Wraps the public methods of an AppController and its Database, and
+    traces every SQL statement they run.
+    Statement times are measured from one statement's execute call to the
+    next statement or the end of the Database method, so they include
+    fetching the rows. Safe to use from several threads.
+    """
+
+    def __init__(self, max_samples=1000):
+        """
+        Initialize empty statistics.
+        :param max_samples: Recent latencies kept per method for percentiles.
+        """
+        self.max_samples = max_samples
+        self.controller_stats = {}
+        self.database_stats = {}
+        # (database method, normalized SQL) -> [count, total seconds]
+        self.statements = {}
+        self.controller = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def install(self, controller):
+        """
+        Start recording calls on controller and controller.db.
+        :return: self.
+        """
+        self.controller = controller
+        self._wrap_methods(controller, self.controller_stats, self._wrap_controller)
+        self._wrap_methods(controller.db, self.database_stats, self._wrap_database)
+        controller.db.set_statement_callback(self._statement)
+        controller.db.set_trace_callback(self._trace)
+        return self
+
+    def uninstall(self):
+        """
+        Stop recording and restore the original methods.
+        """
+        if self.controller is None:
+            return
+        self.controller.db.set_statement_callback(None)
+        self.controller.db.set_trace_callback(None)
+        for obj in (self.controller, self.controller.db):
+            for name in list(vars(obj)):
+                if getattr(vars(obj)[name], "__instrumented__", False):
+                    delattr(obj, name)
+        self.controller = None
+
+    def _wrap_methods(self, obj, stats, wrap):
+        """
+        Replace each public method of obj with an instance attribute wrapper.
+        """
+        for name, attr in vars(type(obj)).items():
+            if name.startswith("_") or name in SKIP_METHODS:
+                continue
+            if not callable(attr) or isinstance(attr, (staticmethod, classmethod)):
+                continue
+            wrapper = wrap(name, getattr(obj, name), stats)
+            wrapper.__instrumented__ = True
+            setattr(obj, name, wrapper)
+
+    def _stats_for(self, stats, name):
+        """Return the MethodStats for name, creating it if needed."""
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = MethodStats(self.max_samples)
+        return entry
+
+    def _wrap_controller(self, name, method, stats):
+        """
+        Time a controller method and count the queries run during the call.
+        """
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            local = self._local
+            queries_before = getattr(local, "queries", 0)
+            start = time.perf_counter()
+            failed = False
+            try:
+                return method(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                queries = getattr(local, "queries", 0) - queries_before
+                with self._lock:
+                    self._stats_for(stats, name).record(elapsed, queries, failed)
+        return wrapper
+
+    def _wrap_database(self, name, method, stats):
+        """
+        Time a Database method and attribute the statements it runs to it.
+        """
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            local = self._local
+            outer = getattr(local, "method", None)
+            queries_before = getattr(local, "queries", 0)
+            local.method = name
+            local.statement = None
+            start = time.perf_counter()
+            failed = False
+            try:
+                return method(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                now = time.perf_counter()
+                queries = getattr(local, "queries", 0) - queries_before
+                with self._lock:
+                    self._finish_statement(local, now)
+                    self._stats_for(stats, name).record(now - start, queries, failed)
+                local.method = outer
+        return wrapper
+
+    def _statement(self, sql):
+        """
+        Statement callback: count a statement the application executes and
+        start timing it.
+        """
+        local = self._local
+        now = time.perf_counter()
+        method = getattr(local, "method", None)
+        key = (method or "(other)", normalize_sql(sql))
+        local.queries = getattr(local, "queries", 0) + 1
+        with self._lock:
+            self._finish_statement(local, now)
+            entry = self.statements.setdefault(key, [0, 0.0])
+            entry[0] += 1
+        # Statements outside a Database method are only counted
+        local.statement = (key, now) if method else None
+
+    def _trace(self, sql):
+        """
+        Trace callback: count the sub-statements virtual tables (e.g. FTS5)
+        run, reported as "-- ...". Their time belongs to the statement that
+        ran them and they are not queries of the call. Every other line is
+        a statement already reported to _statement, or a trigger step
+        repeating it.
+        """
+        if not sql.startswith("--"):
+            return
+        key = (getattr(self._local, "method", None) or "(other)", normalize_sql(sql))
+        with self._lock:
+            self.statements.setdefault(key, [0, 0.0])[0] += 1
+
+    def _finish_statement(self, local, now):
+        """
+        Charge the time since the running statement started to it.
+        Must be called with the lock held.
+        """
+        running = getattr(local, "statement", None)
+        if running is not None:
+            key, started = running
+            self.statements[key][1] += now - started
+            local.statement = None
+
+    def reset(self):
+        """Drop every recorded call and statement."""
+        with self._lock:
+            self.controller_stats.clear()
+            self.database_stats.clear()
+            self.statements.clear()
+
+    def stats(self):
+        """
+        Return all statistics as a JSON-friendly dictionary: per-method
+        summaries for the controller and database, and per-statement counts
+        and total times, slowest first.
+        """
+        with self._lock:
+            statements = [
+                {
+                    "method": method,
+                    "sql": sql,
+                    "count": count,
+                    "total_ms": round(seconds * 1000, 3),
+                    "mean_ms": round(seconds / count * 1000, 3) if count else 0.0,
+                }
+                for (method, sql), (count, seconds) in self.statements.items()
+            ]
+            return {
+                "controller": {
+                    name: entry.to_dict()
+                    for name, entry in sorted(self.controller_stats.items())
+                },
+                "database": {
+                    name: entry.to_dict()
+                    for name, entry in sorted(self.database_stats.items())
+                },
+                "statements": sorted(statements, key=lambda s: -s["total_ms"]),
+            }
+
+    def dump(self, path):
+        """
+        Write stats() to a JSON file.
+        :param path: Output file path.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
@@ -1,13 +1,72 @@
 """
 Entry point for the Delivery Management App.
 Initializes the controller and launches the main application window.
+
+    python main.py [--db my_database.db] [--archive FILE] [--profile [DIR]]
+
+--archive attaches an archive database created by db.archive; by default
+<db>.archive.db is attached when it exists.
+
+--profile (or DELIVERYAPP_PROFILE=<dir>) profiles startup, each view
+switch, refresh and button action in separate cProfile sections and
+writes .pstats files plus a hotspot summary to DIR on exit.
+Set DELIVERYAPP_TRACE to a file path to record query traces and method
+latencies from startup and write them there as JSON on exit.
 """
+import argparse
+import contextlib
+import os
+
 from app import DeliveryApp
 from controller import AppController
+from db.archive import default_archive_path
+
+
+def parse_args():
+    """
+    Parse the command-line options.
+    """
+    parser = argparse.ArgumentParser(description="Delivery Management App")
+    parser.add_argument(
+        "--db", default="my_database.db", help="Path to the SQLite database file"
+    )
+    parser.add_argument(
+        "--archive", metavar="FILE",
+        help="Archive database to attach (default: <db>.archive.db if it exists)"
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="profiles",
+        default=os.environ.get("DELIVERYAPP_PROFILE"), metavar="DIR",
+        help="Profile the app and write .pstats files to DIR (default: profiles)"
+    )
+    return parser.parse_args()
+
 
 if __name__== "__main__":
-    # Create the controller with the database file
-    controller= AppController(db_file="my_database.db")
-    # Initialize and run the main application
-    app= DeliveryApp(controller)
+    args = parse_args()
+    profiler = None
+    startup = contextlib.nullcontext()
+    if args.profile:
+        from profiling import Profiler
+        profiler = Profiler(args.profile)
+        startup = profiler.section("startup")
+
+    with startup:
+        # Create the controller with the database file
+        archive = args.archive
+        if archive is None and os.path.exists(default_archive_path(args.db)):
+            archive = default_archive_path(args.db)
+        controller= AppController(db_file=args.db, archive_file=archive)
+        trace_path = os.environ.get("DELIVERYAPP_TRACE")
+        if trace_path:
+            controller.enable_instrumentation()
+        # Initialize and run the main application
+        app= DeliveryApp(controller)
+        if profiler:
+            profiler.instrument_app(app)
     app.mainloop()
+    if trace_path:
+        controller.instrumentation.dump(trace_path)
+    if profiler:
+        print(profiler.write())
+        print(f"Profiles written to {os.path.abspath(profiler.output_dir)}")
@@ -9,6 +9,8 @@ class Client:
     Represents a client with an id and name.
     """
 
+    __slots__ = ("id", "name")
+
     def __init__(self, name, id=None):
         """
         Initialize a Client instance.
@@ -9,6 +9,11 @@ class Delivery:
     Represents a delivery with all relevant fields.
     """
 
+    __slots__ = (
+        "id", "client_id", "description", "completed", "fee", "deadline",
+        "completed_date"
+    )
+
     def __init__(
         self, id, client_id, description, completed, fee, deadline, completed_date=None
     ):
@@ -9,6 +9,8 @@ class Freelancer:
     Represents a freelancer with an id, name, and a list of deliveries.
     """
 
+    __slots__ = ("id", "name", "deliveries")
+
     def __init__(self, name, id=None):
         """
         Initialize a Freelancer instance.
@@ -9,6 +9,8 @@ class Invoice:
     Represents an invoice with id, delivery_id, amount, date, and paid status.
     """
 
+    __slots__ = ("id", "delivery_id", "amount", "date", "paid")
+
     def __init__(self, id, delivery_id, amount, date, paid=0):
         """
         Initialize an Invoice instance.
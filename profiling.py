@@ -0,0 +1,136 @@
+"""
+Built-in profiling mode for the Delivery Management App.
+Profiles startup, every view switch, data refresh and button action in
+its own cProfile section, and writes one .pstats file per section plus a
+summary of the top cumulative hotspots on exit.
+"""
+
+import contextlib
+import cProfile
+import functools
+import io
+import os
+import pstats
+import re
+
+# Frame methods profiled as their own sections: data refreshes, the
+# callbacks that render background-loaded data, and button actions
+FRAME_METHODS = (
+    "refresh_data", "render", "show_first_page", "load_next_page", "append_page",
+    "apply_filters",
+)
+# DeliveryApp methods bound to sidebar buttons or timers
+APP_METHODS = ("check_reminders", "poll_reminders", "show_export_dialog")
+
+
+class Profiler:
+    """
+    A set of named cProfile sections. Only one section records at a time:
+    entering a nested section pauses the enclosing one, so every function
+    call is charged to the innermost section.
+    """
+
+    def __init__(self, output_dir="profiles"):
+        """
+        Initialize an empty profiler.
+        :param output_dir: Directory the .pstats files and summary go to.
+        """
+        self.output_dir = output_dir
+        self.profiles = {}
+        self.calls = {}
+        self._stack = []
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """
+        Context manager profiling the block under section `name`.
+        """
+        profile = self.profiles.get(name)
+        if profile is None:
+            profile = self.profiles[name] = cProfile.Profile()
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self._stack:
+            self._stack[-1].disable()
+        self._stack.append(profile)
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1].enable()
+
+    def wrap(self, name, fn):
+        """
+        Return fn wrapped so each call is profiled under section `name`.
+        """
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self.section(name):
+                return fn(*args, **kwargs)
+        wrapper.__profiled__ = True
+        return wrapper
+
+    def instrument_object(self, obj, prefix, names):
+        """
+        Replace methods of obj with profiled wrappers, as instance
+        attributes, under sections "<prefix>.<method>".
+        :param names: Method names; names ending in "_action" are always added.
+        """
+        names = set(names) | {
+            name for name in dir(type(obj))
+            if name.endswith("_action") and callable(getattr(type(obj), name))
+        }
+        for name in names:
+            method = getattr(obj, name, None)
+            if method is not None and not getattr(method, "__profiled__", False):
+                setattr(obj, name, self.wrap(f"{prefix}.{name}", method))
+
+    def instrument_app(self, app):
+        """
+        Profile view switches (per frame), the frames' refreshes and actions,
+        and the app's button and timer handlers. Frames built later by
+        get_frame() are instrumented when they are created.
+        """
+        show_frame = app.show_frame
+        get_frame = app.get_frame
+
+        def profiled_show_frame(frame_name):
+            with self.section(f"show_frame.{frame_name}"):
+                return show_frame(frame_name)
+
+        def instrumented_get_frame(frame_name):
+            frame = get_frame(frame_name)
+            self.instrument_object(frame, frame_name, FRAME_METHODS)
+            return frame
+
+        app.show_frame = profiled_show_frame
+        app.get_frame = instrumented_get_frame
+        for frame_name, frame in app.frames.items():
+            self.instrument_object(frame, frame_name, FRAME_METHODS)
+        self.instrument_object(app, "DeliveryApp", APP_METHODS)
+
+    def write(self, top=15):
+        """
+        Write one .pstats file per section and summary.txt listing each
+        section's top cumulative hotspots.
+        :param top: Number of functions listed per section.
+        :return: The summary text.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        summary = io.StringIO()
+        for name, profile in sorted(self.profiles.items()):
+            filename = re.sub(r"[^\w.-]", "_", name) + ".pstats"
+            profile.dump_stats(os.path.join(self.output_dir, filename))
+
+            stats = pstats.Stats(profile, stream=summary)
+            summary.write(
+                f"=== {name}: {self.calls[name]} call(s), "
+                f"{stats.total_tt * 1000:.1f} ms total ({filename}) ===\n"
+            )
+            stats.sort_stats("cumulative").print_stats(top)
+        text = summary.getvalue()
+        with open(os.path.join(self.output_dir, "summary.txt"), "w", encoding="utf-8") as f:
+            f.write(text)
+        return text
@@ -0,0 +1,144 @@
+"""
+Reminder engine for the Delivery Management App.
+Keeps pending delivery deadlines in priority queues so due and overdue
+reminders can be updated in O(log n) per change, without rescanning
+the deliveries table.
+"""
+
+import datetime
+import heapq
+
+# Deliveries due within this many days are "due soon" (same threshold as the
+# yellow cards in the deliveries list)
+DUE_SOON_DAYS = 1
+
+
+class ReminderEngine:
+    """
+    Tracks pending deliveries by deadline and classifies them as upcoming,
+    due soon (deadline within DUE_SOON_DAYS) or overdue (deadline before today).
+    Heap entries are removed lazily: an entry is only acted on if it still
+    matches the delivery's current deadline.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty engine. Call load() to fill it.
+        """
+        self.deadlines = {}
+        self.soon = set()
+        self.overdue = set()
+        self._upcoming = []
+        self._soon_heap = []
+        self._today = None
+        self._new_notices = 0
+
+    def load(self, pending, today=None):
+        """
+        Replace the engine state with a fresh set of pending deliveries.
+        :param pending: Iterable of (delivery_id, deadline) for pending deliveries.
+        :param today: Current date (defaults to datetime.date.today()).
+        """
+        self.deadlines = dict(pending)
+        self.soon = set()
+        self.overdue = set()
+        self._upcoming = [(deadline, d_id) for d_id, deadline in self.deadlines.items()]
+        heapq.heapify(self._upcoming)
+        self._soon_heap = []
+        self._today = None
+        self.advance(today)
+        # Deliveries that were already due at load time are not "new"
+        self._new_notices = 0
+
+    def add(self, delivery_id, deadline):
+        """
+        Track a new (or re-scheduled) pending delivery.
+        """
+        self.remove(delivery_id)
+        self.deadlines[delivery_id] = deadline
+        heapq.heappush(self._upcoming, (deadline, delivery_id))
+        self.advance(self._today)
+
+    def update(self, delivery_id, deadline):
+        """
+        Change the deadline of a tracked delivery. Completed deliveries are ignored.
+        """
+        if delivery_id in self.deadlines and self.deadlines[delivery_id] != deadline:
+            self.add(delivery_id, deadline)
+
+    def remove(self, delivery_id):
+        """
+        Stop tracking a delivery (completed or deleted).
+        """
+        if self.deadlines.pop(delivery_id, None) is not None:
+            self.soon.discard(delivery_id)
+            self.overdue.discard(delivery_id)
+            self._compact()
+
+    def advance(self, today=None):
+        """
+        Move deliveries between stages as their deadlines approach.
+        Each delivery moves at most twice, so the amortised cost is O(log n).
+        :param today: Current date (defaults to datetime.date.today()).
+        """
+        today = today or datetime.date.today()
+        self._today = today
+        today_str = today.strftime("%Y-%m-%d")
+        soon_str = (today + datetime.timedelta(days=DUE_SOON_DAYS)).strftime("%Y-%m-%d")
+
+        while self._upcoming and self._upcoming[0][0] <= soon_str:
+            deadline, d_id = heapq.heappop(self._upcoming)
+            # Skip stale entries and duplicates of an already classified one
+            if (self.deadlines.get(d_id) != deadline
+                    or d_id in self.soon or d_id in self.overdue):
+                continue
+            self._new_notices += 1
+            if deadline < today_str:
+                self.overdue.add(d_id)
+            else:
+                self.soon.add(d_id)
+                heapq.heappush(self._soon_heap, (deadline, d_id))
+
+        while self._soon_heap and self._soon_heap[0][0] < today_str:
+            deadline, d_id = heapq.heappop(self._soon_heap)
+            if d_id in self.soon and self.deadlines.get(d_id) == deadline:
+                self.soon.discard(d_id)
+                self.overdue.add(d_id)
+                self._new_notices += 1
+
+    def _compact(self):
+        """
+        Drop stale heap entries once they outnumber the live ones.
+        """
+        if len(self._upcoming) + len(self._soon_heap) > 2 * len(self.deadlines) + 64:
+            self._upcoming = [
+                (deadline, d_id) for deadline, d_id in self._upcoming
+                if self.deadlines.get(d_id) == deadline
+                and d_id not in self.soon and d_id not in self.overdue
+            ]
+            heapq.heapify(self._upcoming)
+            self._soon_heap = [
+                (deadline, d_id) for deadline, d_id in self._soon_heap
+                if d_id in self.soon and self.deadlines.get(d_id) == deadline
+            ]
+            heapq.heapify(self._soon_heap)
+
+    def summary(self):
+        """
+        Count the deliveries in each reminder stage.
+        :return: Dictionary with 'overdue', 'due_today' and 'due_soon' counts.
+        """
+        today_str = self._today.strftime("%Y-%m-%d") if self._today else ""
+        due_today = sum(1 for d_id in self.soon if self.deadlines[d_id] == today_str)
+        return {
+            "overdue": len(self.overdue),
+            "due_today": due_today,
+            "due_soon": len(self.soon) - due_today,
+        }
+
+    def pop_new_notices(self):
+        """
+        Return how many deliveries became due soon or overdue since the last call.
+        """
+        count, self._new_notices = self._new_notices, 0
+        return count
@@ -0,0 +1,222 @@
+"""
+Tests for the activity feed and history compaction (db.activity).
+"""
+
+import datetime
+import os
+import tempfile
+import unittest
+
+from controller import AppController
+from db.activity import compact_history
+
+BULK_TIMESTAMP = "2024-05-01 12:00:00"
+
+
+class ActivityTestCase(unittest.TestCase):
+    """
+    A controller on a fresh database file.
+    """
+
+    def setUp(self):
+        """
+        Create the controller and two deliveries.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.controller = AppController(os.path.join(self.tmpdir.name, "test.db"))
+        self.db = self.controller.db
+        self.delivery_ids = [
+            self.controller.create_delivery_with_invoice("Ana", "Logo", 100, "2024-06-01"),
+            self.controller.create_delivery_with_invoice("Ben", "Poster", 50, "2024-06-02"),
+        ]
+
+    def tearDown(self):
+        """
+        Close the controller and remove the database.
+        """
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def add_events(self, rows):
+        """
+        Insert history rows with fixed timestamps.
+        :param rows: Iterable of (delivery_id, action, timestamp) tuples.
+        """
+        self.db.conn.executemany(
+            "INSERT INTO delivery_history (delivery_id, action, timestamp) VALUES (?, ?, ?)",
+            rows
+        )
+        self.db.conn.commit()
+
+    def expected_feed(self, action=None):
+        """
+        Every history row in feed order, by a plain ordered scan.
+        """
+        where = "WHERE action = ?" if action else ""
+        return self.db.conn.execute(f"""
+            SELECT id, delivery_id, action, timestamp FROM delivery_history {where}
+            ORDER BY timestamp DESC, id DESC
+        """, (action,) if action else ()).fetchall()
+
+    def walk_feed(self, page_size, **filters):
+        """
+        Read the whole feed through Database.get_activity_page().
+        """
+        rows, before = [], None
+        while True:
+            page = self.db.get_activity_page(before, page_size, **filters)
+            rows += [row[:4] for row in page]
+            if len(page) < page_size:
+                return rows
+            before = (page[-1][3], page[-1][0])
+
+
+class ActivityPageTest(ActivityTestCase):
+    """
+    Keyset pagination of the feed.
+    """
+
+    def test_pages_across_shared_timestamp(self):
+        """
+        Pages split inside a run of events sharing one timestamp lose and
+        repeat nothing.
+        """
+        first, second = self.delivery_ids
+        self.add_events(
+            [(first, "Edited", BULK_TIMESTAMP) for _ in range(95)]
+            + [(second, "Completed", BULK_TIMESTAMP) for _ in range(40)]
+            + [(first, "Paid", f"2024-04-{day:02d} 09:00:00") for day in range(1, 21)]
+        )
+        expected = self.expected_feed()
+        for page_size in (1, 7, 50, 200):
+            self.assertEqual(self.walk_feed(page_size), expected)
+
+    def test_pages_with_action_filter(self):
+        """
+        Filtered pages follow the same order as the filtered table.
+        """
+        first, second = self.delivery_ids
+        self.add_events(
+            [(first, "Edited", BULK_TIMESTAMP) for _ in range(30)]
+            + [(second, "Edited", BULK_TIMESTAMP) for _ in range(30)]
+            + [(second, "Paid", BULK_TIMESTAMP) for _ in range(30)]
+        )
+        self.assertEqual(
+            self.walk_feed(8, action="Edited"), self.expected_feed("Edited")
+        )
+
+    def test_controller_cursor_walk(self):
+        """
+        The controller's cursors return every entry exactly once.
+        """
+        first = self.delivery_ids[0]
+        self.add_events([(first, "Edited", BULK_TIMESTAMP) for _ in range(23)])
+        entries, cursor = [], None
+        while True:
+            page, cursor = self.controller.get_activity_page(cursor, 5)
+            entries += page
+            if cursor is None:
+                break
+        self.assertEqual(len(entries), len(self.expected_feed()))
+        self.assertTrue(all(entry["kind"] == "event" for entry in entries))
+
+    def test_deleted_delivery_keeps_history(self):
+        """
+        Deleting a delivery keeps its events and adds a "Deleted" entry;
+        the feed shows them without a description.
+        """
+        deleted = self.delivery_ids[0]
+        self.controller.mark_delivery_as_completed(deleted)
+        self.controller.delete_delivery(deleted)
+        entries, _ = self.controller.get_activity_page(None, 50)
+        events = [entry for entry in entries if entry["delivery_id"] == deleted]
+        self.assertEqual(
+            sorted(entry["action"] for entry in events),
+            ["Completed", "Created", "Deleted"]
+        )
+        self.assertTrue(all(entry["description"] is None for entry in events))
+
+
+class CompactHistoryTest(ActivityTestCase):
+    """
+    Rolling old events up into delivery_history_daily.
+    """
+
+    def setUp(self):
+        """
+        Add old events over ten days on top of the recent "Created" ones.
+        """
+        super().setUp()
+        first, second = self.delivery_ids
+        self.old_events = []
+        for day in range(1, 11):
+            for hour in range(day):
+                self.old_events.append(
+                    (first, "Edited", f"2023-01-{day:02d} {hour:02d}:00:00")
+                )
+            self.old_events.append((second, "Paid", f"2023-01-{day:02d} 23:00:00"))
+        self.add_events(self.old_events)
+        self.today = datetime.date.today()
+
+    def daily_counts(self):
+        """
+        Rows of delivery_history_daily as {(day, action): events}.
+        """
+        rows = self.db.conn.execute(
+            "SELECT day, action, events FROM delivery_history_daily"
+        ).fetchall()
+        return {(day, action): events for day, action, events in rows}
+
+    def test_compacts_old_events_into_daily_counts(self):
+        """
+        Old events become per-day counts; recent events stay untouched.
+        """
+        recent = self.db.conn.execute(
+            "SELECT COUNT(*) FROM delivery_history WHERE timestamp >= '2024'"
+        ).fetchone()[0]
+        result = compact_history(self.db, days=30, batch_size=7, today=self.today)
+
+        self.assertEqual(result.events, len(self.old_events))
+        self.assertEqual(result.days, 10)
+        self.assertEqual(result.batches, -(-len(self.old_events) // 7))
+        expected = {}
+        for _, action, timestamp in self.old_events:
+            key = (timestamp[:10], action)
+            expected[key] = expected.get(key, 0) + 1
+        self.assertEqual(self.daily_counts(), expected)
+        remaining = self.db.conn.execute("SELECT COUNT(*) FROM delivery_history").fetchone()[0]
+        self.assertEqual(remaining, recent)
+
+    def test_second_run_counts_nothing_twice(self):
+        """
+        A run with nothing left to compact changes no counts.
+        """
+        compact_history(self.db, days=30, today=self.today)
+        counts = self.daily_counts()
+        result = compact_history(self.db, days=30, today=self.today)
+        self.assertEqual(result.events, 0)
+        self.assertEqual(self.daily_counts(), counts)
+
+    def test_feed_continues_with_summaries(self):
+        """
+        After compaction the feed lists the recent events, then the daily
+        summaries, newest day first.
+        """
+        self.controller.compact_history(days=30)
+        entries, cursor = [], None
+        while True:
+            page, cursor = self.controller.get_activity_page(cursor, 3)
+            entries += page
+            if cursor is None:
+                break
+        kinds = [entry["kind"] for entry in entries]
+        self.assertEqual(kinds, ["event"] * 2 + ["summary"] * 20)
+        summaries = entries[2:]
+        self.assertEqual(summaries[0]["day"], "2023-01-10")
+        self.assertEqual(
+            sum(entry["events"] for entry in summaries), len(self.old_events)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for hot/cold archival (db.archive): archiving must not change the
+lifetime totals, the monthly earnings or what an export including the
+archive writes, even when a run stops between its two transactions.
+"""
+
+import os
+import tempfile
+import unittest
+from contextlib import contextmanager
+
+from controller import AppController
+from db.archive import archive_union
+from db.exporter import export_csv
+
+
+class ArchiveTest(unittest.TestCase):
+    """
+    archive_deliveries() through AppController.archive_old_deliveries().
+    """
+
+    def setUp(self):
+        """
+        Create twenty deliveries: twelve completed, ten of them paid, and
+        eight of those completed in 2020.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.controller = AppController(
+            os.path.join(self.tmpdir.name, "test.db"),
+            archive_file=os.path.join(self.tmpdir.name, "test.archive.db")
+        )
+        self.db = self.controller.db
+        self.ids = self.controller.create_deliveries_with_invoices([
+            (f"Client {i % 4}", f"Delivery {i}", 10 + i * 2.5, f"2024-{i % 12 + 1:02d}-10")
+            for i in range(20)
+        ])
+        for i, delivery_id in enumerate(self.ids[:12]):
+            self.controller.mark_delivery_as_completed(delivery_id)
+            if i < 10:
+                invoice_id = self.db.conn.execute(
+                    "SELECT id FROM invoices WHERE delivery_id = ?", (delivery_id,)
+                ).fetchone()[0]
+                self.controller.mark_invoice_as_paid(invoice_id)
+        # Two old ones keep an unpaid invoice and must stay hot
+        self.old_ids = self.ids[:8] + self.ids[10:12]
+        for i, delivery_id in enumerate(self.old_ids):
+            self.db.conn.execute(
+                "UPDATE deliveries SET completed_date = ? WHERE id = ?",
+                (f"2020-{i % 3 + 1:02d}-15", delivery_id)
+            )
+        self.db.conn.commit()
+
+    def tearDown(self):
+        """
+        Close the controller and remove the databases.
+        """
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def snapshot(self):
+        """
+        Everything archival must preserve: the lifetime summary, the monthly
+        earnings and the CSV exports including the archive.
+        """
+        exports = {}
+        for kind in ("deliveries", "invoices"):
+            path = os.path.join(self.tmpdir.name, f"{kind}.csv")
+            export_csv(self.db.conn, kind, path, include_archive=True)
+            with open(path, encoding="utf-8") as f:
+                exports[kind] = f.read()
+        return (
+            self.db.get_dashboard_summary(),
+            self.db.get_total_earnings_by_month(),
+            exports,
+        )
+
+    def hot_ids(self):
+        """
+        IDs of the deliveries left in the hot table.
+        """
+        return {row[0] for row in self.db.conn.execute("SELECT id FROM main.deliveries")}
+
+    def test_archive_preserves_totals_and_exports(self):
+        """
+        Only completed, fully paid, old deliveries move, in several batches,
+        and nothing visible changes.
+        """
+        before = self.snapshot()
+        result = self.controller.archive_old_deliveries(months=12, batch_size=3)
+
+        self.assertEqual(result.deliveries, 8)
+        self.assertEqual(result.invoices, 8)
+        self.assertEqual(result.batches, 3)
+        self.assertEqual(self.hot_ids(), set(self.ids) - set(self.ids[:8]))
+        self.assertEqual(self.snapshot(), before)
+        self.assertEqual(self.db.verify_dashboard_summary(), {})
+
+        again = self.controller.archive_old_deliveries(months=12)
+        self.assertEqual(again.deliveries, 0)
+        self.assertEqual(self.snapshot(), before)
+
+    def test_interrupted_run_is_completed_by_the_next(self):
+        """
+        A run stopped after copying a batch, before removing it from the hot
+        tables, leaves the totals and exports unchanged, and the next run
+        finishes the job without counting anything twice.
+        """
+        before = self.snapshot()
+        transaction = self.db.transaction
+        entered = []
+
+        @contextmanager
+        def interrupted_transaction():
+            entered.append(1)
+            if len(entered) == 2:
+                raise RuntimeError("interrupted")
+            with transaction():
+                yield
+
+        self.db.transaction = interrupted_transaction
+        with self.assertRaises(RuntimeError):
+            self.controller.archive_old_deliveries(months=12, batch_size=5)
+        del self.db.transaction
+
+        copied = self.db.conn.execute("SELECT COUNT(*) FROM archive.deliveries").fetchone()[0]
+        self.assertEqual(copied, 5)
+        self.assertEqual(len(self.hot_ids()), 20)
+        self.assertEqual(self.snapshot(), before)
+        union_ids = [
+            row[0] for row in self.db.conn.execute(
+                f"SELECT id FROM {archive_union('deliveries')}"
+            )
+        ]
+        self.assertEqual(sorted(union_ids), sorted(self.ids))
+
+        result = self.controller.archive_old_deliveries(months=12, batch_size=5)
+        self.assertEqual(result.deliveries, 8)
+        self.assertEqual(self.snapshot(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
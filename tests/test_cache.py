@@ -0,0 +1,144 @@
+"""
+Tests for the query cache (cache.py) and its use by AppController.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from cache import QueryCache
+from controller import AppController
+
+
+class QueryCacheTest(unittest.TestCase):
+    """
+    QueryCache on its own.
+    """
+
+    def test_hit_returns_stored_result(self):
+        """
+        A second lookup at the same version does not recompute.
+        """
+        cache = QueryCache()
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(cache.get_or_compute("key", 1, compute), 1)
+        self.assertEqual(cache.get_or_compute("key", 1, compute), 1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_version_change_clears_everything(self):
+        """
+        A lookup at a new version drops every entry, not just its own key.
+        """
+        cache = QueryCache()
+        cache.get_or_compute("a", 1, lambda: "a1")
+        cache.get_or_compute("b", 1, lambda: "b1")
+        self.assertEqual(cache.get_or_compute("a", 2, lambda: "a2"), "a2")
+        self.assertEqual(cache.get_or_compute("b", 2, lambda: "b2"), "b2")
+        stats = cache.stats()
+        self.assertEqual(stats["invalidations"], 1)
+        self.assertEqual(stats["entries"], 2)
+
+    def test_result_of_superseded_version_is_not_stored(self):
+        """
+        A result computed while another lookup moved the version on is
+        returned but not cached.
+        """
+        cache = QueryCache()
+
+        def compute():
+            cache.get_or_compute("other", 2, lambda: "new")
+            return "old"
+
+        self.assertEqual(cache.get_or_compute("key", 1, compute), "old")
+        self.assertEqual(cache.get_or_compute("key", 2, lambda: "fresh"), "fresh")
+
+    def test_lru_eviction(self):
+        """
+        The least recently used entry is evicted first.
+        """
+        cache = QueryCache(max_entries=2)
+        cache.get_or_compute("a", 1, lambda: "a")
+        cache.get_or_compute("b", 1, lambda: "b")
+        cache.get_or_compute("a", 1, lambda: "unused")
+        cache.get_or_compute("c", 1, lambda: "c")
+        self.assertEqual(cache.get_or_compute("a", 1, lambda: "recomputed"), "a")
+        self.assertEqual(cache.get_or_compute("b", 1, lambda: "recomputed"), "recomputed")
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+
+class ControllerCacheTest(unittest.TestCase):
+    """
+    @cached reads and @invalidates writes on AppController.
+    """
+
+    def setUp(self):
+        """
+        Create a controller with two deliveries.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.tmpdir.name, "test.db")
+        self.controller = AppController(self.db_file)
+        self.delivery_ids = self.controller.create_deliveries_with_invoices([
+            ("Ana", "Logo", 100, "2024-06-01"),
+            ("Ben", "Poster", 50, "2024-06-02"),
+        ])
+
+    def tearDown(self):
+        """
+        Close the controller and remove the database.
+        """
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def test_repeated_read_is_served_from_cache(self):
+        """
+        Without writes, a cached read returns the very same result object.
+        """
+        first = self.controller.get_dashboard_stats()
+        self.assertIs(self.controller.get_dashboard_stats(), first)
+
+    def test_controller_write_evicts_dependent_reads(self):
+        """
+        A write through the controller makes the next reads recompute.
+        """
+        stats = self.controller.get_dashboard_stats()
+        rows = self.controller.get_all_deliveries_for_view()
+        self.controller.mark_delivery_as_completed(self.delivery_ids[0])
+
+        self.assertEqual(self.controller.get_dashboard_stats()["completed"], stats["completed"] + 1)
+        completed = [
+            row["delivery"].completed for row in self.controller.get_all_deliveries_for_view()
+        ]
+        self.assertIsNot(self.controller.get_all_deliveries_for_view(), rows)
+        self.assertEqual(completed, [1, 0])
+
+    def test_failed_write_still_invalidates(self):
+        """
+        A write that raises still bumps the version.
+        """
+        version = self.controller.get_data_version()
+        with self.assertRaises(ValueError):
+            self.controller.create_delivery_with_invoice("Ana", "Bad fee", "n/a", "2024-06-01")
+        self.assertNotEqual(self.controller.get_data_version(), version)
+
+    def test_commit_by_another_connection_is_seen(self):
+        """
+        A commit made outside the controller changes SQLite's data_version,
+        so cached reads are recomputed.
+        """
+        total = self.controller.count_invoices()
+        other = sqlite3.connect(self.db_file)
+        other.execute(
+            "INSERT INTO invoices (delivery_id, amount, date, paid) VALUES (?, 10, '2024-06-03', 0)",
+            (self.delivery_ids[0],)
+        )
+        other.commit()
+        other.close()
+        self.assertEqual(self.controller.count_invoices(), total + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the maintenance command-line entry points:
+python -m db.archive and python -m db.activity.
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from controller import AppController
+from db.archive import default_archive_path
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_module(module, *args):
+    """
+    Run `python -m module args...` from the repository root.
+    :return: Completed process with text output.
+    """
+    return subprocess.run(
+        [sys.executable, "-m", module, *args],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60, check=True
+    )
+
+
+class CommandLineTest(unittest.TestCase):
+    """
+    The CLIs against a database built through the controller.
+    """
+
+    def setUp(self):
+        """
+        Build a database with six deliveries, four of them completed and
+        paid in 2020, and history events from 2020.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_file = os.path.join(self.tmpdir.name, "shop.db")
+        controller = AppController(self.db_file)
+        db = controller.db
+        ids = controller.create_deliveries_with_invoices([
+            ("Ana", f"Delivery {i}", 10 * (i + 1), "2020-01-20") for i in range(6)
+        ])
+        for delivery_id in ids[:4]:
+            controller.mark_delivery_as_completed(delivery_id)
+        db.conn.execute("UPDATE invoices SET paid = 1 WHERE delivery_id IN (?, ?, ?, ?)", ids[:4])
+        db.conn.execute(
+            "UPDATE deliveries SET completed_date = '2020-01-15' WHERE completed = 1"
+        )
+        db.conn.executemany(
+            "INSERT INTO delivery_history (delivery_id, action, timestamp) VALUES (?, ?, ?)",
+            [(ids[5], "Edited", f"2020-02-{day:02d} 10:00:00") for day in range(1, 11)]
+        )
+        db.conn.commit()
+        self.summary = db.get_dashboard_summary()
+        controller.close()
+
+    def tearDown(self):
+        """
+        Remove the databases.
+        """
+        self.tmpdir.cleanup()
+
+    def query(self, sql, db_file=None):
+        """
+        Run one query on a fresh connection and return the first row.
+        """
+        conn = sqlite3.connect(db_file or self.db_file)
+        try:
+            return conn.execute(sql).fetchone()
+        finally:
+            conn.close()
+
+    def test_archive_cli(self):
+        """
+        python -m db.archive moves the old, paid deliveries into the default
+        archive file and keeps the lifetime totals.
+        """
+        output = run_module("db.archive", self.db_file, "--months", "12", "--vacuum").stdout
+        self.assertIn("deliveries=4", output)
+        self.assertIn("Hot database compacted.", output)
+
+        archive_file = default_archive_path(self.db_file)
+        self.assertTrue(os.path.exists(archive_file))
+        self.assertEqual(self.query("SELECT COUNT(*) FROM deliveries"), (2,))
+        self.assertEqual(self.query("SELECT COUNT(*) FROM deliveries", archive_file), (4,))
+        controller = AppController(self.db_file, archive_file=archive_file)
+        try:
+            self.assertEqual(controller.db.get_dashboard_summary(), self.summary)
+        finally:
+            controller.close()
+
+    def test_activity_cli(self):
+        """
+        python -m db.activity compacts old history into daily counts.
+        """
+        output = run_module("db.activity", self.db_file, "--days", "365", "--vacuum").stdout
+        self.assertIn("events=10", output)
+        self.assertIn("days=10", output)
+        self.assertIn("Database compacted.", output)
+        self.assertEqual(
+            self.query("SELECT COUNT(*) FROM delivery_history WHERE timestamp < '2021'"), (0,)
+        )
+        self.assertEqual(self.query("SELECT SUM(events) FROM delivery_history_daily"), (10,))
+
+        again = run_module("db.activity", self.db_file, "--days", "365").stdout
+        self.assertIn("events=0", again)
+
+
+if __name__ == "__main__":
+    unittest.main()
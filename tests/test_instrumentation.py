@@ -0,0 +1,89 @@
+"""
+Tests for query instrumentation (instrumentation.py): statements are
+counted once per execute call, whatever SQLite's trace callback reports.
+"""
+
+import os
+import tempfile
+import unittest
+
+from controller import AppController
+
+
+class InstrumentationTest(unittest.TestCase):
+    """
+    Query counts recorded through an instrumented AppController.
+    """
+
+    def setUp(self):
+        """
+        Create an instrumented controller with one delivery.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.controller = AppController(os.path.join(self.tmpdir.name, "test.db"))
+        self.delivery_id = self.controller.create_delivery_with_invoice(
+            "Ana", "Logo", 100, "2024-06-01"
+        )
+        self.instrumentation = self.controller.enable_instrumentation()
+        self.instrumentation.reset()
+
+    def tearDown(self):
+        """
+        Close the controller and remove the database.
+        """
+        self.instrumentation.uninstall()
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def statement_count(self, method, sql_prefix):
+        """
+        How many times method ran statements starting with sql_prefix.
+        """
+        return sum(
+            entry["count"] for entry in self.instrumentation.stats()["statements"]
+            if entry["method"] == method and entry["sql"].startswith(sql_prefix)
+        )
+
+    def test_identical_statements_are_each_counted(self):
+        """
+        The same statement run twice in a row by one method is two queries.
+        """
+        conn = self.controller.db.conn
+
+        def count_twice():
+            for _ in range(2):
+                conn.execute("SELECT COUNT(*) FROM deliveries").fetchone()
+
+        wrapper = self.instrumentation._wrap_database(
+            "count_twice", count_twice, self.instrumentation.database_stats
+        )
+        wrapper()
+        stats = self.instrumentation.stats()["database"]["count_twice"]
+        self.assertEqual(stats["max_queries"], 2)
+        self.assertEqual(self.statement_count("count_twice", "SELECT COUNT(*)"), 2)
+
+    def test_executemany_is_one_query(self):
+        """
+        A batch insert is one query however many rows it writes.
+        """
+        self.controller.create_deliveries_with_invoices([
+            ("Ana", f"Delivery {i}", 10, "2024-06-02") for i in range(5)
+        ])
+        self.assertEqual(
+            self.statement_count("add_deliveries_with_invoices", "INSERT INTO deliveries"), 1
+        )
+
+    def test_trigger_steps_are_not_queries(self):
+        """
+        The rollup and search triggers fired by an update are not counted as
+        queries of the call; only the UPDATE and its COMMIT are.
+        """
+        self.controller.db.update_delivery(self.delivery_id, "Logo v2", 120, "2024-06-03")
+        stats = self.instrumentation.stats()["database"]["update_delivery"]
+        self.assertEqual(stats["max_queries"], 2)
+        self.assertEqual(self.statement_count("update_delivery", "UPDATE deliveries"), 1)
+        self.assertEqual(self.statement_count("update_delivery", "COMMIT"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
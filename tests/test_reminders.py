@@ -0,0 +1,167 @@
+"""
+Tests for the reminder engine (reminders.py).
+"""
+
+import datetime
+import os
+import tempfile
+import unittest
+
+from controller import AppController
+from reminders import DUE_SOON_DAYS, ReminderEngine
+
+TODAY = datetime.date(2024, 6, 10)
+
+
+def day(offset):
+    """
+    The date `offset` days from TODAY, as stored in the deliveries table.
+    """
+    return (TODAY + datetime.timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+class ReminderEngineTest(unittest.TestCase):
+    """
+    ReminderEngine with a fixed current date.
+    """
+
+    def setUp(self):
+        """
+        Load one overdue, one due today, one due at the DUE_SOON_DAYS
+        boundary and one later delivery.
+        """
+        self.engine = ReminderEngine()
+        self.engine.load(
+            [(1, day(-1)), (2, day(0)), (3, day(DUE_SOON_DAYS)), (4, day(DUE_SOON_DAYS + 1))],
+            today=TODAY
+        )
+
+    def test_load_classifies_by_deadline(self):
+        """
+        The last day within DUE_SOON_DAYS is due soon; the next one is not.
+        """
+        self.assertEqual(self.engine.overdue, {1})
+        self.assertEqual(self.engine.soon, {2, 3})
+        self.assertEqual(
+            self.engine.summary(), {"overdue": 1, "due_today": 1, "due_soon": 1}
+        )
+        self.assertEqual(self.engine.pop_new_notices(), 0)
+
+    def test_advance_moves_deliveries_on(self):
+        """
+        A day later every delivery moves one stage, each counted once.
+        """
+        self.engine.advance(TODAY + datetime.timedelta(days=1))
+        self.assertEqual(self.engine.overdue, {1, 2})
+        self.assertEqual(self.engine.soon, {3, 4})
+        self.assertEqual(self.engine.pop_new_notices(), 2)
+        self.assertEqual(self.engine.pop_new_notices(), 0)
+
+    def test_reschedule_later_leaves_due_soon(self):
+        """
+        Moving a due-soon or overdue deadline into the future drops it
+        from its stage until it comes due again.
+        """
+        self.engine.update(2, day(5))
+        self.engine.update(1, day(6))
+        self.assertEqual(self.engine.overdue, set())
+        self.assertEqual(self.engine.soon, {3})
+        self.engine.advance(TODAY + datetime.timedelta(days=5))
+        self.assertEqual(self.engine.soon, {1, 2})
+        self.assertEqual(self.engine.overdue, {3, 4})
+
+    def test_reschedule_earlier_becomes_due(self):
+        """
+        Moving a later deadline to yesterday makes it overdue at once.
+        """
+        self.engine.update(4, day(-1))
+        self.assertEqual(self.engine.overdue, {1, 4})
+        self.assertEqual(self.engine.pop_new_notices(), 1)
+
+    def test_unchanged_deadline_is_not_counted_twice(self):
+        """
+        Saving a delivery without changing its deadline adds no notice.
+        """
+        self.engine.update(4, day(DUE_SOON_DAYS + 1))
+        self.engine.advance(TODAY + datetime.timedelta(days=1))
+        self.assertEqual(self.engine.pop_new_notices(), 2)
+        self.assertIn(4, self.engine.soon)
+
+    def test_remove_and_untracked_update(self):
+        """
+        Removed deliveries leave every stage; updating one is ignored.
+        """
+        self.engine.remove(1)
+        self.engine.remove(2)
+        self.engine.update(1, day(0))
+        self.assertEqual(self.engine.overdue, set())
+        self.assertEqual(self.engine.soon, {3})
+        self.engine.advance(TODAY + datetime.timedelta(days=3))
+        self.assertEqual(self.engine.overdue, {3, 4})
+
+    def test_many_removals_compact_heaps(self):
+        """
+        Stale heap entries are dropped once they outnumber live ones.
+        """
+        engine = ReminderEngine()
+        engine.load([(d_id, day(10 + d_id % 30)) for d_id in range(200)], today=TODAY)
+        for d_id in range(190):
+            engine.remove(d_id)
+        self.assertLessEqual(len(engine._upcoming), 2 * len(engine.deadlines) + 64)
+        engine.advance(TODAY + datetime.timedelta(days=60))
+        self.assertEqual(engine.overdue, set(range(190, 200)))
+
+
+class ControllerRemindersTest(unittest.TestCase):
+    """
+    The controller keeps the engine in step with its writes.
+    """
+
+    def setUp(self):
+        """
+        Create a controller with deliveries due yesterday, today and later.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.controller = AppController(os.path.join(self.tmpdir.name, "test.db"))
+        today = datetime.date.today()
+        self.ids = self.controller.create_deliveries_with_invoices([
+            ("Ana", "Overdue", 10, (today - datetime.timedelta(days=1)).isoformat()),
+            ("Ana", "Today", 10, today.isoformat()),
+            ("Ben", "Later", 10, (today + datetime.timedelta(days=30)).isoformat()),
+        ])
+        self.engine = self.controller.reminders
+
+    def tearDown(self):
+        """
+        Close the controller and remove the database.
+        """
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def test_complete_and_delete_remove_reminders(self):
+        """
+        Completed and deleted deliveries are no longer reminded of.
+        """
+        overdue, due_today, later = self.ids
+        self.controller.mark_delivery_as_completed(overdue)
+        self.controller.delete_delivery(due_today)
+        self.assertEqual(self.engine.overdue, set())
+        self.assertEqual(self.engine.soon, set())
+        self.assertEqual(set(self.engine.deadlines), {later})
+
+    def test_edit_reschedules(self):
+        """
+        Editing the deadline moves the delivery between stages.
+        """
+        overdue, _, later = self.ids
+        today = datetime.date.today()
+        self.controller.update_delivery(later, "Later", 10, today.isoformat())
+        self.controller.update_delivery(
+            overdue, "Overdue", 10, (today + datetime.timedelta(days=30)).isoformat()
+        )
+        self.assertEqual(self.engine.overdue, set())
+        self.assertIn(later, self.engine.soon)
+
+
+if __name__ == "__main__":
+    unittest.main()
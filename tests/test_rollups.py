@@ -0,0 +1,136 @@
+"""
+Tests for the trigger-maintained rollups (db.rollups): after every kind of
+write, the dashboard summary and monthly earnings must match a full
+recomputation from the base tables.
+"""
+
+import os
+import tempfile
+import unittest
+
+from controller import AppController
+from db.rollups import SUMMARY_COLUMNS
+
+
+class RollupTest(unittest.TestCase):
+    """
+    dashboard_summary and monthly_earnings against verify_*() recomputes.
+    """
+
+    def setUp(self):
+        """
+        Create a controller with an archive attached and a few deliveries.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.controller = AppController(
+            os.path.join(self.tmpdir.name, "test.db"),
+            archive_file=os.path.join(self.tmpdir.name, "test.archive.db")
+        )
+        self.db = self.controller.db
+        self.delivery_ids = self.controller.create_deliveries_with_invoices([
+            ("Ana", "Logo", 100, "2024-06-01"),
+            ("Ben", "Poster", 50.5, "2024-06-02"),
+            ("Ana", "Flyer", 20, "2024-06-03"),
+            ("Cleo", "Banner", 75.25, "2024-06-04"),
+        ])
+
+    def tearDown(self):
+        """
+        Close the controller and remove the databases.
+        """
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def assertRollupsExact(self):
+        """
+        Both rollups equal their recomputation from the base tables.
+        """
+        self.assertEqual(self.db.verify_dashboard_summary(), {})
+        self.assertEqual(self.db.verify_monthly_earnings(), {})
+
+    def invoice_id(self, delivery_id):
+        """
+        ID of the invoice created with a delivery.
+        """
+        return self.db.conn.execute(
+            "SELECT id FROM invoices WHERE delivery_id = ?", (delivery_id,)
+        ).fetchone()[0]
+
+    def test_every_write_keeps_rollups_exact(self):
+        """
+        Insert, complete, pay, edit and delete, checking after each step.
+        """
+        self.assertRollupsExact()
+        first, second, third, fourth = self.delivery_ids
+
+        self.controller.create_delivery_with_invoice("Dan", "Sticker", 12, "2024-07-01")
+        self.assertRollupsExact()
+
+        self.controller.mark_delivery_as_completed(first)
+        self.controller.mark_delivery_as_completed(second)
+        self.assertRollupsExact()
+
+        self.controller.mark_invoice_as_paid(self.invoice_id(first))
+        self.assertRollupsExact()
+
+        # Editing the fee of a completed delivery changes its earnings
+        self.controller.update_delivery(second, "Poster A2", 80, "2024-06-05")
+        self.assertRollupsExact()
+
+        self.controller.delete_delivery(third)
+        self.controller.delete_delivery(second)
+        self.assertRollupsExact()
+
+        summary = self.db.get_dashboard_summary()
+        self.assertEqual(summary["total_deliveries"], 3)
+        self.assertEqual(summary["completed_deliveries"], 1)
+        self.assertEqual(summary["earnings"], 100)
+        self.assertEqual(summary["unpaid_invoices"], 2)
+        self.assertAlmostEqual(summary["outstanding_amount"], 87.25)
+        self.assertIn(fourth, [row[0] for row in self.db.conn.execute(
+            "SELECT id FROM deliveries"
+        )])
+
+    def test_archive_keeps_lifetime_totals(self):
+        """
+        Archiving leaves the hot rollups exact and the lifetime totals unchanged.
+        """
+        first, second = self.delivery_ids[:2]
+        for delivery_id in (first, second):
+            self.controller.mark_delivery_as_completed(delivery_id)
+            self.controller.mark_invoice_as_paid(self.invoice_id(delivery_id))
+        self.db.conn.execute(
+            "UPDATE deliveries SET completed_date = '2020-03-15' WHERE id IN (?, ?)",
+            (first, second)
+        )
+        self.db.conn.commit()
+        before = self.db.get_dashboard_summary()
+        earnings_before = self.db.get_total_earnings_by_month()
+
+        result = self.controller.archive_old_deliveries(months=12)
+
+        self.assertEqual(result.deliveries, 2)
+        self.assertRollupsExact()
+        self.assertEqual(self.db.get_dashboard_summary(), before)
+        self.assertEqual(self.db.get_total_earnings_by_month(), earnings_before)
+        hot = self.db.get_dashboard_summary(include_archive=False)
+        self.assertEqual(hot["total_deliveries"], before["total_deliveries"] - 2)
+
+    def test_missing_summary_row_is_recomputed_read_only(self):
+        """
+        Without the summary row, reads on a pooled read-only connection
+        return the recomputed totals instead of failing on a write.
+        """
+        self.controller.mark_delivery_as_completed(self.delivery_ids[0])
+        expected = self.db.get_dashboard_summary()
+        self.db.conn.execute("DELETE FROM dashboard_summary")
+        self.db.conn.commit()
+
+        summary = self.controller.submit(self.db.get_dashboard_summary).result()
+
+        self.assertEqual(summary, expected)
+        self.assertEqual(sorted(summary), sorted(SUMMARY_COLUMNS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests for the single-query view loaders of AppController.
+Their results are compared with the per-row lookups they replaced, on a
+database holding orphaned invoices and a delivery of a deleted client.
+"""
+
+import os
+import tempfile
+import unittest
+
+from controller import AppController
+from models.client import Client
+from models.delivery import Delivery
+
+
+def delivery_fields(delivery):
+    """
+    Field values of a Delivery, for comparison.
+    """
+    return tuple(getattr(delivery, name) for name in Delivery.__slots__)
+
+
+def invoice_fields(invoice):
+    """
+    Field values of an Invoice, for comparison.
+    """
+    return (invoice.id, invoice.delivery_id, invoice.amount, invoice.date, invoice.paid)
+
+
+class ViewLoaderTest(unittest.TestCase):
+    """
+    get_all_deliveries_for_view() and get_invoices_for_view() against the
+    per-row lookups they replaced.
+    """
+
+    def setUp(self):
+        """
+        Build a database with clients, deliveries and invoices, then delete
+        a client and some deliveries behind the app's back, leaving a delivery
+        without client and invoices without delivery.
+        """
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.controller = AppController(os.path.join(self.tmpdir.name, "test.db"))
+        db = self.controller.db
+        client_ids = [db.insert_client(Client(name)) for name in ("Ana", "Ben", "Cleo")]
+        delivery_ids = []
+        for i in range(12):
+            delivery_ids.append(db.add_delivery(Delivery(
+                None, client_ids[i % 3], f"Delivery {i}", i % 2, 10.0 * i,
+                f"2024-0{i % 9 + 1}-15", f"2024-0{i % 9 + 1}-10" if i % 2 else None
+            )))
+        for i, delivery_id in enumerate(delivery_ids):
+            db.add_invoice(delivery_id, 10.0 * i, f"2024-01-{i + 1:02d}")
+
+        # Direct deletes, so the invoices and deliveries stay behind
+        db.conn.execute("DELETE FROM clients WHERE id = ?", (client_ids[1],))
+        db.conn.execute(
+            "DELETE FROM deliveries WHERE id IN (?, ?)", (delivery_ids[0], delivery_ids[5])
+        )
+        db.conn.execute(
+            "INSERT INTO invoices (delivery_id, amount, date, paid) VALUES (?, ?, ?, ?)",
+            (9999, 5.0, "2024-02-01", 1)
+        )
+        db.conn.commit()
+
+    def tearDown(self):
+        """
+        Close the controller and remove the database.
+        """
+        self.controller.close()
+        self.tmpdir.cleanup()
+
+    def test_deliveries_match_per_row_lookup(self):
+        """
+        Deliveries carry the client name, or "Unknown Client" once the client is gone.
+        """
+        db = self.controller.db
+        expected = []
+        for d in db.get_all_deliveries():
+            client = db.get_client_by_id(d.client_id)
+            expected.append((
+                delivery_fields(d), client.name if client else "Unknown Client"
+            ))
+        expected.sort()
+
+        actual = sorted(
+            (delivery_fields(row["delivery"]), row["client_name"])
+            for row in self.controller.get_all_deliveries_for_view()
+        )
+        self.assertEqual(actual, expected)
+        self.assertIn("Unknown Client", [name for _, name in actual])
+
+    def test_invoices_match_per_row_lookup(self):
+        """
+        Invoices carry the client name and delivery description, or
+        "N/A" / "Delivery not found" once the delivery is gone.
+        """
+        db = self.controller.db
+        expected = []
+        for invoice in db.get_all_invoices():
+            delivery = db.get_delivery_by_id(invoice.delivery_id)
+            if delivery:
+                client = db.get_client_by_id(delivery.client_id)
+                client_name = client.name if client else "Unknown Client"
+                delivery_desc = delivery.description
+            else:
+                client_name = "N/A"
+                delivery_desc = "Delivery not found"
+            expected.append((invoice_fields(invoice), client_name, delivery_desc))
+
+        actual = [
+            (invoice_fields(row["invoice"]), row["client_name"], row["delivery_desc"])
+            for row in self.controller.get_invoices_for_view()
+        ]
+        self.assertEqual(actual, expected)
+        self.assertEqual(
+            sum(1 for _, _, desc in actual if desc == "Delivery not found"), 3
+        )
+        self.assertIn("Unknown Client", [name for _, name, _ in actual])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,251 @@
+"""
+Frame for the activity feed in the Delivery Management App.
+Shows the create, edit, complete, paid and delete events of all deliveries,
+newest first, with action and date filters. Pages are loaded on demand.
+"""
+
+import datetime
+import customtkinter as ctk
+from tkinter import messagebox
+from views.background import PAGE, BackgroundLoader
+
+ACTION_ICONS = {
+    "Created": "➕",
+    "Edited": "✏️",
+    "Completed": "✅",
+    "Paid": "💸",
+    "Deleted": "🗑",
+}
+
+
+class ActivityRow(ctk.CTkFrame):
+    """
+    One line of the feed: an event, or the daily count of compacted events.
+    """
+
+    def __init__(self, master, fonts):
+        """
+        Create the row widgets.
+        :param master: Parent widget.
+        :param fonts: Dictionary of shared CTkFont objects.
+        """
+        super().__init__(master, border_width=1, border_color="#3b3b3b")
+        self.entry = None
+        self.grid_columnconfigure(0, weight=1)
+        self.text_label = ctk.CTkLabel(self, text="", font=fonts["text"], anchor="w")
+        self.text_label.grid(row=0, column=0, padx=15, pady=8, sticky="ew")
+        self.time_label = ctk.CTkLabel(
+            self, text="", font=fonts["time"], text_color="gray60"
+        )
+        self.time_label.grid(row=0, column=1, padx=15, pady=8, sticky="e")
+
+    def show(self, entry):
+        """
+        Display a feed entry, unless it is already shown.
+        :param entry: Event or summary dictionary from AppController.get_activity_page().
+        """
+        if entry == self.entry:
+            return
+        self.entry = entry
+        icon = ACTION_ICONS.get(entry["action"], "•")
+        if entry["kind"] == "summary":
+            text = f"{icon} {entry['events']} × {entry['action']} (summarized)"
+            self.text_label.configure(text=text, text_color="gray70")
+            self.time_label.configure(text=entry["day"])
+            return
+        if entry["description"] is None:
+            subject = f"Delivery #{entry['delivery_id']}"
+        else:
+            subject = (
+                f'Delivery #{entry["delivery_id"]} "{entry["description"]}"'
+                f" · {entry['client_name'] or 'Unknown Client'}"
+            )
+        self.text_label.configure(
+            text=f"{icon} {entry['action']}: {subject}", text_color=("gray10", "gray90")
+        )
+        self.time_label.configure(text=entry["timestamp"])
+
+
+class ActivityFrame(ctk.CTkFrame):
+    """
+    Frame for the 'Activity' view.
+    Row widgets are reused across refreshes; only rows whose entry changed
+    are reconfigured.
+    """
+
+    PAGE_SIZE = 50
+
+    def __init__(self, master, controller):
+        """
+        Initialize the frame and create widgets.
+        """
+        super().__init__(master, fg_color="transparent")
+        self.controller = controller
+        self.loader = BackgroundLoader(self, controller, "activity")
+        self.rows = []
+        self.shown = 0
+        self.filters = {}
+        self.next_cursor = None
+        self.load_more_btn = None
+        self.create_widgets()
+
+    def create_widgets(self):
+        """
+        Create and layout all widgets for the activity view.
+        """
+        self.title_label = ctk.CTkLabel(
+            self,
+            text="📜 Activity",
+            font=ctk.CTkFont(size=28, weight="bold"),
+            text_color="#00b894"
+        )
+        self.title_label.pack(pady=(0, 10), padx=10, anchor="w")
+
+        filter_frame = ctk.CTkFrame(self, fg_color="transparent")
+        filter_frame.pack(fill="x", padx=10, pady=(0, 10))
+        self.action_menu = ctk.CTkOptionMenu(
+            filter_frame, values=["All"] + list(ACTION_ICONS), width=130
+        )
+        self.action_menu.grid(row=0, column=0, padx=(0, 10))
+        self.start_entry = ctk.CTkEntry(
+            filter_frame, width=120, placeholder_text="From YYYY-MM-DD"
+        )
+        self.start_entry.grid(row=0, column=1, padx=5)
+        self.end_entry = ctk.CTkEntry(
+            filter_frame, width=120, placeholder_text="To YYYY-MM-DD"
+        )
+        self.end_entry.grid(row=0, column=2, padx=5)
+        ctk.CTkButton(
+            filter_frame, text="Apply", width=80, command=lambda: self.apply_filters()
+        ).grid(row=0, column=3, padx=5)
+
+        self.fonts = {
+            "text": ctk.CTkFont(family="Segoe UI", size=14),
+            "time": ctk.CTkFont(family="Segoe UI", size=12),
+        }
+
+        self.scrollable_frame = ctk.CTkScrollableFrame(
+            self, fg_color="transparent"
+        )
+        self.scrollable_frame.pack(fill="both", expand=True, padx=10, pady=5)
+
+        self.rows_frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        self.rows_frame.pack(fill="x")
+        self.empty_label = ctk.CTkLabel(
+            self.scrollable_frame, text="No activity found.", font=("Segoe UI", 14)
+        )
+
+    def apply_filters(self):
+        """
+        Read the filter widgets and reload the feed from the newest entry.
+        """
+        filters = {"action": None, "start_date": None, "end_date": None}
+        action = self.action_menu.get()
+        if action != "All":
+            filters["action"] = action
+        for key, entry in (("start_date", self.start_entry), ("end_date", self.end_entry)):
+            value = entry.get().strip()
+            if not value:
+                continue
+            try:
+                datetime.datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format.")
+                return
+            filters[key] = value
+        self.filters = filters
+        self.shown = 0
+        self.refresh_data()
+
+    def refresh_data(self):
+        """
+        Reload as many entries as are currently shown on a worker thread;
+        more pages are fetched on demand.
+        """
+        limit = max(self.PAGE_SIZE, self.shown)
+        filters = dict(self.filters)
+        self.loader.submit(
+            lambda: self.controller.get_activity_page(None, limit, **filters),
+            self.show_first_page,
+            self.on_load_error
+        )
+
+    def show_first_page(self, page):
+        """
+        Show the first entries of the feed, reusing the existing rows.
+        :param page: Tuple (entries, next cursor) from the controller.
+        """
+        # A page requested before this refresh would follow the old rows
+        self.loader.cancel(PAGE)
+        entries, self.next_cursor = page
+        self.shown = 0
+        self.show_entries(entries)
+        for row in self.rows[self.shown:]:
+            row.destroy()
+        del self.rows[self.shown:]
+        if self.shown:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=20)
+        self.update_load_more()
+
+    def show_entries(self, entries):
+        """
+        Display entries after the ones already shown, creating rows as needed.
+        """
+        for entry in entries:
+            if self.shown == len(self.rows):
+                row = ActivityRow(self.rows_frame, self.fonts)
+                row.pack(fill="x", pady=3, padx=10)
+                self.rows.append(row)
+            self.rows[self.shown].show(entry)
+            self.shown += 1
+
+    def load_next_page(self):
+        """
+        Fetch the next page of the feed on a worker thread and append it.
+        """
+        cursor = self.next_cursor
+        filters = dict(self.filters)
+        self.load_more_btn.configure(state="disabled", text="Loading…")
+        self.loader.submit(
+            lambda: self.controller.get_activity_page(cursor, self.PAGE_SIZE, **filters),
+            self.append_page,
+            self.on_load_error,
+            channel=PAGE
+        )
+
+    def append_page(self, page):
+        """
+        Append a loaded page to the feed.
+        :param page: Tuple (entries, next cursor) from the controller.
+        """
+        entries, self.next_cursor = page
+        self.show_entries(entries)
+        self.update_load_more()
+
+    def on_load_error(self, error):
+        """
+        Re-enable the "Load more" button after a failed fetch.
+        :param error: Exception raised by the fetch.
+        """
+        if self.load_more_btn is not None:
+            self.update_load_more()
+
+    def update_load_more(self):
+        """
+        Show the "Load more" button while older entries are available.
+        """
+        if self.next_cursor is None:
+            if self.load_more_btn is not None:
+                self.load_more_btn.destroy()
+                self.load_more_btn = None
+            return
+        text = f"Load more ({self.shown} shown)"
+        if self.load_more_btn is None:
+            self.load_more_btn = ctk.CTkButton(
+                self.scrollable_frame, text=text, command=lambda: self.load_next_page()
+            )
+            self.load_more_btn.pack(pady=10)
+        else:
+            self.load_more_btn.configure(state="normal", text=text)
@@ -0,0 +1,103 @@
+"""
+Background data loading for the views of the Delivery Management App.
+Runs controller queries on worker threads and hands the results back to
+the Tk main loop, discarding results superseded by a newer request, and
+shows a "Loading…" label and error messages for the view.
+"""
+
+import customtkinter as ctk
+from tkinter import messagebox
+
+# Request channels. A request only supersedes older ones on its channel,
+# so fetching the next page never drops a pending refresh.
+REFRESH = "refresh"
+PAGE = "page"
+
+
+class BackgroundLoader:
+    """
+    Submits data fetches through the controller's worker pool and delivers
+    the results on the Tk thread by polling with after().
+    Only the most recent request of each channel is delivered; older ones
+    are dropped. The "Loading…" label is shown while a refresh is pending
+    and is always removed when it completes, fails or is cancelled.
+    """
+
+    POLL_MS = 20
+
+    def __init__(self, widget, controller, subject="data"):
+        """
+        Initialize the loader.
+        :param widget: Tk widget used to schedule after() callbacks and show the label.
+        :param controller: AppController whose submit() runs the fetches.
+        :param subject: What the view loads, for error messages ("invoices").
+        """
+        self.widget = widget
+        self.controller = controller
+        self.subject = subject
+        self.generations = {}
+        self.pending = set()
+        self.loading_label = None
+
+    def submit(self, fetch, on_done, on_error=None, channel=REFRESH):
+        """
+        Run fetch() on a worker thread, then on_done(result) on the Tk thread.
+        fetch must not touch any widget. If it raises, on_error(error) runs
+        and the error is reported in a message box.
+        :param fetch: Zero-argument callable that queries the controller.
+        :param on_done: Callable receiving the result, run on the Tk thread.
+        :param on_error: Optional callable receiving the exception, to reset view state.
+        :param channel: REFRESH or PAGE; supersedes older requests on that channel.
+        """
+        generation = self.generations.get(channel, 0) + 1
+        self.generations[channel] = generation
+        self.pending.add(channel)
+        self.update_label()
+        future = self.controller.submit(fetch)
+        self.widget.after(
+            0, self._poll, channel, generation, future, on_done, on_error
+        )
+
+    def cancel(self, channel):
+        """
+        Drop the pending request of a channel, if any.
+        """
+        self.generations[channel] = self.generations.get(channel, 0) + 1
+        self.pending.discard(channel)
+        self.update_label()
+
+    def update_label(self):
+        """
+        Show the "Loading…" label while a refresh is pending.
+        """
+        if REFRESH in self.pending:
+            if self.loading_label is None:
+                self.loading_label = ctk.CTkLabel(
+                    self.widget, text="Loading…", text_color="gray60"
+                )
+            self.loading_label.place(relx=1.0, x=-10, y=5, anchor="ne")
+            self.loading_label.lift()
+        elif self.loading_label is not None:
+            self.loading_label.place_forget()
+
+    def _poll(self, channel, generation, future, on_done, on_error):
+        """
+        Deliver the result once the future is done, unless it was superseded.
+        """
+        if generation != self.generations[channel]:
+            future.cancel()
+            return
+        if not future.done():
+            self.widget.after(
+                self.POLL_MS, self._poll, channel, generation, future, on_done, on_error
+            )
+            return
+        self.pending.discard(channel)
+        self.update_label()
+        error = future.exception()
+        if error is None:
+            on_done(future.result())
+            return
+        if on_error:
+            on_error(error)
+        messagebox.showerror("Error", f"Could not load {self.subject}: {error}")
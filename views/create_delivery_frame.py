@@ -119,7 +119,7 @@ class CreateDeliveryFrame(ctk.CTkFrame):
             self,
             text="Create Delivery",
             font=font_button,
-            command=self.create_delivery_action
+            command=lambda: self.create_delivery_action()
         )
         create_btn.grid(row=5, column=0, columnspan=2, pady=20)
 
@@ -6,9 +6,11 @@ Displays summary cards and charts for deliveries and activity.
 import customtkinter as ctk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.transforms import Bbox
 import calendar
 import numpy as np
 import datetime
+from views.background import BackgroundLoader
 
 
 class DashboardFrame(ctk.CTkFrame):
@@ -22,6 +24,7 @@ class DashboardFrame(ctk.CTkFrame):
         """
         super().__init__(master, fg_color="transparent")
         self.controller = controller
+        self.loader = BackgroundLoader(self, controller, "the dashboard")
         self.create_widgets()
 
     def create_widgets(self):
@@ -80,6 +83,60 @@ class DashboardFrame(ctk.CTkFrame):
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(padx=10, pady=10, fill="both", expand=True)
 
+        self.create_charts()
+        self.chart_keys = {}
+        self.backgrounds = {}
+        self.stats = None
+        # Layout is only recomputed when the canvas is resized
+        self.canvas.mpl_connect("resize_event", self.on_resize)
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def create_charts(self):
+        """
+        Create the chart artists once; render() only updates their data.
+        Artists that change are animated, so they are blitted over a cached
+        background instead of redrawing the whole figure.
+        """
+        # --- Pie Chart: Delivery Status ---
+        self.pie_wedges, self.pie_labels, self.pie_pcts = self.ax1.pie(
+            [1, 1], autopct="%1.1f%%", startangle=90
+        )
+        self.ax1.set_title("Delivery Status", color="#FFFFFF")
+        self.ax1.set_facecolor('#242424')
+
+        # --- Heatmap: Daily Activity ---
+        self.heatmap = self.ax2.imshow(
+            np.zeros((6, 7)), cmap="Blues", aspect="auto", vmin=0, vmax=1
+        )
+        self.ax2.set_xticks(np.arange(7))
+        self.ax2.set_xticklabels(
+            ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'], color="white"
+        )
+        self.ax2.set_yticks([])  # Hide week numbers for a cleaner look
+        self.ax2.set_facecolor('#242424')
+        self.heatmap_title = self.ax2.set_title("", color="#FFFFFF")
+
+        # Day numbers, one reusable text artist per cell (a month spans at
+        # most 6 calendar weeks)
+        self.day_texts = [
+            [
+                self.ax2.text(c, r, "", ha="center", va="center", fontsize=8)
+                for c in range(7)
+            ]
+            for r in range(6)
+        ]
+
+        # Each chart is blitted separately, over its half of the figure
+        self.animated = {
+            "pie": list(self.pie_wedges) + list(self.pie_labels) + list(self.pie_pcts),
+            "heatmap": [self.heatmap, self.heatmap_title]
+            + [text for row in self.day_texts for text in row],
+        }
+        for artists in self.animated.values():
+            for artist in artists:
+                artist.set_animated(True)
+        self.fig.tight_layout(pad=3.0)
+
     def create_summary_card(self, parent, title, value, col, value_color="#FFFFFF"):
         """
         Helper function to create a summary card for KPIs.
@@ -104,84 +161,158 @@ class DashboardFrame(ctk.CTkFrame):
 
     def refresh_data(self):
         """
-        Refresh the dashboard data and update the summary cards and charts.
+        Load the dashboard data on a worker thread, then update the summary
+        cards and charts on the Tk thread.
         """
-        stats = self.controller.get_dashboard_stats()
+        today = datetime.date.today()
+        first_day = today.replace(day=1)
+        last_day = today.replace(
+            day=calendar.monthrange(today.year, today.month)[1]
+        )
 
-        # Update summary card values
-        self.total_label.configure(text=str(stats["total"]))
-        self.completed_label.configure(text=str(stats["completed"]))
-        self.pending_label.configure(text=str(stats["pending"]))
-        self.earnings_label.configure(text=f"${stats['earnings']:.2f}")
+        def fetch():
+            # Only this month's completions are read, via an indexed range query
+            return (
+                self.controller.get_dashboard_stats(),
+                self.controller.get_daily_activity(first_day, last_day),
+            )
 
-        # Clear previous chart data before redrawing
-        self.ax1.clear()
-        self.ax2.clear()
+        self.loader.submit(fetch, lambda result: self.render(today, *result))
 
-        # --- Pie Chart: Delivery Status ---
-        completed = stats["completed"]
-        pending = stats["pending"]
+    def render(self, today, stats, activity_data):
+        """
+        Update the summary cards and charts from loaded data.
+        Nothing is redrawn when the data is the same as last time.
+        :param today: Date whose month is shown in the heatmap.
+        :param stats: Dictionary from AppController.get_dashboard_stats().
+        :param activity_data: Dictionary {date: completed count} for the month.
+        """
+        keys = {
+            "pie": (stats["completed"], stats["pending"]),
+            "heatmap": (today.year, today.month, hash(tuple(sorted(activity_data.items())))),
+        }
+
+        # Update summary card values
+        if stats != self.stats:
+            self.total_label.configure(text=str(stats["total"]))
+            self.completed_label.configure(text=str(stats["completed"]))
+            self.pending_label.configure(text=str(stats["pending"]))
+            self.earnings_label.configure(text=f"${stats['earnings']:.2f}")
+            self.stats = stats
+
+        # Redraw only the charts whose input data changed
+        if keys["pie"] != self.chart_keys.get("pie"):
+            self.update_pie(stats["completed"], stats["pending"])
+        if keys["heatmap"] != self.chart_keys.get("heatmap"):
+            self.update_heatmap(today, activity_data)
+        changed = [name for name in keys if keys[name] != self.chart_keys.get(name)]
+        self.chart_keys = keys
+        if changed:
+            self.blit(changed)
+
+    def update_pie(self, completed, pending):
+        """
+        Move the two pie wedges and their labels to the new proportions.
+        """
         if completed == 0 and pending == 0:
-            pie_data = [1]
-            pie_labels = ["No Data"]
-            pie_colors = ["#424242"]
+            values = [1, 0]
+            labels = ["No Data", ""]
+            colors = ["#424242", "#424242"]
         else:
-            pie_data = [completed, pending]
-            pie_labels = ["Completed", "Pending"]
-            pie_colors = ['#00b894', "#034744"]
-
-        self.ax1.pie(
-            pie_data,
-            labels=pie_labels,
-            colors=pie_colors,
-            autopct="%1.1f%%",
-            startangle=90
-        )
-        self.ax1.set_title("Delivery Status", color="#FFFFFF")
-        self.ax1.set_facecolor('#242424')
-
-        # --- Heatmap: Daily Activity ---
-        activity_data = self.controller.get_daily_activity_for_current_month()
-        today = datetime.date.today()
+            values = [completed, pending]
+            labels = ["Completed", "Pending"]
+            colors = ['#00b894', "#034744"]
+
+        total = sum(values)
+        theta = 90.0
+        for wedge, label, pct, value, text, color in zip(
+            self.pie_wedges, self.pie_labels, self.pie_pcts, values, labels, colors
+        ):
+            span = 360.0 * value / total
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta + span)
+            wedge.set_facecolor(color)
+            # Same label placement as Axes.pie
+            middle = np.deg2rad(theta + span / 2)
+            x, y = np.cos(middle), np.sin(middle)
+            label.set_position((1.1 * x, 1.1 * y))
+            label.set_horizontalalignment("left" if x > 0 else "right")
+            label.set_text(text if value else "")
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text(f"{100.0 * value / total:1.1f}%" if value else "")
+            theta += span
+
+    def update_heatmap(self, today, activity_data):
+        """
+        Refill the heatmap cells and day numbers for today's month.
+        """
+        first_day = today.replace(day=1)
 
         # Get the calendar matrix for the current month (weeks x days)
         cal_matrix = calendar.monthcalendar(today.year, today.month)
 
         # Create a matrix of activity counts for the heatmap
-        data_matrix = np.zeros((len(cal_matrix), 7))
-        for r, week in enumerate(cal_matrix):
-            for c, day in enumerate(week):
-                if day != 0 and day in activity_data:
-                    data_matrix[r, c] = activity_data[day]
-
-        self.ax2.set_title(
-            f"Daily Activity - {today.strftime('%B %Y')}", color="#FFFFFF"
-        )
-        self.ax2.imshow(data_matrix, cmap="Blues", aspect="auto")
-
-        # Set axis labels
-        self.ax2.set_xticks(np.arange(7))
-        self.ax2.set_xticklabels(
-            ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'], color="white"
-        )
-        self.ax2.set_yticks([])  # Hide week numbers for a cleaner look
-
-        # Add day numbers to each cell
+        weeks = len(cal_matrix)
+        data_matrix = np.zeros((weeks, 7))
         for r, week in enumerate(cal_matrix):
             for c, day in enumerate(week):
                 if day != 0:
-                    # Use white text if the cell is dark, black otherwise
-                    text_color = (
-                        "white" if data_matrix[r, c] > data_matrix.max() / 2 else "black"
-                    )
-                    self.ax2.text(
-                        c, r, day, ha="center", va="center",
-                        color=text_color, fontsize=8
-                    )
+                    data_matrix[r, c] = activity_data.get(first_day.replace(day=day), 0)
+
+        peak = data_matrix.max() or 1
+        self.heatmap.set_data(data_matrix)
+        self.heatmap.set_clim(0, peak)
+        self.heatmap.set_extent((-0.5, 6.5, weeks - 0.5, -0.5))
+        if self.ax2.get_ylim() != (weeks - 0.5, -0.5):
+            self.ax2.set_ylim(weeks - 0.5, -0.5)
+            # The cached background no longer matches; force a full draw
+            self.backgrounds.clear()
+        self.heatmap_title.set_text(f"Daily Activity - {today.strftime('%B %Y')}")
+
+        # Day numbers, using white text if the cell is dark, black otherwise
+        for r, row in enumerate(self.day_texts):
+            for c, text in enumerate(row):
+                day = cal_matrix[r][c] if r < weeks else 0
+                text.set_text(str(day) if day else "")
+                if day:
+                    text.set_color("white" if data_matrix[r, c] > peak / 2 else "black")
+
+    def on_resize(self, event):
+        """
+        Recompute the layout for the new canvas size.
+        """
+        self.fig.tight_layout(pad=3.0)
 
-        self.ax2.set_facecolor('#242424')
+    def chart_region(self, name):
+        """
+        Display-space box of the figure half holding a chart.
+        """
+        bbox = self.fig.bbox
+        half = bbox.width / 2
+        x0 = bbox.x0 if name == "pie" else bbox.x0 + half
+        return Bbox.from_bounds(x0, bbox.y0, half, bbox.height)
 
-        # Finalize and redraw the figure
-        self.fig.tight_layout(pad=3.0)
-        self.canvas.draw()
+    def on_draw(self, event):
+        """
+        After a full draw, cache the static background of each chart and
+        draw the animated artists on top of it.
+        """
+        for name, artists in self.animated.items():
+            self.backgrounds[name] = self.canvas.copy_from_bbox(self.chart_region(name))
+            for artist in artists:
+                artist.axes.draw_artist(artist)
 
+    def blit(self, names):
+        """
+        Redraw only the animated artists of the given charts over their
+        cached backgrounds, or do a full draw if none is cached yet.
+        :param names: Chart names ('pie', 'heatmap') whose data changed.
+        """
+        if not self.backgrounds:
+            self.canvas.draw()
+            return
+        for name in names:
+            self.canvas.restore_region(self.backgrounds[name])
+            for artist in self.animated[name]:
+                artist.axes.draw_artist(artist)
+            self.canvas.blit(self.chart_region(name))
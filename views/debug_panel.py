@@ -0,0 +1,107 @@
+"""
+Hidden debug panel for the Delivery Management App.
+Shows the per-method latencies and traced SQL statements recorded by the
+controller's instrumentation. Opened with Ctrl+Shift+D.
+"""
+
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+
+
+class DebugPanel(ctk.CTkToplevel):
+    """
+    Popup window listing controller and database call statistics and the
+    slowest SQL statements, refreshed every second.
+    """
+
+    REFRESH_MS = 1000
+    TOP_STATEMENTS = 25
+
+    def __init__(self, master, controller):
+        """
+        Initialize the panel, enabling instrumentation if it is not yet on.
+        """
+        super().__init__(master)
+        self.controller = controller
+        self.instrumentation = controller.enable_instrumentation()
+        self.refresh_id = None
+        self.title("Debug: Query Tracing")
+        self.geometry("900x560")
+        self.create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.refresh()
+
+    def create_widgets(self):
+        """
+        Create the stats text area and the action buttons.
+        """
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(fill="x", padx=10, pady=(10, 0))
+        ctk.CTkButton(buttons, text="Reset", width=100, command=self.reset_action).pack(
+            side="left", padx=5
+        )
+        ctk.CTkButton(buttons, text="Save JSON", width=100, command=self.save_action).pack(
+            side="left", padx=5
+        )
+
+        self.textbox = ctk.CTkTextbox(
+            self, font=ctk.CTkFont(family="Consolas", size=12), wrap="none"
+        )
+        self.textbox.pack(fill="both", expand=True, padx=10, pady=10)
+
+    def format_stats(self, stats):
+        """
+        Render the statistics as fixed-width text tables.
+        """
+        lines = []
+        for title, methods in (("Controller", stats["controller"]), ("Database", stats["database"])):
+            lines.append(
+                f"{title + ' method':<38}{'calls':>7}{'p50 ms':>10}{'p95 ms':>10}"
+                f"{'p99 ms':>10}{'max ms':>10}{'queries':>9}"
+            )
+            for name, entry in sorted(methods.items(), key=lambda item: -item[1]["p95_ms"]):
+                lines.append(
+                    f"{name:<38}{entry['calls']:>7}{entry['p50_ms']:>10.2f}"
+                    f"{entry['p95_ms']:>10.2f}{entry['p99_ms']:>10.2f}"
+                    f"{entry['max_ms']:>10.2f}{entry['queries_per_call']:>9.1f}"
+                )
+            lines.append("")
+
+        lines.append(f"{'Statement (slowest first)':<38}{'count':>7}{'total ms':>10}{'mean ms':>10}")
+        for statement in stats["statements"][:self.TOP_STATEMENTS]:
+            lines.append(
+                f"{statement['method']:<38}{statement['count']:>7}"
+                f"{statement['total_ms']:>10.2f}{statement['mean_ms']:>10.3f}"
+            )
+            lines.append(f"    {statement['sql'][:200]}")
+        return "\n".join(lines)
+
+    def refresh(self):
+        """
+        Redraw the statistics and schedule the next refresh.
+        """
+        text = self.format_stats(self.instrumentation.stats())
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", text)
+        self.textbox.configure(state="disabled")
+        self.refresh_id = self.after(self.REFRESH_MS, self.refresh)
+
+    def reset_action(self):
+        """Clear all recorded statistics."""
+        self.instrumentation.reset()
+
+    def save_action(self):
+        """Dump the statistics to a JSON file chosen by the user."""
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".json", filetypes=[("JSON", "*.json")]
+        )
+        if path:
+            self.instrumentation.dump(path)
+            messagebox.showinfo("Saved", f"Stats written to {path}", parent=self)
+
+    def on_closing(self):
+        """Stop refreshing and close the panel; recording continues."""
+        if self.refresh_id is not None:
+            self.after_cancel(self.refresh_id)
+        self.destroy()
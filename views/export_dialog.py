@@ -0,0 +1,180 @@
+"""
+Export dialog for the Delivery Management App.
+Lets the user export deliveries or invoices to CSV with date and status
+filters, while the export runs in the background.
+"""
+
+import datetime
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+
+
+class ExportDialog(ctk.CTkToplevel):
+    """
+    Popup window for exporting deliveries and invoices to CSV.
+    """
+
+    STATUS_OPTIONS = {
+        "Deliveries": {"All": None, "Completed": "completed", "Pending": "pending"},
+        "Invoices": {"All": None, "Paid": "paid", "Pending": "pending"},
+    }
+
+    def __init__(self, master, controller):
+        """
+        Initialize the dialog and create widgets.
+        """
+        super().__init__(master)
+        self.controller = controller
+        self.job = None
+        self.poll_id = None
+        self.title("Export to CSV")
+        self.geometry("380x400")
+        self.grab_set()
+        self.focus_force()
+        self.create_widgets()
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def create_widgets(self):
+        """
+        Create and layout all widgets for the export form.
+        """
+        ctk.CTkLabel(self, text="Data:").pack(pady=(10, 0))
+        self.kind_menu = ctk.CTkOptionMenu(
+            self,
+            values=list(self.STATUS_OPTIONS),
+            command=self.on_kind_changed
+        )
+        self.kind_menu.pack()
+
+        ctk.CTkLabel(self, text="Status:").pack(pady=(10, 0))
+        self.status_menu = ctk.CTkOptionMenu(
+            self, values=list(self.STATUS_OPTIONS["Deliveries"])
+        )
+        self.status_menu.pack()
+
+        ctk.CTkLabel(self, text="From / To (YYYY-MM-DD, optional):").pack(pady=(10, 0))
+        dates_frame = ctk.CTkFrame(self, fg_color="transparent")
+        dates_frame.pack()
+        self.start_entry = ctk.CTkEntry(dates_frame, width=120, placeholder_text="From")
+        self.start_entry.grid(row=0, column=0, padx=5)
+        self.end_entry = ctk.CTkEntry(dates_frame, width=120, placeholder_text="To")
+        self.end_entry.grid(row=0, column=1, padx=5)
+
+        self.archive_var = ctk.BooleanVar(value=False)
+        if self.controller.db.has_archive:
+            ctk.CTkCheckBox(
+                self, text="Include archived records", variable=self.archive_var
+            ).pack(pady=(10, 0))
+
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(fill="x", padx=20, pady=(20, 5))
+        self.progress_label = ctk.CTkLabel(self, text="")
+        self.progress_label.pack()
+
+        self.export_btn = ctk.CTkButton(self, text="Export", command=self.export_action)
+        self.export_btn.pack(pady=15)
+
+    def on_kind_changed(self, kind):
+        """
+        Update the status choices when the exported data changes.
+        """
+        values = list(self.STATUS_OPTIONS[kind])
+        self.status_menu.configure(values=values)
+        self.status_menu.set(values[0])
+
+    def read_dates(self):
+        """
+        Parse the date filters. The exporter compares dates as text, so
+        they are normalized to YYYY-MM-DD.
+        :return: Tuple (start_date, end_date), None for empty fields, or
+                 None if a date is invalid (an error has been shown).
+        """
+        dates = []
+        for entry in (self.start_entry, self.end_entry):
+            value = entry.get().strip()
+            if not value:
+                dates.append(None)
+                continue
+            try:
+                dates.append(datetime.date.fromisoformat(value).isoformat())
+            except ValueError:
+                messagebox.showerror(
+                    "Error", "Dates must be in YYYY-MM-DD format.", parent=self
+                )
+                return None
+        if dates[0] and dates[1] and dates[0] > dates[1]:
+            messagebox.showerror(
+                "Error", "The start date must not be after the end date.", parent=self
+            )
+            return None
+        return tuple(dates)
+
+    def export_action(self):
+        """
+        Ask for a destination file and start the background export.
+        """
+        dates = self.read_dates()
+        if dates is None:
+            return
+        kind = self.kind_menu.get()
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")],
+            initialfile=f"{kind.lower()}.csv"
+        )
+        if not path:
+            return
+        status = self.STATUS_OPTIONS[kind][self.status_menu.get()]
+        self.job = self.controller.start_export(
+            kind.lower(),
+            path,
+            start_date=dates[0],
+            end_date=dates[1],
+            status=status,
+            include_archive=self.archive_var.get()
+        )
+        self.export_btn.configure(state="disabled")
+        self.progress_bar.set(0)
+        self.progress_label.configure(text="Exporting...")
+        self.poll_id = self.after(100, self.poll_export)
+
+    def poll_export(self):
+        """
+        Update the progress bar from the running export; reschedules itself until done.
+        """
+        if self.job.poll():
+            if self.job.total:
+                self.progress_bar.set(self.job.written / self.job.total)
+            self.progress_label.configure(
+                text=f"Exported {self.job.written} of {self.job.total} rows..."
+            )
+            self.poll_id = self.after(100, self.poll_export)
+            return
+
+        self.poll_id = None
+        self.export_btn.configure(state="normal")
+        if self.job.error:
+            self.progress_label.configure(text="Export failed.")
+            messagebox.showerror(
+                "Error", f"Export failed: {self.job.error}", parent=self
+            )
+        else:
+            self.progress_bar.set(1)
+            self.progress_label.configure(text=f"Exported {self.job.written} rows.")
+            messagebox.showinfo(
+                "Success", f"Exported {self.job.written} rows to\n{self.job.path}",
+                parent=self
+            )
+        self.job = None
+
+    def on_closing(self):
+        """
+        Cancel any running export and close the dialog.
+        """
+        if self.poll_id:
+            self.after_cancel(self.poll_id)
+        if self.job:
+            self.job.cancel()
+        self.destroy()
@@ -5,19 +5,143 @@ Shows a list of invoices with status and allows marking as paid.
 
 import customtkinter as ctk
 from tkinter import messagebox
+from views.background import PAGE, BackgroundLoader
+
+
+class InvoiceCard(ctk.CTkFrame):
+    """
+    The card showing one invoice. Its widgets are created once; show()
+    only reconfigures the ones whose values changed.
+    """
+
+    def __init__(self, master, frame, fonts):
+        """
+        Create the card widgets.
+        :param master: Parent widget.
+        :param frame: InvoiceFrame handling the pay button.
+        :param fonts: Dictionary of shared CTkFont objects.
+        """
+        super().__init__(master, border_width=2, border_color="#3b3b3b")
+        self.invoice = None
+        self._shown = {}
+        self.grid_columnconfigure(0, weight=1)
+
+        # Header with invoice ID, amount, and status
+        header_frame = ctk.CTkFrame(self, fg_color="transparent")
+        header_frame.grid(row=0, column=0, padx=15, pady=(10, 5), sticky="ew")
+        header_frame.grid_columnconfigure(1, weight=1)
+
+        self.id_label = ctk.CTkLabel(header_frame, text="", font=fonts["id"])
+        self.id_label.grid(row=0, column=0, sticky="w")
+
+        self.amount_label = ctk.CTkLabel(header_frame, text="", font=fonts["amount"])
+        self.amount_label.grid(row=0, column=1, sticky="w", padx=20)
+
+        self.status_frame = ctk.CTkFrame(header_frame, corner_radius=8)
+        self.status_frame.grid(row=0, column=2, sticky="e")
+        self.status_label = ctk.CTkLabel(
+            self.status_frame, text="", font=fonts["status"], padx=10, pady=2
+        )
+        self.status_label.pack()
+
+        # Separator line
+        separator = ctk.CTkFrame(self, height=1, fg_color="#3b3b3b")
+        separator.grid(row=1, column=0, padx=15, pady=5, sticky="ew")
+
+        # Details: delivery description and client name
+        self.delivery_label = ctk.CTkLabel(
+            self, text="", font=fonts["details"], text_color="gray70"
+        )
+        self.delivery_label.grid(row=2, column=0, padx=15, sticky="w")
+        self.client_label = ctk.CTkLabel(
+            self, text="", font=fonts["details"], text_color="gray70"
+        )
+        self.client_label.grid(row=3, column=0, padx=15, pady=(0, 10), sticky="w")
+
+        # Footer with issue date and pay button if not paid
+        footer_frame = ctk.CTkFrame(self, fg_color="transparent")
+        footer_frame.grid(row=4, column=0, padx=15, pady=10, sticky="ew")
+        footer_frame.grid_columnconfigure(0, weight=1)
+
+        self.date_label = ctk.CTkLabel(
+            footer_frame, text="", font=fonts["details"], text_color="gray60"
+        )
+        self.date_label.grid(row=0, column=0, sticky="w")
+
+        self.pay_button = ctk.CTkButton(
+            footer_frame,
+            text="💸 Mark as Paid",
+            width=140,
+            command=lambda: frame.mark_as_paid_action(self.invoice.id)
+        )
+
+    def show(self, data):
+        """
+        Display an invoice, reconfiguring only the widgets whose value changed.
+        :param data: Dictionary with 'invoice', 'delivery_desc' and 'client_name'.
+        :return: True if any widget was reconfigured.
+        """
+        invoice = data["invoice"]
+        self.invoice = invoice
+        values = {
+            "id": invoice.id,
+            "amount": invoice.amount,
+            "paid": bool(invoice.paid),
+            "delivery": data["delivery_desc"],
+            "client": data["client_name"],
+            "date": invoice.date,
+        }
+        changed = {
+            key for key, value in values.items()
+            if key not in self._shown or self._shown[key] != value
+        }
+        self._shown = values
+
+        if "id" in changed:
+            self.id_label.configure(text=f"Invoice #{invoice.id}")
+        if "amount" in changed:
+            self.amount_label.configure(text=f"${invoice.amount:.2f}")
+        if "paid" in changed:
+            self.status_frame.configure(
+                fg_color="#00e676" if invoice.paid else "#ff1744"
+            )
+            self.status_label.configure(text="Paid" if invoice.paid else "Pending")
+            if invoice.paid:
+                self.pay_button.grid_forget()
+            else:
+                self.pay_button.grid(row=0, column=1, sticky="e")
+        if "delivery" in changed:
+            self.delivery_label.configure(
+                text=f'For Delivery: "{data["delivery_desc"]}"'
+            )
+        if "client" in changed:
+            self.client_label.configure(text=f"👤 Client: {data['client_name']}")
+        if "date" in changed:
+            self.date_label.configure(text=f"Issued: {invoice.date}")
+        return bool(changed)
 
 
 class InvoiceFrame(ctk.CTkFrame):
     """
     Frame for the 'Invoices' view.
+    Cards are kept in a map by invoice id and each refresh is diffed against
+    it, so only added, removed or changed invoices touch any widget.
     """
 
+    PAGE_SIZE = 50
+
     def __init__(self, master, controller):
         """
         Initialize the frame and create widgets.
         """
         super().__init__(master, fg_color="transparent")
         self.controller = controller
+        self.loader = BackgroundLoader(self, controller, "invoices")
+        self.cards = {}
+        self.order = []
+        self.next_cursor = None
+        self.total_count = 0
+        self.load_more_btn = None
         self.create_widgets()
 
     def create_widgets(self):
@@ -32,106 +156,155 @@ class InvoiceFrame(ctk.CTkFrame):
         )
         self.title_label.pack(pady=(0, 20), padx=10, anchor="w")
 
+        self.fonts = {
+            "id": ctk.CTkFont(family="Segoe UI", size=18, weight="bold"),
+            "amount": ctk.CTkFont(family="Segoe UI", size=18),
+            "status": ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+            "details": ctk.CTkFont(family="Segoe UI", size=12),
+        }
+
         self.scrollable_frame = ctk.CTkScrollableFrame(
             self, fg_color="transparent"
         )
         self.scrollable_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
+        # Cards live in their own container so the button below stays last
+        self.cards_frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        self.cards_frame.pack(fill="x")
+        self.empty_label = ctk.CTkLabel(
+            self.scrollable_frame, text="No invoices found.", font=("Segoe UI", 14)
+        )
+
     def refresh_data(self):
         """
-        Request fresh data from the controller and redraw the invoice list.
+        Request fresh data from the controller and update the list.
+        The count and as many rows as are currently shown are loaded on a
+        worker thread; more pages are fetched on demand.
         """
-        # Clear previous widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        limit = max(self.PAGE_SIZE, len(self.order))
 
-        invoices_data = self.controller.get_invoices_for_view()
+        def fetch():
+            total = self.controller.count_invoices()
+            return total, self.controller.get_invoices_page(None, limit)
 
-        if not invoices_data:
-            no_data_label = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="No invoices found.",
-                font=("Segoe UI", 14)
-            )
-            no_data_label.pack(pady=20)
-            return
+        self.loader.submit(fetch, self.show_first_page, self.on_load_error)
+
+    def show_first_page(self, result):
+        """
+        Diff the loaded invoices against the displayed cards.
+        :param result: Tuple (total count, (rows, next cursor)).
+        """
+        # A page requested before this refresh would follow the old rows
+        self.loader.cancel(PAGE)
+        self.total_count, (rows, self.next_cursor) = result
+        self.sync_cards(rows)
+        if self.total_count:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=20)
+        self.update_load_more()
 
-        # Draw each invoice as a card
-        for data in invoices_data:
-            invoice = data["invoice"]
+    def sync_cards(self, rows):
+        """
+        Make the cards match rows: destroy cards of invoices that are gone,
+        create cards for new ones, reconfigure changed ones and repack only
+        the cards whose position changed.
+        :param rows: Invoice rows in display order.
+        :return: Tuple (added, removed, changed) counts.
+        """
+        new_ids = [data["invoice"].id for data in rows]
+        keep = set(new_ids)
+        removed = 0
+        for invoice_id in self.order:
+            if invoice_id not in keep:
+                self.cards.pop(invoice_id).destroy()
+                removed += 1
+        old_order = [invoice_id for invoice_id in self.order if invoice_id in keep]
 
-            # Card frame for each invoice
-            card_frame = ctk.CTkFrame(
-                self.scrollable_frame, border_width=2, border_color="#3b3b3b"
-            )
-            card_frame.pack(fill="x", pady=10, padx=10)
-            card_frame.grid_columnconfigure(0, weight=1)
-
-            # Header with invoice ID, amount, and status
-            header_frame = ctk.CTkFrame(card_frame, fg_color="transparent")
-            header_frame.grid(row=0, column=0, padx=15, pady=(10, 5), sticky="ew")
-            header_frame.grid_columnconfigure(1, weight=1)
-
-            id_font = ctk.CTkFont(family="Segoe UI", size=18, weight="bold")
-            ctk.CTkLabel(
-                header_frame, text=f"Invoice #{invoice.id}", font=id_font
-            ).grid(row=0, column=0, sticky="w")
-
-            amount_font = ctk.CTkFont(family="Segoe UI", size=18)
-            ctk.CTkLabel(
-                header_frame, text=f"${invoice.amount:.2f}", font=amount_font
-            ).grid(row=0, column=1, sticky="w", padx=20)
-
-            status_font = ctk.CTkFont(family="Segoe UI", size=14, weight="bold")
-            status_text = "Paid" if invoice.paid else "Pending"
-            status_color = "#00e676" if invoice.paid else "#ff1744"
-            status_label_frame = ctk.CTkFrame(
-                header_frame, fg_color=status_color, corner_radius=8
+        added = changed = 0
+        placed = set()
+        position = 0
+        previous = None
+        for invoice_id, data in zip(new_ids, rows):
+            card = self.cards.get(invoice_id)
+            if card is None:
+                card = self.cards[invoice_id] = InvoiceCard(self.cards_frame, self, self.fonts)
+                card.show(data)
+                added += 1
+            elif card.show(data):
+                changed += 1
+
+            # Skip old cards that were already moved up
+            while position < len(old_order) and old_order[position] in placed:
+                position += 1
+            if position < len(old_order) and old_order[position] == invoice_id:
+                position += 1
+            elif previous is not None:
+                card.pack(fill="x", pady=10, padx=10, after=previous)
+            elif old_order:
+                card.pack(fill="x", pady=10, padx=10, before=self.cards[old_order[0]])
+            else:
+                card.pack(fill="x", pady=10, padx=10)
+            placed.add(invoice_id)
+            previous = card
+
+        self.order = new_ids
+        return added, removed, changed
+
+    def load_next_page(self):
+        """
+        Fetch the next page of invoices on a worker thread and append it.
+        """
+        cursor = self.next_cursor
+        self.load_more_btn.configure(state="disabled", text="Loading…")
+        self.loader.submit(
+            lambda: self.controller.get_invoices_page(cursor, self.PAGE_SIZE),
+            self.append_page,
+            self.on_load_error,
+            channel=PAGE
+        )
+
+    def append_page(self, page):
+        """
+        Append the cards of a loaded page to the list.
+        :param page: Tuple (rows, next cursor) from the controller.
+        """
+        rows, self.next_cursor = page
+        for data in rows:
+            invoice_id = data["invoice"].id
+            if invoice_id in self.cards:
+                continue
+            card = self.cards[invoice_id] = InvoiceCard(self.cards_frame, self, self.fonts)
+            card.show(data)
+            card.pack(fill="x", pady=10, padx=10)
+            self.order.append(invoice_id)
+        self.update_load_more()
+
+    def on_load_error(self, error):
+        """
+        Re-enable the "Load more" button after a failed fetch.
+        :param error: Exception raised by the fetch.
+        """
+        if self.load_more_btn is not None:
+            self.update_load_more()
+
+    def update_load_more(self):
+        """
+        Show the "Load more" button while more invoices are available.
+        """
+        if self.next_cursor is None:
+            if self.load_more_btn is not None:
+                self.load_more_btn.destroy()
+                self.load_more_btn = None
+            return
+        text = f"Load more ({len(self.order)} of {self.total_count})"
+        if self.load_more_btn is None:
+            self.load_more_btn = ctk.CTkButton(
+                self.scrollable_frame, text=text, command=lambda: self.load_next_page()
             )
-            status_label_frame.grid(row=0, column=2, sticky="e")
-            ctk.CTkLabel(
-                status_label_frame, text=status_text, font=status_font, padx=10, pady=2
-            ).pack()
-
-            # Separator line
-            separator = ctk.CTkFrame(card_frame, height=1, fg_color="#3b3b3b")
-            separator.grid(row=1, column=0, padx=15, pady=5, sticky="ew")
-
-            # Details: delivery description and client name
-            details_font = ctk.CTkFont(family="Segoe UI", size=12)
-            ctk.CTkLabel(
-                card_frame,
-                text=f'For Delivery: "{data["delivery_desc"]}"',
-                font=details_font,
-                text_color="gray70"
-            ).grid(row=2, column=0, padx=15, sticky="w")
-            ctk.CTkLabel(
-                card_frame,
-                text=f"👤 Client: {data['client_name']}",
-                font=details_font,
-                text_color="gray70"
-            ).grid(row=3, column=0, padx=15, pady=(0, 10), sticky="w")
-
-            # Footer with issue date and pay button if not paid
-            footer_frame = ctk.CTkFrame(card_frame, fg_color="transparent")
-            footer_frame.grid(row=4, column=0, padx=15, pady=10, sticky="ew")
-            footer_frame.grid_columnconfigure(0, weight=1)
-
-            ctk.CTkLabel(
-                footer_frame,
-                text=f"Issued: {invoice.date}",
-                font=details_font,
-                text_color="gray60"
-            ).grid(row=0, column=0, sticky="w")
-
-            if not invoice.paid:
-                pay_button = ctk.CTkButton(
-                    footer_frame,
-                    text="💸 Mark as Paid",
-                    width=140,
-                    command=lambda inv_id=invoice.id: self.mark_as_paid_action(inv_id)
-                )
-                pay_button.grid(row=0, column=1, sticky="e")
+            self.load_more_btn.pack(pady=10)
+        else:
+            self.load_more_btn.configure(state="normal", text=text)
 
     def mark_as_paid_action(self, invoice_id):
         """
@@ -1,24 +1,156 @@
 """
 Frame for displaying and managing deliveries in the Delivery Management App.
-Shows a list of deliveries as cards and allows marking as completed.
+Shows a virtualized list of delivery cards and allows marking as completed.
 """
 
 import customtkinter as ctk
 from tkinter import messagebox
 import datetime
+from reminders import DUE_SOON_DAYS
+from views.background import PAGE, BackgroundLoader
+
+
+class DeliveryCard(ctk.CTkFrame):
+    """
+    A reusable card showing one delivery. The widgets are created once and
+    reconfigured by show() whenever the card is bound to another delivery.
+    """
+
+    HEIGHT = 170
+
+    def __init__(self, master, frame, fonts):
+        """
+        Create the card widgets.
+        :param master: Parent widget (the list viewport).
+        :param frame: ViewDeliveriesFrame handling the card's button actions.
+        :param fonts: Dictionary of shared CTkFont objects.
+        """
+        super().__init__(
+            master, height=self.HEIGHT, border_width=2, border_color="#3b3b3b"
+        )
+        self.delivery = None
+        self._shown = None
+        # Keep a fixed height so every row takes the same space
+        self.grid_propagate(False)
+        self.grid_columnconfigure(0, weight=1)
+
+        # Row 0: Description
+        self.desc_label = ctk.CTkLabel(self, text="", font=fonts["desc"], justify="left")
+        self.desc_label.grid(row=0, column=0, columnspan=6, padx=15, pady=(10, 5), sticky="ew")
+
+        # Row 1: Details (Client, Deadline, Fee)
+        self.details_label = ctk.CTkLabel(
+            self, text="", font=fonts["details"], text_color="gray60"
+        )
+        self.details_label.grid(row=1, column=0, columnspan=6, padx=15, pady=(0, 10), sticky="ew")
+
+        # Row 2: Separator
+        separator = ctk.CTkFrame(self, height=1, fg_color="#3b3b3b")
+        separator.grid(row=2, column=0, columnspan=5, padx=15, pady=5, sticky="ew")
+
+        # Row 3: Status
+        self.status_label = ctk.CTkLabel(self, text="", font=fonts["status"], anchor="w")
+        self.status_label.grid(row=3, column=0, columnspan=6, padx=25, pady=10, sticky="w")
+
+        # Row 4: Action buttons
+        self.btn_complete = ctk.CTkButton(
+            self, text="✔ Mark as Completed", width=150,
+            command=lambda: frame.mark_as_completed_action(self.delivery.id)
+        )
+        self.btn_delete = ctk.CTkButton(
+            self, text="🗑 Delete", fg_color="#ff1744",
+            command=lambda: frame.delete_delivery_action(self.delivery.id)
+        )
+        self.btn_edit = ctk.CTkButton(
+            self, text="✏️ Edit", fg_color="#00b894",
+            command=lambda: frame.edit_delivery_action(self.delivery)
+        )
+        self.btn_history = ctk.CTkButton(
+            self, text="📜 History", fg_color="#3498db",
+            command=lambda: frame.show_history_action(self.delivery.id)
+        )
+
+    def show(self, data, today):
+        """
+        Bind the card to a delivery, reconfiguring only if it changed.
+        :param data: Dictionary with 'delivery' and 'client_name'.
+        :param today: Current date, used for the deadline colors.
+        """
+        delivery = data["delivery"]
+        key = (
+            delivery.id, delivery.description, delivery.fee, delivery.deadline,
+            delivery.completed, data["client_name"], today
+        )
+        self.delivery = delivery
+        if key == self._shown:
+            return
+        self._shown = key
+
+        # Calculate card color based on deadline and completion
+        deadline_date = datetime.datetime.strptime(delivery.deadline, "%Y-%m-%d").date()
+        if not delivery.completed:
+            if deadline_date < today:
+                card_color = "#ffcccc"  # Overdue
+            elif deadline_date <= today + datetime.timedelta(days=DUE_SOON_DAYS):
+                card_color = "#fff3cd"  # Due soon
+            else:
+                card_color = "#2b2b2b"  # Normal
+        else:
+            card_color = "#ccffcc"      # Completed
+        self.configure(fg_color=card_color)
+
+        self.desc_label.configure(text=delivery.description)
+        self.details_label.configure(text=(
+            f"👤 Client: {data['client_name']}   |   "
+            f"📅 Deadline: {delivery.deadline}   |   "
+            f"💰 Fee: ${delivery.fee:.2f}"
+        ))
+        self.status_label.configure(
+            text="Completed" if delivery.completed else "Pending",
+            text_color="#00e676" if delivery.completed else "#ff1744"
+        )
+
+        buttons = [self.btn_delete, self.btn_edit, self.btn_history]
+        if not delivery.completed:
+            buttons.insert(0, self.btn_complete)
+        else:
+            self.btn_complete.grid_forget()
+        for col, button in enumerate(buttons):
+            button.grid(row=4, column=col, padx=5, pady=10, sticky="e")
 
 
 class ViewDeliveriesFrame(ctk.CTkFrame):
     """
     Frame for the 'Deliveries List' view.
+    Only the rows in view get a card: a fixed pool of DeliveryCard widgets
+    is rebound to other deliveries as the list scrolls, so the widget count
+    does not depend on the number of deliveries. Only a window of at most
+    MAX_LOADED_ROWS rows around the visible ones is kept loaded; jumping
+    outside it loads a new window at the target row.
     """
 
+    PAGE_SIZE = 50
+    # Extra cards kept beyond the visible rows
+    BUFFER_ROWS = 1
+    ROW_PADY = 5
+    # Loaded rows kept in memory; older ones are dropped as the list scrolls
+    MAX_LOADED_ROWS = 1000
+
     def __init__(self, master, controller):
         """
         Initialize the frame and create widgets.
         """
         super().__init__(master, fg_color="transparent")
         self.controller = controller
+        self.loader = BackgroundLoader(self, controller, "deliveries")
+        self.rows = []
+        # Row number of self.rows[0] in the full list
+        self.row_offset = 0
+        self.window_start = None
+        self.next_cursor = None
+        self.total_count = 0
+        self.first_row = 0
+        self.cards = []
         self.create_widgets()
 
     def create_widgets(self):
@@ -33,149 +165,194 @@ class ViewDeliveriesFrame(ctk.CTkFrame):
         )
         self.title_label.pack(pady=(0, 20), padx=10, anchor="w")
 
-        # Scrollable frame for the list of deliveries
-        self.scrollable_frame = ctk.CTkScrollableFrame(
-            self, fg_color="transparent"
+        # Fonts shared by every card
+        self.fonts = {
+            "desc": ctk.CTkFont(family="Segoe UI", size=16, weight="bold"),
+            "details": ctk.CTkFont(family="Segoe UI", size=12),
+            "status": ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+        }
+
+        list_frame = ctk.CTkFrame(self, fg_color="transparent")
+        list_frame.pack(fill="both", expand=True, padx=10, pady=5)
+
+        self.scrollbar = ctk.CTkScrollbar(list_frame, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Viewport holding the card pool; it never grows with the data
+        self.viewport = ctk.CTkFrame(list_frame, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.viewport.pack_propagate(False)
+        self.viewport.bind("<Configure>", lambda event: self.render_rows())
+
+        self.empty_label = ctk.CTkLabel(
+            self.viewport, text="No deliveries found.", font=("Segoe UI", 14)
         )
-        self.scrollable_frame.pack(fill="both", expand=True, padx=10, pady=5)
+
+        # Mouse wheel scrolling (Windows/macOS and X11)
+        self.bind_all("<MouseWheel>", self.on_mouse_wheel, add="+")
+        self.bind_all("<Button-4>", self.on_mouse_wheel, add="+")
+        self.bind_all("<Button-5>", self.on_mouse_wheel, add="+")
 
     def refresh_data(self):
         """
-        Request fresh data from the controller and redraw the list as cards.
+        Reload the deliveries, keeping the current scroll position.
+        The count and the rows around the visible ones are loaded on a
+        worker thread.
         """
-        # Clear old widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self.load_window(max(0, self.first_row - self.PAGE_SIZE // 2), with_count=True)
 
-        # Get new data from the controller
-        deliveries_data = self.controller.get_all_deliveries_for_view()
+    def load_window(self, start, with_count=False):
+        """
+        Replace the loaded rows with a window starting at row number start
+        that covers the visible rows, fetched on a worker thread.
+        :param start: Row number of the first row to load.
+        :param with_count: Also reload the total number of deliveries.
+        """
+        limit = self.first_row - start + self.visible_rows() + self.PAGE_SIZE
 
-        if not deliveries_data:
-            no_data_label = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="No deliveries found.",
-                font=("Segoe UI", 14)
-            )
-            no_data_label.pack(pady=20)
+        def fetch():
+            total = self.controller.count_deliveries() if with_count else None
+            return total, start, self.controller.get_deliveries_window(start, limit)
+
+        self.window_start = start
+        # Pages fetched after the old cursor would not follow the new window
+        self.loader.cancel(PAGE)
+        self.loader.submit(fetch, self.show_first_page, self.on_load_error)
+
+    def show_first_page(self, result):
+        """
+        Replace the loaded rows and redraw the visible cards.
+        :param result: Tuple (total count or None, first row number, (rows, next cursor)).
+        """
+        total, self.row_offset, (rows, self.next_cursor) = result
+        if total is not None:
+            self.total_count = total
+        # Copied: the controller's result is shared through the query cache
+        self.rows = list(rows)
+        self.window_start = None
+        self.render_rows()
+
+    def load_next_page(self, needed):
+        """
+        Fetch more deliveries on a worker thread until at least `needed`
+        rows are loaded.
+        :param needed: Number of rows the list needs loaded.
+        """
+        if self.loader.pending or self.next_cursor is None:
             return
+        cursor = self.next_cursor
+        loaded_end = self.row_offset + len(self.rows)
+        limit = max(self.PAGE_SIZE, needed - loaded_end + self.PAGE_SIZE)
+        self.loader.submit(
+            lambda: self.controller.get_deliveries_page(cursor, limit),
+            self.append_page,
+            channel=PAGE
+        )
+
+    def append_page(self, page):
+        """
+        Append a loaded page to the rows and redraw the visible cards.
+        :param page: Tuple (rows, next cursor) from the controller.
+        """
+        rows, self.next_cursor = page
+        self.rows.extend(rows)
+        # Drop rows above the visible ones once the window is full
+        excess = len(self.rows) - self.MAX_LOADED_ROWS
+        if excess > 0:
+            drop = min(excess, max(0, self.first_row - self.row_offset))
+            del self.rows[:drop]
+            self.row_offset += drop
+        self.render_rows()
+
+    def on_load_error(self, error):
+        """
+        Forget the window that failed to load; scrolling or refreshing
+        tries again.
+        :param error: Exception raised by the fetch.
+        """
+        self.window_start = None
+
+    def visible_rows(self):
+        """
+        Number of cards needed to fill the viewport, plus the buffer.
+        """
+        card_height = self.cards[0].winfo_reqheight() if self.cards else DeliveryCard.HEIGHT
+        row_height = card_height + 2 * self.ROW_PADY
+        height = self.viewport.winfo_height()
+        return max(1, -(-height // max(row_height, 1))) + self.BUFFER_ROWS
+
+    def render_rows(self):
+        """
+        Bind the card pool to the rows starting at first_row.
+        Cards are created only when the viewport grows.
+        """
+        count = self.visible_rows()
+        while len(self.cards) < count:
+            self.cards.append(DeliveryCard(self.viewport, self, self.fonts))
+
+        max_first = max(0, self.total_count - count + self.BUFFER_ROWS)
+        self.first_row = min(max(self.first_row, 0), max_first)
 
-        # Loop to create each delivery card
-        for data in deliveries_data:
-            delivery = data["delivery"]
-            client_name = data["client_name"]
-
-            # Calculate card color based on deadline and completion
-            deadline_date = datetime.datetime.strptime(delivery.deadline, "%Y-%m-%d").date()
-            today = datetime.date.today()
-            if not delivery.completed:
-                if deadline_date < today:
-                    card_color = "#ffcccc"  # Overdue
-                elif deadline_date <= today + datetime.timedelta(days=1):
-                    card_color = "#fff3cd"  # Due soon
-                else:
-                    card_color = "#2b2b2b"  # Normal
+        if self.total_count:
+            self.empty_label.pack_forget()
+        elif not self.loader.pending:
+            self.empty_label.pack(pady=20)
+
+        today = datetime.date.today()
+        for i, card in enumerate(self.cards):
+            index = self.first_row + i - self.row_offset
+            if i < count and 0 <= index < len(self.rows):
+                card.show(self.rows[index], today)
+                card.pack(fill="x", pady=self.ROW_PADY, padx=10)
             else:
-                card_color = "#ccffcc"      # Completed
-
-            # Main card frame for this delivery
-            card_frame = ctk.CTkFrame(
-                self.scrollable_frame,
-                border_width=2,
-                border_color="#3b3b3b",
-                fg_color=card_color
-            )
-            card_frame.pack(fill="x", pady=10, padx=10)
-
-            # Configure columns inside the card
-            card_frame.grid_columnconfigure(0, weight=1)  # Description/details
-            for i in range(1, 6):
-                card_frame.grid_columnconfigure(1, weight=0)  # Button
-
-            # Row 0: Description
-            desc_font = ctk.CTkFont(family="Segoe UI", size=16, weight="bold")
-            desc_label = ctk.CTkLabel(
-                card_frame,
-                text=delivery.description,
-                font=desc_font,
-                justify="left"
-            )
-            desc_label.grid(
-                row=0, column=0, columnspan=6, padx=15, pady=(10, 5), sticky="ew"
-            )
+                card.pack_forget()
 
-            # Row 1: Details (Client, Deadline, Fee)
-            details_font = ctk.CTkFont(family="Segoe UI", size=12)
-            details_text = (
-                f"👤 Client: {client_name}   |   "
-                f"📅 Deadline: {delivery.deadline}   |   "
-                f"💰 Fee: ${delivery.fee:.2f}"
-            )
-            details_label = ctk.CTkLabel(
-                card_frame,
-                text=details_text,
-                font=details_font,
-                text_color="gray60"
-            )
-            details_label.grid(
-                row=1, column=0, columnspan=6, padx=15, pady=(0, 10), sticky="ew"
-            )
+        loaded_end = self.row_offset + len(self.rows)
+        if self.first_row < self.row_offset or self.first_row > loaded_end + self.PAGE_SIZE:
+            # Jumped outside the loaded window: load one at the target row
+            start = max(0, self.first_row - self.PAGE_SIZE // 2)
+            if self.window_start is None or abs(start - self.window_start) > self.PAGE_SIZE // 2:
+                self.load_window(start)
+        elif self.first_row + count + self.PAGE_SIZE // 2 > loaded_end:
+            # Prefetch before the user reaches the end of the loaded rows
+            self.load_next_page(self.first_row + count)
 
-            # Row 2: Separator
-            separator = ctk.CTkFrame(card_frame, height=1, fg_color="#3b3b3b")
-            separator.grid(
-                row=2, column=0, columnspan=5, padx=15, pady=5, sticky="ew"
+        if self.total_count:
+            self.scrollbar.set(
+                self.first_row / self.total_count,
+                min(1.0, (self.first_row + count) / self.total_count)
             )
+        else:
+            self.scrollbar.set(0.0, 1.0)
 
-            # Row 3: Status
-            status_font = ctk.CTkFont(family="Segoe UI", size=14, weight="bold")
-            status_text = "Completed" if delivery.completed else "Pending"
-            status_color = "#00e676" if delivery.completed else "#ff1744"
-            status_label = ctk.CTkLabel(
-                card_frame,
-                text=status_text,
-                font=status_font,
-                text_color=status_color,
-                anchor="w"
-            )
-            status_label.grid(row=3, column=0, columnspan=6, padx=25, pady=10, sticky="w")
-
-            # Row 4: Action buttons (start at column=0)
-            col = 0
-            if not delivery.completed:
-                btn_complete = ctk.CTkButton(
-                    card_frame,
-                    text="✔ Mark as Completed",
-                    width=150,
-                    command=lambda d_id=delivery.id: self.mark_as_completed_action(d_id)
-                )
-                btn_complete.grid(row=4, column=col, padx=5, pady=10, sticky="e")
-                col += 1
-
-            btn_delete = ctk.CTkButton(
-                card_frame,
-                text="🗑 Delete",
-                fg_color="#ff1744",
-                command=lambda d_id=delivery.id: self.delete_delivery_action(d_id)
-            )
-            btn_delete.grid(row=4, column=col, padx=5, pady=10, sticky="e")
-            col += 1
-
-            btn_edit = ctk.CTkButton(
-                card_frame,
-                text="✏️ Edit",
-                fg_color="#00b894",
-                command=lambda d=delivery: self.edit_delivery_action(d)
-            )
-            btn_edit.grid(row=4, column=col, padx=5, pady=10, sticky="e")
-            col += 1
-
-            btn_history = ctk.CTkButton(
-                card_frame,
-                text="📜 History",
-                fg_color="#3498db",
-                command=lambda d_id=delivery.id: self.show_history_action(d_id)
-            )
-            btn_history.grid(row=4, column=col, padx=5, pady=10, sticky="e")
+    def scroll_to(self, first_row):
+        """
+        Scroll so that first_row is the top visible row.
+        """
+        if first_row != self.first_row:
+            self.first_row = first_row
+            self.render_rows()
+
+    def on_scrollbar(self, action, value, unit=None):
+        """
+        Scrollbar callback: 'moveto' a fraction or 'scroll' by units/pages.
+        """
+        if action == "moveto":
+            self.scroll_to(int(float(value) * self.total_count))
+        elif action == "scroll":
+            step = self.visible_rows() - self.BUFFER_ROWS if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(float(value)) * max(step, 1))
+
+    def on_mouse_wheel(self, event):
+        """
+        Scroll one row per wheel notch while the pointer is over the list.
+        """
+        if not str(event.widget).startswith(str(self.viewport)):
+            return
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.first_row - 1)
+        elif event.num == 5 or event.delta < 0:
+            self.scroll_to(self.first_row + 1)
 
     def mark_as_completed_action(self, delivery_id):
         """
@@ -248,16 +425,33 @@ class ViewDeliveriesFrame(ctk.CTkFrame):
 
     def show_history_action(self, delivery_id):
         """
-        Show a popup window with the change history for a delivery.
+        Show a popup window with the change history for a delivery,
+        newest first, one page at a time.
         """
-        history = self.controller.db.get_delivery_history(delivery_id)
         popup = ctk.CTkToplevel(self)
         popup.title("Change History")
         popup.geometry("350x250")
         popup.grab_set()
         popup.focus_force()
-        if not history:
-            ctk.CTkLabel(popup, text="No history found.").pack(pady=20)
-        else:
+        entries = ctk.CTkScrollableFrame(popup, fg_color="transparent")
+        entries.pack(fill="both", expand=True)
+        load_more_btn = ctk.CTkButton(popup, text="Load more")
+        cursor = None
+
+        def load_page():
+            nonlocal cursor
+            history, cursor = self.controller.get_delivery_history_page(
+                delivery_id, cursor, self.PAGE_SIZE
+            )
             for action, timestamp in history:
-                ctk.CTkLabel(popup, text=f"{timestamp}: {action}").pack(anchor="w", padx=10, pady=2)
\ No newline at end of file
+                label = ctk.CTkLabel(entries, text=f"{timestamp}: {action}")
+                label.pack(anchor="w", padx=10, pady=2)
+            if cursor is None:
+                load_more_btn.pack_forget()
+            else:
+                load_more_btn.pack(pady=5)
+            return len(history)
+
+        load_more_btn.configure(command=load_page)
+        if not load_page():
+            ctk.CTkLabel(entries, text="No history found.").pack(pady=20)
\ No newline at end of file